@@ -0,0 +1,232 @@
+"""
+Tento súbor obsahuje dávkové spracovanie staníc bez grafického rozhrania (neimportuje PyQt5).
+
+Pre zvolené stanice (predvolene všetky stanice v súbore) vypočíta v skupine procesov mesačné
+štatistiky, údaje a extrémy snehovej pokrývky, mesačné štatistiky CSP, tabuľky početnosti,
+historické extrémy a ročnú sumarizáciu teplôt. Tabuľky každej stanice sa zapíšu do vlastného
+priečinka a súhrn všetkých staníc do jedného súboru.
+
+Funkcie:
+- station_tables: Vypočíta všetky tabuľky pre jednu stanicu.
+- summary_row: Vytvorí riadok súhrnu pre jednu stanicu.
+- write_table: Zapíše tabuľku vo zvolenom formáte.
+- process_station: Spracuje jednu stanicu a zapíše jej tabuľky (beží v procese skupiny).
+- run_batch: Spracuje stanice v skupine procesov a vráti súhrn.
+
+Použitie:
+    python batch_report.py <file_name> [--stations ID ...] [--output DIR] [--format csv|parquet|json]
+                           [--workers N] [--season OBDOBIE] [--condition CM] [--trace [CIEĽ]]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+from processing_inputs import load_station, process_data, calculate_historical_extremes
+from station_index import station_index, list_stations
+from parse_cache import file_fingerprint
+from daily_dataset import DailyDataset, season_day_label
+from snow import SEASON_DAY_COLUMNS, calculate_snow_data, calculate_snow_extremes, create_snow_coverage_frequency_tables
+from temp import create_yearly_temperature_summary
+from tools import combine_statistics
+from instrumentation import add_trace_argument, enable
+
+FORMATS = ["csv", "parquet", "json"]
+SNOW_SEASONS = ["Zimné obdobie", "Zima"]
+# Tabuľky početnosti sa počítajú pre zimné obdobie, rovnako ako v okne aplikácie
+FREQUENCY_SEASON = "Zimné obdobie"
+# Stĺpce súhrnu, ktoré má každá stanica (aj stanica s chybou), sú na konci tabuľky
+STATUS_COLUMNS = ["Stav", "Cas [s]"]
+
+
+def _extremes_table(extremes):
+    # Slovník {názov: {"Hodnota": ..., ...}} ako tabuľka s názvami extrémov v indexe
+    table = pd.DataFrame.from_dict(extremes, orient="index")
+    table.index.name = "Extrem"
+    return table
+
+
+def station_tables(file_name, station_id, season=FREQUENCY_SEASON, condition=1, index=None):
+    """
+    Vypočíta tabuľky jednej stanice.
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+    station_id (int): ID stanice.
+    season (str): Obdobie pre údaje o snehovej pokrývke ("Zimné obdobie" alebo "Zima").
+    condition (int): Prah snehovej pokrývky v cm.
+    index (pd.DataFrame | None): Index staníc súboru (station_index), ak ho už volajúci načítal.
+
+    Returns:
+    dict[str, pd.DataFrame]: Tabuľky podľa názvu výstupného súboru.
+    """
+    # Dávka číta stanicu priamo z úsekov súboru a do cache nezapisuje
+    data = DailyDataset(load_station(file_name, station_id, use_cache=False, index=index))
+    monthly_stats = process_data(station_id, data)
+    snow_data = calculate_snow_data(data, monthly_stats, "CSP", condition, season)
+    snow_extremes = calculate_snow_extremes(snow_data, data)
+    temp_extremes, precip_extremes = calculate_historical_extremes(data)
+    frequency_count, frequency_max = create_snow_coverage_frequency_tables(monthly_stats, (FREQUENCY_SEASON,))[FREQUENCY_SEASON]
+    # Dni sezóny sa vo výstupe zapíšu ako dátumy dd.mm., rovnako ako v tabuľke aplikácie
+    snow_report = snow_data.assign(**{column: snow_data[column].map(season_day_label) for column in SEASON_DAY_COLUMNS})
+    return {
+        "monthly_stats": monthly_stats,
+        "snow_data": snow_report,
+        "snow_extremes": _extremes_table(snow_extremes or {}),
+        "historical_extremes": _extremes_table({**temp_extremes, **precip_extremes}),
+        "csp_statistics": combine_statistics(monthly_stats, "CSP_max"),
+        "csp_count_statistics": combine_statistics(monthly_stats, "CSP_count"),
+        "frequency_count": frequency_count,
+        "frequency_max": frequency_max,
+        "yearly_summary": create_yearly_temperature_summary(monthly_stats),
+    }
+
+
+def summary_row(station_id, tables):
+    """
+    Vytvorí riadok súhrnu stanice z jej tabuliek.
+
+    Args:
+    station_id (int): ID stanice.
+    tables (dict[str, pd.DataFrame]): Výsledok station_tables.
+
+    Returns:
+    dict: Hodnoty riadku súhrnu.
+    """
+    extremes = tables["historical_extremes"]["Hodnota"]
+    snow_data = tables["snow_data"]
+    years = tables["yearly_summary"]["Rok"]
+    return {
+        "IND": station_id,
+        "Prvy rok": years.min(),
+        "Posledny rok": years.max(),
+        "Tmax": extremes.get("Tmax"),
+        "Tmin": extremes.get("Tmin"),
+        "R max": extremes.get("R"),
+        "CSP max": extremes.get("CSP"),
+        "Pocet sezon": len(snow_data),
+        "Priemerny pocet dni so snehom": round(snow_data["Pocet dni so snehom"].mean(), 1),
+    }
+
+
+def write_table(table, path, file_format):
+    """
+    Zapíše tabuľku vo zvolenom formáte (prípona sa doplní podľa formátu).
+
+    Args:
+    table (pd.DataFrame): Tabuľka na zápis.
+    path (str): Cesta k súboru bez prípony.
+    file_format (str): "csv", "parquet" alebo "json".
+    """
+    if file_format == "csv":
+        table.to_csv(f"{path}.csv")
+    elif file_format == "parquet":
+        # Stĺpce s hodnotami rôznych typov (napr. dátum aj číslo v extrémoch) sa uložia ako text
+        mixed = [column for column in table.columns if table[column].dtype == object]
+        table.astype({column: "string" for column in mixed}).to_parquet(f"{path}.parquet")
+    else:
+        table.reset_index().to_json(f"{path}.json", orient="records", force_ascii=False, date_format="iso", indent=1)
+
+
+def process_station(file_name, station_id, output_dir, file_format, season, condition, index=None):
+    """
+    Spracuje jednu stanicu a zapíše jej tabuľky do priečinka output_dir/<IND>.
+
+    Chyba stanice neukončí dávku: výpisy funkcií spracovania sa zachytia a chyba sa vráti
+    v riadku súhrnu.
+
+    Returns:
+    dict: Riadok súhrnu so stavom a časom spracovania.
+    """
+    start = time.perf_counter()
+    output = io.StringIO()
+    try:
+        # Funkcie načítania vypisujú chyby do konzoly, pri dávke by sa výpisy staníc miešali
+        with contextlib.redirect_stdout(output):
+            tables = station_tables(file_name, station_id, season, condition, index)
+        station_dir = os.path.join(output_dir, str(station_id))
+        os.makedirs(station_dir, exist_ok=True)
+        for name, table in tables.items():
+            write_table(table, os.path.join(station_dir, name), file_format)
+        row = summary_row(station_id, tables)
+        row["Stav"] = "ok"
+    except (Exception, SystemExit) as error:
+        # Funkcie načítania chybu vypíšu a ukončia sa cez sys.exit, správa je posledný riadok výpisu
+        lines = output.getvalue().strip().splitlines()
+        row = {"IND": station_id, "Stav": lines[-1] if isinstance(error, SystemExit) and lines else f"Chyba: {error}"}
+    row["Cas [s]"] = round(time.perf_counter() - start, 3)
+    return row
+
+
+def run_batch(file_name, station_ids=None, output_dir="reports", file_format="csv", workers=None, season=FREQUENCY_SEASON, condition=1):
+    """
+    Spracuje stanice v skupine procesov a zapíše súhrn do output_dir/summary.
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+    station_ids (list[int] | None): Stanice na spracovanie (predvolene všetky stanice v súbore).
+    output_dir (str): Priečinok výstupov.
+    file_format (str): "csv", "parquet" alebo "json".
+    workers (int | None): Počet procesov (predvolene počet procesorov, 1 = bez skupiny procesov).
+    season (str): Obdobie pre údaje o snehovej pokrývke.
+    condition (int): Prah snehovej pokrývky v cm.
+
+    Returns:
+    tuple: (súhrn ako pd.DataFrame, čas behu v sekundách)
+    """
+    # Súbor sa hashuje a index staníc načíta iba raz pre celú dávku, procesy dostanú hotový index
+    index = station_index(file_name, fingerprint=file_fingerprint(file_name))
+    if station_ids is None:
+        station_ids = [int(station) for station in list_stations(file_name, index=index)["IND"]]
+    os.makedirs(output_dir, exist_ok=True)
+    arguments = (output_dir, file_format, season, condition, index)
+
+    start = time.perf_counter()
+    if workers == 1:
+        rows = [process_station(file_name, station_id, *arguments) for station_id in station_ids]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(process_station, file_name, station_id, *arguments) for station_id in station_ids]
+            rows = [future.result() for future in as_completed(futures)]
+    seconds = time.perf_counter() - start
+
+    # Stanice s chybou nemajú hodnoty, celé čísla ostanú celými číslami (Int64)
+    summary = pd.DataFrame(rows).convert_dtypes().sort_values("IND").set_index("IND")
+    summary = summary[[column for column in summary.columns if column not in STATUS_COLUMNS] + STATUS_COLUMNS]
+    write_table(summary, os.path.join(output_dir, "summary"), file_format)
+    return summary, seconds
+
+
+def _check_format(file_format):
+    if file_format == "parquet":
+        try:
+            pd.io.parquet.get_engine("auto")
+        except ImportError:
+            print("Chyba: Formát parquet vyžaduje balík pyarrow alebo fastparquet.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dávkové spracovanie staníc bez grafického rozhrania.")
+    parser.add_argument("file_name")
+    parser.add_argument("--stations", type=int, nargs="+", help="ID staníc (predvolene všetky stanice v súbore)")
+    parser.add_argument("--output", default="reports")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--season", choices=SNOW_SEASONS, default=FREQUENCY_SEASON)
+    parser.add_argument("--condition", type=int, default=1)
+    add_trace_argument(parser)
+    args = parser.parse_args()
+
+    if args.trace:
+        enable(args.trace)
+
+    _check_format(args.format)
+    summary, seconds = run_batch(args.file_name, args.stations, args.output, args.format, args.workers, args.season, args.condition)
+    print(summary.to_string())
+    failed = int((summary["Stav"] != "ok").sum())
+    print(f"Spracované stanice: {len(summary)} (chyby: {failed}) za {seconds:.2f} s, {len(summary) / seconds:.2f} staníc/s")
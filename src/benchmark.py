@@ -0,0 +1,307 @@
+"""
+Tento súbor obsahuje merania výkonu spracovania vstupných údajov.
+
+Funkcie:
+- legacy_read: Pôvodné načítanie súboru (python engine, dátum parsovaný až neskôr).
+- legacy_process_data: Pôvodný výpočet mesačných štatistík (apply a groupby s lambda funkciami).
+- benchmark_load: Porovná rýchlosť pôvodného a nového načítania v riadkoch za sekundu.
+- benchmark_process: Porovná rýchlosť pôvodného a nového process_data na syntetických údajoch.
+- benchmark_memory: Porovná pamäť denných údajov v rôznych reprezentáciách.
+- benchmark_stages: Zmeria čas a špičku pamäte jednotlivých krokov spracovania na syntetickom súbore.
+- compare_with_baseline: Nájde kroky, ktoré sú oproti uloženému základu pomalšie alebo náročnejšie na pamäť.
+
+Použitie:
+    python benchmark.py load <file_name> [--repeat N]
+    python benchmark.py process [--stations N] [--years M]
+    python benchmark.py memory <file_name> [--copies N]
+    python benchmark.py stages [--sizes 1x10 10x70 ...] [--baseline FILE] [--save] [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import pandas as pd
+from data_loader import read_observations, DATE_FORMAT
+from processing_inputs import load_data, process_data, repair_data
+from synthetic_data import generate_observations, write_observations
+from daily_dataset import DailyDataset, compact
+from snow import calculate_snow_data, calculate_snow_extremes
+from temp import create_yearly_temperature_summary
+from tools import combine_statistics
+
+STAGES = ["load_data", "process_data", "calculate_snow_data", "calculate_snow_extremes", "combine_statistics", "create_yearly_temperature_summary"]
+DEFAULT_SIZES = ["1x10", "10x30", "50x70"]
+DEFAULT_BASELINE = "benchmark_baseline.json"
+# Krok je regresiou, ak je jeho čas alebo špička pamäte o viac ako tento podiel horšia ako v základe
+DEFAULT_THRESHOLD = 0.25
+# Rozdiely menšie ako tieto hodnoty sú šum merania, nie regresia
+NOISE_FLOOR = {"Cas [s]": 0.005, "Pamat [MiB]": 0.5}
+
+
+def legacy_read(file_name):
+    data = pd.read_csv(
+        file_name,
+        delimiter="\t",
+        decimal=",",
+        na_values=[""],
+        engine="python"
+    )
+    # Pôvodne sa 'Datum' parsoval až v process_data a ďalších analýzach
+    data["Datum"] = pd.to_datetime(data["Datum"], format=DATE_FORMAT, errors="coerce")
+    return data
+
+
+def legacy_process_data(station_id, data):
+    station_data = data[data["IND"] == int(station_id)].copy()
+    station_data["Datum"] = pd.to_datetime(station_data["Datum"], format=DATE_FORMAT, errors='coerce')
+    station_data['Rok'] = station_data['Datum'].dt.year
+    station_data['Mesiac'] = station_data['Datum'].dt.month
+
+    station_data["Tmax"] = station_data["Tmax"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
+    station_data["Tmin"] = station_data["Tmin"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
+    station_data["Tavg"] = station_data["Tavg"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
+    station_data["R"] = station_data["R"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
+    station_data["CSP"] = station_data["CSP"].apply(lambda x: int(x) if pd.notnull(x) else x)
+
+    monthly_stats = station_data.groupby(['Rok', 'Mesiac']).agg({
+        "Tmax": ["min", "max", "mean", ("count35", lambda x: (x >= 35.0).sum()), ("count30", lambda x: (x >= 30.0).sum()), ("count25", lambda x: (x >= 25.0).sum()), ("count0", lambda x: (x <= 0.0).sum()), ("count_10", lambda x: (x <= -10.0).sum())],
+        "Tmin": ["min", "max", "mean", ("count25", lambda x: (x >= 25.0).sum()), ("count20", lambda x: (x >= 20.0).sum()), ("count0", lambda x: (x < 0.0).sum()), ("count_10", lambda x: (x <= -10.0).sum())],
+        "Tavg": ["min", "max", "mean"],
+        "R": ["max", "count", "sum"],
+        "CSP": ["max", "count", "sum"]
+    }).reset_index()
+
+    monthly_stats.columns = ['_'.join(col).strip() if type(col) is tuple else col for col in monthly_stats.columns]
+    monthly_stats['Rok'] = monthly_stats['Rok_']
+    monthly_stats["Tmax_mean"] = monthly_stats["Tmax_mean"].round(1)
+    monthly_stats["Tmin_mean"] = monthly_stats["Tmin_mean"].round(1)
+    monthly_stats["Tavg_mean"] = monthly_stats["Tavg_mean"].round(1)
+    monthly_stats["R_sum"] = monthly_stats["R_sum"].round(1)
+    monthly_stats["R_count"] = monthly_stats["R_count"].apply(lambda x: int(x) if pd.notnull(x) else x)
+    monthly_stats["CSP_max"] = monthly_stats["CSP_max"].apply(lambda x: int(x) if pd.notnull(x) else 0)
+    monthly_stats["CSP_count"] = monthly_stats["CSP_count"].apply(lambda x: int(x) if pd.notnull(x) else x)
+    monthly_stats["CSP_sum"] = monthly_stats["CSP_sum"].apply(lambda x: int(x) if pd.notnull(x) else x)
+    monthly_stats['Mesiac'] = monthly_stats['Mesiac_']
+
+    return monthly_stats
+
+
+def _best_time(function, file_name, repeat):
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(function(file_name))
+        best = min(best, time.perf_counter() - start)
+    return best, rows
+
+
+def benchmark_load(file_name, repeat=5):
+    """
+    Porovná rýchlosť pôvodného a nového načítania súboru.
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+    repeat (int): Počet opakovaní, do výsledku ide najlepší čas.
+
+    Returns:
+    dict: Čas a počet riadkov za sekundu pre každú metódu.
+    """
+    results = {}
+    for name, function in (("python engine", legacy_read), ("read_observations", read_observations)):
+        seconds, rows = _best_time(function, file_name, repeat)
+        results[name] = {"Riadky": rows, "Cas [s]": seconds, "Riadky/s": rows / seconds}
+    return results
+
+
+def benchmark_process(stations=100, years=70):
+    """
+    Porovná pôvodný a nový process_data pre všetky stanice syntetického súboru.
+
+    Args:
+    stations (int): Počet staníc.
+    years (int): Počet rokov.
+
+    Returns:
+    dict: Celkový čas a počet staníc za sekundu pre každú metódu.
+    """
+    data = DailyDataset(repair_data(generate_observations(stations, years))).frame
+    results = {}
+    outputs = {}
+    for name, function in (("pôvodný process_data", legacy_process_data), ("process_data", process_data)):
+        start = time.perf_counter()
+        outputs[name] = [function(station, data) for station in data["IND"].unique()]
+        seconds = time.perf_counter() - start
+        results[name] = {"Riadky": len(data), "Cas [s]": seconds, "Stanice/s": stations / seconds}
+
+    # Obe implementácie musia dať rovnaké výsledky
+    for legacy, current in zip(*outputs.values()):
+        pd.testing.assert_frame_equal(legacy, current, check_dtype=False)
+    return results
+
+
+def benchmark_memory(file_name, copies=100):
+    """
+    Porovná pamäť denných údajov súboru zväčšeného na viac staníc (kópie s iným IND).
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+    copies (int): Počet kópií súboru.
+
+    Returns:
+    dict: Počet bajtov a bajtov na riadok pre každú reprezentáciu.
+    """
+    legacy = pd.read_csv(file_name, delimiter="\t", decimal=",", na_values=[""], engine="python")
+    data = load_data(file_name, use_cache=False)
+    data = pd.concat([data.assign(IND=data["IND"] + copy) for copy in range(copies)], ignore_index=True)
+    dataset = DailyDataset(data)
+
+    sizes = {
+        "pôvodné načítanie": int(legacy.memory_usage(deep=True).sum()) * copies,
+        "load_data": int(data.memory_usage(deep=True).sum()),
+        "DailyDataset": dataset.memory_usage(),
+        "CompactDailyDataset": compact(dataset).memory_usage(),
+    }
+    return {name: {"Bajty": size, "Bajty/riadok": size / len(data)} for name, size in sizes.items()}
+
+
+def _measure(function, repeat):
+    # Najlepší čas z opakovaní; špička pamäte sa meria v samostatnom behu, lebo tracemalloc beh spomaľuje
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, {"Cas [s]": best, "Pamat [MiB]": peak / 2**20}
+
+
+def parse_size(size):
+    # "10x70" -> (10 staníc, 70 rokov)
+    stations, years = size.lower().split("x")
+    return int(stations), int(years)
+
+
+def benchmark_stages(stations, years, repeat=3, seed=0):
+    """
+    Zmeria čas a špičku pamäte krokov spracovania pre všetky stanice syntetického súboru.
+
+    Každý krok dostane výsledky predchádzajúceho kroku ako vstup, takže sa meria iba on sám.
+
+    Args:
+    stations (int): Počet staníc.
+    years (int): Počet rokov.
+    repeat (int): Počet opakovaní, do výsledku ide najlepší čas.
+    seed (int): Semienko generátora syntetických údajov.
+
+    Returns:
+    dict: Pre každý krok čas v sekundách a špička pamäte v MiB.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "observations.txt")
+        write_observations(generate_observations(stations, years, seed=seed), file_name)
+        data, results["load_data"] = _measure(lambda: load_data(file_name, use_cache=False), repeat)
+
+        datasets = {station: DailyDataset(group.reset_index(drop=True)) for station, group in data.groupby("IND")}
+        monthly_stats, results["process_data"] = _measure(
+            lambda: {station: process_data(station, dataset) for station, dataset in datasets.items()}, repeat)
+        snow_data, results["calculate_snow_data"] = _measure(
+            lambda: {station: calculate_snow_data(dataset, monthly_stats[station], "CSP", 1, "Zimné obdobie") for station, dataset in datasets.items()}, repeat)
+        _, results["calculate_snow_extremes"] = _measure(
+            lambda: [calculate_snow_extremes(snow_data[station], dataset) for station, dataset in datasets.items()], repeat)
+        _, results["combine_statistics"] = _measure(
+            lambda: [combine_statistics(stats, column) for stats in monthly_stats.values() for column in ("CSP_max", "CSP_count")], repeat)
+        _, results["create_yearly_temperature_summary"] = _measure(
+            lambda: [create_yearly_temperature_summary(stats) for stats in monthly_stats.values()], repeat)
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Porovná výsledky benchmark_stages s uloženým základom.
+
+    Args:
+    results (dict): {veľkosť: {krok: {"Cas [s]": ..., "Pamat [MiB]": ...}}}.
+    baseline (dict): Základ v rovnakom tvare.
+    threshold (float): Povolené zhoršenie (0.25 = o 25 %).
+
+    Returns:
+    list[str]: Popis každej regresie (prázdny zoznam, ak žiadna nie je).
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, metrics in stages.items():
+            reference = baseline.get(size, {}).get(stage)
+            if reference is None:
+                continue
+            for metric, value in metrics.items():
+                if value > reference[metric] * (1 + threshold) and value - reference[metric] > NOISE_FLOOR[metric]:
+                    regressions.append(f"{size} {stage}: {metric} {value:.4f} (základ {reference[metric]:.4f}, +{value / reference[metric] - 1:.0%})")
+    return regressions
+
+
+def _print_results(results, unit):
+    for name, result in results.items():
+        print(f"{name:>22}: {result['Riadky']} riadkov, {result['Cas [s]']:.4f} s, {result[unit]:,.1f} {unit.lower()}")
+    legacy, current = list(results.values())
+    print(f"Zrýchlenie: {legacy['Cas [s]'] / current['Cas [s]']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merania výkonu spracovania údajov.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load_parser = commands.add_parser("load", help="Rýchlosť načítania súboru.")
+    load_parser.add_argument("file_name")
+    load_parser.add_argument("--repeat", type=int, default=5)
+    process_parser = commands.add_parser("process", help="Rýchlosť process_data na syntetických údajoch.")
+    process_parser.add_argument("--stations", type=int, default=100)
+    process_parser.add_argument("--years", type=int, default=70)
+    memory_parser = commands.add_parser("memory", help="Pamäť denných údajov v rôznych reprezentáciách.")
+    memory_parser.add_argument("file_name")
+    memory_parser.add_argument("--copies", type=int, default=100)
+    stages_parser = commands.add_parser("stages", help="Čas a pamäť jednotlivých krokov spracovania pri rôznych veľkostiach.")
+    stages_parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="Veľkosti v tvare STANICExROKY")
+    stages_parser.add_argument("--repeat", type=int, default=3)
+    stages_parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    stages_parser.add_argument("--save", action="store_true", help="Uloží výsledky ako nový základ")
+    stages_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    if args.command == "load":
+        _print_results(benchmark_load(args.file_name, args.repeat), "Riadky/s")
+    elif args.command == "process":
+        _print_results(benchmark_process(args.stations, args.years), "Stanice/s")
+    elif args.command == "stages":
+        results = {}
+        for size in args.sizes:
+            results[size] = benchmark_stages(*parse_size(size), repeat=args.repeat)
+            for stage, metrics in results[size].items():
+                print(f"{size:>8} {stage:>34}: {metrics['Cas [s]']:.4f} s, {metrics['Pamat [MiB]']:,.1f} MiB")
+
+        if args.save:
+            with open(args.baseline, "w", encoding="utf-8") as file:
+                json.dump(results, file, indent=2)
+            print(f"Základ uložený do {args.baseline}")
+        elif os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as file:
+                regressions = compare_with_baseline(results, json.load(file), args.threshold)
+            for regression in regressions:
+                print(f"Regresia: {regression}")
+            if regressions:
+                sys.exit(1)
+            print(f"Bez regresií oproti základu {args.baseline} (prah {args.threshold:.0%})")
+        else:
+            print(f"Základ {args.baseline} neexistuje, uložte ho parametrom --save")
+    else:
+        results = benchmark_memory(args.file_name, args.copies)
+        compact_size = results["CompactDailyDataset"]["Bajty"]
+        for name, result in results.items():
+            print(f"{name:>22}: {result['Bajty'] / 2**20:,.1f} MiB, {result['Bajty/riadok']:.1f} B/riadok, {result['Bajty'] / compact_size:.1f}x kompaktnej")
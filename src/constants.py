@@ -1,12 +1,11 @@
-from PyQt5.QtGui import QColor
-
+# Farby sú zložky RGB, aby výpočtové moduly (aj dávkové spracovanie) nemuseli importovať PyQt5
 # Color shades
-EVEN_ROW_COLOR = QColor(204, 204, 255)
+EVEN_ROW_COLOR = (204, 204, 255)
 
 # Additional colors
-BLUE_COLOR = QColor(31, 73, 125)  # #1F497D
-GREEN_COLOR = QColor(118, 147, 60)  # #76933C
-RED_COLOR = QColor(192, 0, 0)  # #C00000
+BLUE_COLOR = (31, 73, 125)  # #1F497D
+GREEN_COLOR = (118, 147, 60)  # #76933C
+RED_COLOR = (192, 0, 0)  # #C00000
 
 WHOLE_YEAR = {
     1: "Január", 2: "Február", 3: "Marec",
@@ -0,0 +1,285 @@
+"""
+Tento súbor obsahuje kanonickú dennú tabuľku zdieľanú všetkými analýzami.
+
+Dátumy sa parsujú iba raz (pri načítaní) a zároveň sa predpočítajú kľúče, podľa ktorých
+analýzy zoskupujú údaje. Analýzy dostávajú iba pohľady na tabuľku, ktoré nemenia
+zdieľané údaje, takže nemusia dátumy znova parsovať ani tabuľku kopírovať.
+
+Triedy:
+- DailyDataset: Denné údaje stanice s predpočítanými stĺpcami Rok, Mesiac, Den v roku a Sezona.
+- CompactDailyDataset: Úsporná reprezentácia denných údajov v celých číslach (desatiny, číslo dňa).
+
+Funkcie:
+- season_start_year: Vypočíta rok začiatku zimnej sezóny pre každý deň.
+- season_labels: Vytvorí popisy sezón v tvare "1951/1952" z rokov ich začiatku.
+- season_day: Prevedie dátumy na celé číslo dňa sezóny (dni od 1. októbra).
+- season_day_label: Vráti popis dňa sezóny v tvare "dd.mm.".
+- daily_frame: Vráti pohľad na dennú tabuľku s predpočítanými kľúčmi pre ľubovoľný vstup.
+- compact: Prevedie denné údaje na CompactDailyDataset.
+"""
+
+import numpy as np
+import pandas as pd
+from data_loader import parse_dates
+
+# Sezóna začína v júli, takže október až máj aj december až február patria do jednej sezóny
+SEASON_START_MONTH = 7
+DERIVED_COLUMNS = ["Rok", "Mesiac", "Den v roku", "Sezona"]
+MEASURED_COLUMNS = ["Tmax", "Tmin", "Tavg", "R", "CSP"]
+# Atribúty uložené v kompaktnej reprezentácii ako desatiny (zdroj má jedno desatinné miesto)
+TENTHS_COLUMNS = ["Tmax", "Tmin", "Tavg", "R"]
+MISSING_DAY = np.iinfo(np.int32).min
+# Dni sezóny sa počítajú v referenčnej sezóne 1975/1976 (priestupný február), aby mal
+# rovnaký deň a mesiac v každej sezóne rovnaké číslo
+REFERENCE_SEASON_START = np.datetime64("1975-10-01")
+
+
+def season_start_year(year, month):
+    """
+    Vypočíta rok začiatku zimnej sezóny (napr. 1951 pre obdobie 1951/1952).
+
+    Args:
+    year (array-like): Roky.
+    month (array-like): Mesiace.
+
+    Returns:
+    np.ndarray: Rok začiatku sezóny pre každý prvok.
+    """
+    year = np.asarray(year)
+    return year - (np.asarray(month) < SEASON_START_MONTH).astype(year.dtype)
+
+
+def season_labels(start_years):
+    """
+    Vytvorí popisy sezón v tvare "1951/1952".
+
+    Args:
+    start_years (array-like): Roky začiatku sezón.
+
+    Returns:
+    pd.Index: Popisy sezón.
+    """
+    start_years = pd.Index(start_years).astype("int64")
+    return start_years.astype(str) + "/" + (start_years + 1).astype(str)
+
+
+def season_day(dates):
+    """
+    Prevedie dátumy na číslo dňa sezóny: počet dní od 1. októbra v referenčnej sezóne.
+
+    Deň a mesiac sa prenesú do sezóny 1975/1976, takže napr. 1.3. má v každom roku rovnaké
+    číslo a dni rôznych sezón sa dajú priamo porovnávať a priemerovať.
+
+    Args:
+    dates (array-like): Dátumy (NaT pre chýbajúce).
+
+    Returns:
+    pd.arrays.IntegerArray: Čísla dní sezóny (Int64, chýbajúce dátumy sú NA).
+    """
+    dates = pd.DatetimeIndex(dates)
+    missing = dates.isna()
+    month = dates.month.fillna(1).to_numpy(dtype="int64")
+    day = dates.day.fillna(1).to_numpy(dtype="int64")
+    year = np.where(month >= SEASON_START_MONTH, 1975, 1976)
+    reference = ((year - 1970) * 12 + month - 1).astype("datetime64[M]").astype("datetime64[D]") + (day - 1)
+    days = (reference - REFERENCE_SEASON_START).astype(np.int64)
+    return pd.arrays.IntegerArray(days, missing)
+
+
+def season_day_label(day):
+    """
+    Vráti popis dňa sezóny v tvare "dd.mm.".
+
+    Args:
+    day (int | None): Číslo dňa sezóny zo season_day.
+
+    Returns:
+    str | None: Deň a mesiac, alebo None pre chýbajúcu hodnotu.
+    """
+    if pd.isna(day):
+        return None
+    return pd.Timestamp(REFERENCE_SEASON_START + np.timedelta64(int(day), "D")).strftime("%d.%m.")
+
+
+def _select_rows(frame, station_id):
+    if station_id is None:
+        return frame
+    # Tabuľka jednej stanice sa nekopíruje
+    is_station = frame["IND"] == int(station_id)
+    return frame if is_station.all() else frame[is_station]
+
+
+class DailyDataset:
+    def __init__(self, data):
+        frame = data.copy(deep=False)
+        if not pd.api.types.is_datetime64_dtype(frame["Datum"]):
+            frame["Datum"] = parse_dates(frame["Datum"])
+
+        # Neplatné dátumy dostanú kľúč 0, aby kľúče ostali celočíselné
+        dates = pd.DatetimeIndex(frame["Datum"])
+        year = dates.year.fillna(0).to_numpy(dtype="int32")
+        month = dates.month.fillna(0).to_numpy(dtype="int32")
+        frame["Rok"] = year
+        frame["Mesiac"] = month
+        frame["Den v roku"] = dates.dayofyear.fillna(0).to_numpy(dtype="int32")
+        frame["Sezona"] = season_start_year(year, month)
+        self._frame = frame
+
+    @property
+    def frame(self):
+        # Plytká kópia: analýza môže pridávať stĺpce bez toho, aby menila zdieľanú tabuľku
+        return self._frame.copy(deep=False)
+
+    def view(self, columns=None, station_id=None):
+        frame = _select_rows(self._frame, station_id)
+        return frame.copy(deep=False) if columns is None else frame[columns]
+
+    def memory_usage(self):
+        return int(self._frame.memory_usage(deep=True).sum())
+
+    def append(self, data):
+        """
+        Vráti nový DailyDataset s pridanými riadkami. Dátumy sa parsujú a kľúče sa počítajú
+        iba pre nové riadky, pôvodný DailyDataset sa nemení (analýzy ho môžu stále používať).
+
+        Args:
+        data (pd.DataFrame | DailyDataset): Nové denné údaje v tvare z load_data.
+
+        Returns:
+        DailyDataset: Pôvodné a nové riadky.
+        """
+        added = (data if isinstance(data, DailyDataset) else DailyDataset(data))._frame
+        combined = DailyDataset.__new__(DailyDataset)
+        combined._frame = pd.concat([self._frame, added[self._frame.columns]], ignore_index=True)
+        return combined
+
+    def __len__(self):
+        return len(self._frame)
+
+
+class CompactDailyDataset:
+    """
+    Denné údaje v celých číslach: teploty a zrážky v desatinách (int16, pri veľkých
+    hodnotách int32), CSP v cm (int16), dátum ako číslo dňa od 1.1.1970 (int32) a IND
+    ako kód kategórie. Chýbajúce hodnoty sú uložené ako najmenšia hodnota typu.
+    Odvodené stĺpce (Rok, Mesiac, ...) sa počítajú z čísla dňa až pri čítaní.
+    """
+
+    def __init__(self, data):
+        data = data.frame if isinstance(data, DailyDataset) else data
+        dates = data["Datum"] if pd.api.types.is_datetime64_dtype(data["Datum"]) else parse_dates(data["Datum"])
+
+        stations = pd.Categorical(data["IND"])
+        self._station_ids = stations.categories.to_numpy()
+        self._station_codes = stations.codes
+        days = dates.to_numpy().astype("datetime64[D]")
+        self._days = np.where(np.isnat(days), MISSING_DAY, days.astype(np.int64)).astype(np.int32)
+
+        self._values = {}
+        for column in MEASURED_COLUMNS:
+            values = data[column].to_numpy(dtype="float64")
+            scale = 10 if column in TENTHS_COLUMNS else 1
+            scaled = np.round(values * scale)
+            largest = np.nanmax(np.abs(scaled)) if (~np.isnan(scaled)).any() else 0
+            dtype = np.int16 if largest < np.iinfo(np.int16).max else np.int32
+            encoded = np.where(np.isnan(scaled), np.iinfo(dtype).min, scaled).astype(dtype)
+            self._values[column] = encoded
+            if not np.array_equal(self._decode(column, encoded), values, equal_nan=True):
+                raise ValueError(f"Stĺpec '{column}' sa nedá bezstratovo uložiť v desatinách.")
+
+    def _decode(self, column, encoded):
+        scale = 10 if column in TENTHS_COLUMNS else 1
+        decoded = encoded.astype("float64")
+        decoded[encoded == np.iinfo(encoded.dtype).min] = np.nan
+        return decoded / scale if scale != 1 else decoded
+
+    def _rows(self, station_id):
+        if station_id is None:
+            return slice(None)
+        codes = np.flatnonzero(self._station_ids == int(station_id))
+        return self._station_codes == (codes[0] if len(codes) else -2)
+
+    def column(self, name, station_id=None):
+        """
+        Vráti jeden stĺpec v rovnakom tvare ako v DailyDataset (desatiny ako float64, dátum ako datetime64).
+
+        Args:
+        name (str): Názov stĺpca (IND, Datum, merané atribúty alebo odvodené kľúče).
+        station_id (str | int | None): Ak je zadané, vrátia sa iba riadky tejto stanice.
+
+        Returns:
+        np.ndarray: Dekódované hodnoty stĺpca.
+        """
+        rows = self._rows(station_id)
+        if name == "IND":
+            return self._station_ids[self._station_codes[rows]]
+        if name in self._values:
+            return self._decode(name, self._values[name][rows])
+
+        days = self._days[rows]
+        missing = days == MISSING_DAY
+        dates = np.where(missing, 0, days).astype("datetime64[D]")
+        if name == "Datum":
+            return np.where(missing, np.datetime64("NaT"), dates).astype("datetime64[us]")
+        year = dates.astype("datetime64[Y]").astype(np.int32) + 1970
+        month = dates.astype("datetime64[M]").astype(np.int32) % 12 + 1
+        if name == "Rok":
+            keys = year
+        elif name == "Mesiac":
+            keys = month
+        elif name == "Den v roku":
+            keys = (dates - dates.astype("datetime64[Y]")).astype(np.int32) + 1
+        elif name == "Sezona":
+            keys = season_start_year(year, month)
+        else:
+            raise KeyError(name)
+        return np.where(missing, 0, keys).astype(np.int32)
+
+    def view(self, columns=None, station_id=None):
+        # Dekódujú sa iba požadované stĺpce a riadky, kompaktné pole ostáva nezmenené
+        columns = columns or ["IND", "Datum", *MEASURED_COLUMNS, *DERIVED_COLUMNS]
+        return pd.DataFrame({column: self.column(column, station_id) for column in columns})
+
+    @property
+    def frame(self):
+        return self.view()
+
+    def memory_usage(self):
+        arrays = [self._station_ids, self._station_codes, self._days, *self._values.values()]
+        return int(sum(array.nbytes for array in arrays))
+
+    def __len__(self):
+        return len(self._days)
+
+
+def compact(data):
+    """
+    Prevedie denné údaje na úspornú celočíselnú reprezentáciu.
+
+    Args:
+    data (DailyDataset | pd.DataFrame): Denné údaje s jedným desatinným miestom.
+
+    Returns:
+    CompactDailyDataset: Kompaktné denné údaje.
+    """
+    return data if isinstance(data, CompactDailyDataset) else CompactDailyDataset(data)
+
+
+def daily_frame(data, columns=None, station_id=None):
+    """
+    Vráti pohľad na dennú tabuľku s predpočítanými kľúčmi.
+
+    Args:
+    data (DailyDataset | CompactDailyDataset | pd.DataFrame): Denné údaje.
+    columns (list[str] | None): Stĺpce, ktoré analýza potrebuje (predvolene všetky).
+    station_id (str | int | None): Ak je zadané, vrátia sa iba riadky tejto stanice.
+
+    Returns:
+    pd.DataFrame: Denné údaje so stĺpcami Datum (datetime), Rok, Mesiac, Den v roku a Sezona.
+    """
+    if isinstance(data, (DailyDataset, CompactDailyDataset)):
+        return data.view(columns, station_id)
+    if not (all(column in data.columns for column in DERIVED_COLUMNS) and pd.api.types.is_datetime64_dtype(data["Datum"])):
+        data = DailyDataset(data).frame
+    data = _select_rows(data, station_id)
+    return data if columns is None else data[columns]
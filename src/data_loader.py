@@ -0,0 +1,133 @@
+"""
+Tento súbor obsahuje rýchle načítanie vstupných súborov s dennými pozorovaniami.
+
+Funkcie:
+- parse_dates: Rýchlo prevedie reťazce vo formáte d.m.rrrr (bez úvodných núl) na dátumy.
+- read_observations: Načíta tabulátorom oddelený súbor kompilovaným parserom s deklarovanými typmi stĺpcov.
+- read_observation_chunks: Postupne načítava súbor po častiach s ohraničeným počtom riadkov.
+"""
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT = "%d.%m.%Y"
+DATE_WIDTH = 12
+CHUNK_SIZE = 500_000
+
+# Typy stĺpcov vstupného súboru (Datum sa parsuje zvlášť, práve raz)
+COLUMN_DTYPES = {
+    "IND": "int32",
+    "Datum": "str",
+    "Tmax": "float64",
+    "Tmin": "float64",
+    "Tavg": "float64",
+    "R": "float64",
+    "CSP": "float64",
+}
+
+
+def _csv_options(names):
+    return dict(
+        sep="\t",
+        decimal=",",
+        na_values=[""],
+        engine="c",
+        dtype=COLUMN_DTYPES,
+        header=0 if names is None else None,
+        names=names,
+    )
+
+
+def parse_dates(values):
+    """
+    Prevedie reťazce vo formáte d.m.rrrr (deň a mesiac s úvodnou nulou aj bez nej) na dátumy.
+
+    Reťazce sa rozoberú naraz ako matica bajtov, takže sa nevolá strptime pre každý riadok.
+    Neplatné dátumy sa (ako pri errors="coerce") nahradia hodnotou NaT.
+
+    Args:
+    values (pd.Series | array-like): Reťazce s dátumami.
+
+    Returns:
+    pd.Series: Dátumy typu datetime64.
+    """
+    strings = pd.Series(values)
+    try:
+        raw = np.asarray(strings.to_numpy(dtype=object), dtype=f"S{DATE_WIDTH}")
+    except UnicodeEncodeError:
+        return pd.to_datetime(strings, format=DATE_FORMAT, errors="coerce")
+
+    count = len(raw)
+    rows = np.arange(count)
+    columns = np.arange(DATE_WIDTH)
+    chars = raw.view(np.uint8).reshape(count, DATE_WIDTH).astype(np.int16)
+    digits = chars - ord("0")
+    is_dot = chars == ord(".")
+    length = (chars != 0).sum(axis=1)
+
+    # Pozície bodiek a šírky polí deň, mesiac a rok
+    first = is_dot.argmax(axis=1)
+    second = (is_dot & (columns > first[:, None])).argmax(axis=1)
+    month_width = second - first - 1
+    valid = (
+        (is_dot.sum(axis=1) == 2)
+        & ((first == 1) | (first == 2))
+        & ((month_width == 1) | (month_width == 2))
+        & (length - second - 1 == 4)
+        & (((digits >= 0) & (digits <= 9)) | is_dot | (columns >= length[:, None])).all(axis=1)
+    )
+
+    def digit(position):
+        return digits[rows, np.minimum(position, DATE_WIDTH - 1)].astype(np.int64)
+
+    day = np.where(first == 2, digit(0) * 10 + digit(1), digit(0))
+    month = np.where(month_width == 2, digit(first + 1) * 10 + digit(first + 2), digit(first + 1))
+    year = digit(second + 1) * 1000 + digit(second + 2) * 100 + digit(second + 3) * 10 + digit(second + 4)
+    valid &= (month >= 1) & (month <= 12) & (day >= 1)
+
+    months = np.where(valid, (year - 1970) * 12 + month - 1, 0).astype("datetime64[M]")
+    dates = months.astype("datetime64[D]") + np.where(valid, day - 1, 0)
+    # Deň mimo rozsahu mesiaca (napr. 31.4.) by sa preniesol do ďalšieho mesiaca
+    valid &= dates.astype("datetime64[M]") == months
+
+    return pd.Series(
+        np.where(valid, dates, np.datetime64("NaT")).astype("datetime64[us]"),
+        index=strings.index,
+        name=strings.name,
+    )
+
+
+def _parse_dates(data):
+    data["Datum"] = parse_dates(data["Datum"])
+    return data
+
+
+def read_observations(source, names=None):
+    """
+    Načíta denné pozorovania kompilovaným (C) parserom pandas.
+
+    Args:
+    source (str | file-like): Cesta k súboru alebo otvorený súbor.
+    names (list[str] | None): Názvy stĺpcov, ak zdroj neobsahuje hlavičku.
+
+    Returns:
+    pd.DataFrame: Tabuľka s typovanými stĺpcami a 'Datum' ako datetime.
+    """
+    return _parse_dates(pd.read_csv(source, **_csv_options(names)))
+
+
+def read_observation_chunks(source, chunksize=CHUNK_SIZE, names=None):
+    """
+    Postupne načítava denné pozorovania po častiach.
+
+    Args:
+    source (str | file-like): Cesta k súboru alebo otvorený súbor.
+    chunksize (int): Najväčší počet riadkov jednej časti.
+    names (list[str] | None): Názvy stĺpcov, ak zdroj neobsahuje hlavičku.
+
+    Yields:
+    pd.DataFrame: Časť súboru v rovnakom tvare ako z read_observations.
+    """
+    with pd.read_csv(source, chunksize=chunksize, **_csv_options(names)) as reader:
+        for chunk in reader:
+            yield _parse_dates(chunk)
@@ -1,5 +1,6 @@
 import sys
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLineEdit
+from dataframe_model import DataFrameTable
 
 class DataViewer(QWidget):
     def __init__(self, monthly_stats):
@@ -13,16 +14,20 @@ class DataViewer(QWidget):
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
-        # Vytvorenie tabuľky
-        self.tableWidget = QTableWidget()
-        self.tableWidget.setRowCount(len(self.monthly_stats))
-        self.tableWidget.setColumnCount(len(self.monthly_stats.columns))
-        self.tableWidget.setHorizontalHeaderLabels(self.monthly_stats.columns)
+        # Filtrovanie riadkov podľa textu v ľubovoľnom stĺpci
+        self.filterLineEdit = QLineEdit()
+        self.filterLineEdit.setPlaceholderText("Filter (napr. rok alebo hodnota)")
+        self.layout.addWidget(self.filterLineEdit)
 
-        # Iterácia cez riadky monthly_stats (Pandas DataFrame)
-        for i, row in self.monthly_stats.iterrows():
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                self.tableWidget.setItem(i, j, item)
+        # Tabuľka číta hodnoty priamo z monthly_stats, formátujú sa iba viditeľné bunky
+        self.tableWidget = DataFrameTable(self.monthly_stats)
+        self.tableWidget.setSortingEnabled(True)
+        self.tableWidget.fit_columns()
+        self.filterLineEdit.textChanged.connect(self.tableWidget.set_filter_text)
 
         self.layout.addWidget(self.tableWidget)
+
+    def update_data(self, monthly_stats):
+        # Tabuľka iba vymení údaje modelu, filter aj triedenie ostanú zachované
+        self.monthly_stats = monthly_stats
+        self.tableWidget.set_frame(monthly_stats)
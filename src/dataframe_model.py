@@ -0,0 +1,226 @@
+"""
+Tento súbor obsahuje tabuľkový model Qt, ktorý číta hodnoty priamo z polí NumPy tabuľky pandas.
+
+Bunky sa nevytvárajú vopred ako QTableWidgetItem: hodnota sa naformátuje až vtedy, keď
+ju tabuľka zobrazuje, takže sa formátujú iba viditeľné bunky. Triedenie prebieha naraz
+nad celým stĺpcom (argsort) a filtrovanie riadkov zabezpečuje proxy model.
+
+Triedy:
+- DataFrameModel: QAbstractTableModel nad stĺpcami pandas.DataFrame.
+- DataFrameProxyModel: Proxy model s filtrovaním podľa textu a triedením v zdrojovom modeli.
+- DataFrameTable: QTableView s DataFrameModel a DataFrameProxyModel.
+
+Funkcie:
+- format_value: Predvolené zobrazenie hodnoty bunky.
+- sort_key: Typovaný kľúč triedenia stĺpca.
+"""
+
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtGui import QFontMetrics
+from PyQt5.QtWidgets import QTableView
+
+MISSING_TEXT = "-"
+# Rola, v ktorej model vracia typovanú hodnotu bunky (kľúč triedenia) namiesto textu
+SORT_ROLE = Qt.UserRole
+# Počet riadkov, podľa ktorých sa odhaduje šírka stĺpca, a okraj textu v bunke
+SAMPLE_ROWS = 50
+COLUMN_PADDING = 24
+
+
+def format_value(value):
+    """
+    Vráti text bunky: chýbajúca hodnota ako "-", dátum ako dd.mm.rrrr, inak str(value).
+
+    Args:
+    value: Hodnota z poľa stĺpca.
+
+    Returns:
+    str: Text bunky.
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return MISSING_TEXT
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).strftime("%d.%m.%Y")
+    return str(value)
+
+
+def sort_key(values):
+    """
+    Pripraví typovaný kľúč triedenia stĺpca (čísla, dátumy, dni sezóny ostávajú svojho typu).
+    Stĺpec s hodnotami rôznych typov sa triedi podľa zobrazeného textu.
+
+    Args:
+    values (np.ndarray): Pole stĺpca.
+
+    Returns:
+    pd.Series: Kľúč triedenia s rovnakým poradím ako values.
+    """
+    keys = pd.Series(values).infer_objects()
+    if keys.dtype == object:
+        # Typ sa zistí jedným prechodom stĺpca bez skúšobného triedenia
+        inferred = pd.api.types.infer_dtype(keys, skipna=True)
+        if inferred.startswith("mixed") and inferred != "mixed-integer-float":
+            keys = keys.map(format_value)
+    return keys
+
+
+def _sort_order(keys, ascending):
+    order = keys.sort_values(ascending=ascending, kind="stable", na_position="last").index
+    return np.asarray(order)
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    Model nad tabuľkou pandas. Každý stĺpec sa uloží ako jedno pole NumPy a bunka sa naformátuje
+    až pri požiadavke na zobrazenie. Formátovače sa zadávajú pre stĺpce modelu (ak je index
+    zobrazený ako stĺpec, má číslo 0). Vzhľad buniek určuje delegát tabuľky, nie model.
+    """
+
+    def __init__(self, frame=None, headers=None, index_column=None, formatters=None, index_in_header=False, parent=None):
+        super().__init__(parent)
+        self._columns = []
+        self._headers = []
+        self._row_labels = pd.RangeIndex(0)
+        self._order = None
+        self._sort_keys = {}
+        self.formatters = dict(formatters or {})
+        self.index_in_header = index_in_header
+        if frame is not None:
+            self.set_frame(frame, headers, index_column)
+
+    def set_frame(self, frame, headers=None, index_column=None):
+        """
+        Nahradí zobrazenú tabuľku.
+
+        Args:
+        frame (pd.DataFrame): Tabuľka na zobrazenie.
+        headers (list[str] | None): Popisy stĺpcov (predvolene názvy stĺpcov).
+        index_column (str | None): Ak je zadané, index tabuľky sa zobrazí ako prvý stĺpec s týmto popisom.
+        """
+        self.beginResetModel()
+        columns = [frame.iloc[:, position].to_numpy() for position in range(frame.shape[1])]
+        names = [str(name) for name in frame.columns]
+        if index_column is not None:
+            columns.insert(0, frame.index.to_numpy())
+            names.insert(0, index_column)
+        self._columns = columns
+        self._headers = list(headers) if headers is not None else names
+        self._row_labels = frame.index
+        self._order = None
+        self._sort_keys = {}
+        self.endResetModel()
+
+    def set_header(self, column, text):
+        self._headers[column] = text
+        self.headerDataChanged.emit(Qt.Horizontal, column, column)
+
+    def sort_keys(self, column):
+        # Kľúč sa pripraví pri prvom triedení stĺpca a platí až do výmeny tabuľky
+        if column not in self._sort_keys:
+            self._sort_keys[column] = sort_key(self._columns[column])
+        return self._sort_keys[column]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._row_labels)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data_row(self, position):
+        # Riadok tabuľky pandas zobrazený na danej pozícii (po zoradení)
+        return position if self._order is None else self._order[position]
+
+    def value(self, position, column):
+        return self._columns[column][self.data_row(position)]
+
+    def text(self, position, column):
+        return self.formatters.get(column, format_value)(self.value(position, column))
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.text(index.row(), index.column())
+        if role == SORT_ROLE:
+            return self.sort_keys(index.column()).iloc[self.data_row(index.row())]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        if self.index_in_header:
+            return str(self._row_labels[self.data_row(section)])
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Celý stĺpec sa zoradí naraz podľa typovaného kľúča, bez porovnávania dvojíc buniek v Pythone
+        self.layoutAboutToBeChanged.emit()
+        self._order = _sort_order(self.sort_keys(column), order == Qt.AscendingOrder)
+        self.layoutChanged.emit()
+
+
+class DataFrameProxyModel(QSortFilterProxyModel):
+    """
+    Filtruje riadky podľa textu v ľubovoľnom stĺpci. Triedenie sa presmeruje do zdrojového
+    modelu, ktorý zoradí celý stĺpec naraz.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterKeyColumn(-1)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setSortRole(SORT_ROLE)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column >= 0:
+            self.sourceModel().sort(column, order)
+
+    def set_filter_text(self, text):
+        self.setFilterFixedString(text)
+
+
+class DataFrameTable(QTableView):
+    def __init__(self, frame=None, headers=None, index_column=None, formatters=None, index_in_header=False, parent=None):
+        super().__init__(parent)
+        self.source_model = DataFrameModel(frame, headers, index_column, formatters, index_in_header, self)
+        self.proxy_model = DataFrameProxyModel(self)
+        self.proxy_model.setSourceModel(self.source_model)
+        self.setModel(self.proxy_model)
+        # Pred prvým kliknutím na hlavičku ostáva poradie riadkov také, ako ho vrátila analýza
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+
+    def set_frame(self, frame, headers=None, index_column=None):
+        self.source_model.set_frame(frame, headers, index_column)
+        # Po výmene údajov sa zachová zvolené triedenie
+        column = self.horizontalHeader().sortIndicatorSection()
+        if self.isSortingEnabled() and 0 <= column < self.source_model.columnCount():
+            self.source_model.sort(column, self.horizontalHeader().sortIndicatorOrder())
+
+    def set_filter_text(self, text):
+        self.proxy_model.set_filter_text(text)
+
+    def fit_columns(self, sample_size=SAMPLE_ROWS, padding=COLUMN_PADDING):
+        """
+        Nastaví šírky stĺpcov podľa hlavičky a vzorky riadkov namiesto merania každej bunky.
+
+        Args:
+        sample_size (int): Počet rovnomerne vybraných riadkov, ktorých text sa zmeria.
+        padding (int): Okraj pridaný k najširšiemu textu v pixeloch.
+        """
+        model = self.source_model
+        header = self.horizontalHeader()
+        header_metrics = QFontMetrics(header.font())
+        rows = np.unique(np.linspace(0, model.rowCount() - 1, min(model.rowCount(), sample_size)).astype(int))
+        # Delegát s vlastnými písmami (TableStyleDelegate) vráti písmo stĺpca, inak sa použije písmo tabuľky
+        column_font = getattr(self.itemDelegate(), "column_font", lambda column: self.font())
+        for column in range(model.columnCount()):
+            metrics = QFontMetrics(column_font(column))
+            header_text = str(model.headerData(column, Qt.Horizontal) or "")
+            width = max(header_metrics.horizontalAdvance(line) for line in header_text.split("\n"))
+            for position in rows:
+                width = max(width, metrics.horizontalAdvance(model.text(position, column)))
+            header.resizeSection(column, width + padding)
@@ -1,6 +1,20 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+import pandas as pd
+from dataframe_model import DataFrameTable
 from table_formatter import TableFormatter  # Import TableFormatter
 
+
+def extremes_frame(extremes, attributes):
+    # Hodnota a dátum extrému pre každý atribút (riadky tabuľky)
+    return pd.DataFrame(
+        {
+            "Hodnota": [extremes[attribute]["Hodnota"] for attribute in attributes],
+            "Dátum": [extremes[attribute]["Datum"] for attribute in attributes],
+        },
+        index=attributes,
+    )
+
+
 class ExtremesVisualizationWindow(QWidget):
     def __init__(self, temp_extremes, precip_extremes, yearly_summary):
         super().__init__()
@@ -10,39 +24,23 @@ class ExtremesVisualizationWindow(QWidget):
         self.setLayout(self.layout)
 
         # Tabuľka pre teplotné extrémy
-        temp_table = QTableWidget()
-        temp_table.setRowCount(2)
-        temp_table.setColumnCount(2)
-        temp_table.setHorizontalHeaderLabels(["Hodnota", "Dátum"])
-        temp_table.setVerticalHeaderLabels(["Tmax", "Tmin"])
-        temp_table.setItem(0, 0, QTableWidgetItem(str(temp_extremes["Tmax"]["Hodnota"])))
-        temp_table.setItem(0, 1, QTableWidgetItem(temp_extremes["Tmax"]["Datum"]))
-        temp_table.setItem(1, 0, QTableWidgetItem(str(temp_extremes["Tmin"]["Hodnota"])))
-        temp_table.setItem(1, 1, QTableWidgetItem(temp_extremes["Tmin"]["Datum"]))
-        self.layout.addWidget(temp_table)
+        self.temp_table = DataFrameTable(extremes_frame(temp_extremes, ["Tmax", "Tmin"]), index_in_header=True)
+        self.layout.addWidget(self.temp_table)
 
         # Tabuľka pre zrážkové a snehové extrémy
-        precip_table = QTableWidget()
-        precip_table.setRowCount(2)
-        precip_table.setColumnCount(2)
-        precip_table.setHorizontalHeaderLabels(["Hodnota", "Dátum"])
-        precip_table.setVerticalHeaderLabels(["R", "CSP"])
-        precip_table.setItem(0, 0, QTableWidgetItem(str(precip_extremes["R"]["Hodnota"])))
-        precip_table.setItem(0, 1, QTableWidgetItem(precip_extremes["R"]["Datum"]))
-        precip_table.setItem(1, 0, QTableWidgetItem(str(precip_extremes["CSP"]["Hodnota"])))
-        precip_table.setItem(1, 1, QTableWidgetItem(precip_extremes["CSP"]["Datum"]))
-        self.layout.addWidget(precip_table)
+        self.precip_table = DataFrameTable(extremes_frame(precip_extremes, ["R", "CSP"]), index_in_header=True)
+        self.layout.addWidget(self.precip_table)
 
         # Tabuľka pre ročnú teplotnú sumarizáciu
-        yearly_table = QTableWidget()
-        yearly_table.setRowCount(len(yearly_summary))
-        yearly_table.setColumnCount(len(yearly_summary.columns))
-        yearly_table.setHorizontalHeaderLabels(yearly_summary.columns)
-        table_formatter = TableFormatter(yearly_table)
-        for i, row in yearly_summary.iterrows():
-            for j, col in enumerate(yearly_summary.columns):
-                item_value = int(row[col]) if col == "Rok" else row[col]
-                item = QTableWidgetItem(str(item_value))
-                table_formatter.format_item(item, is_first_column=(j == 0), is_even_row=(i % 2 == 0))
-                yearly_table.setItem(i, j, item)
-        self.layout.addWidget(yearly_table)
+        self.yearly_table = DataFrameTable(yearly_summary, formatters={0: lambda year: str(int(year))})
+        table_formatter = TableFormatter(self.yearly_table)
+        table_formatter.format_items(is_striped=True)
+        self.yearly_table.fit_columns()
+        self.layout.addWidget(self.yearly_table)
+
+    def update_data(self, temp_extremes, precip_extremes, yearly_summary):
+        # Tabuľky iba vymenia údaje modelu, štýly sa nastavili v konštruktore
+        self.temp_table.set_frame(extremes_frame(temp_extremes, ["Tmax", "Tmin"]))
+        self.precip_table.set_frame(extremes_frame(precip_extremes, ["R", "CSP"]))
+        self.yearly_table.set_frame(yearly_summary)
+        self.yearly_table.fit_columns()
@@ -0,0 +1,120 @@
+"""
+Tento súbor obsahuje sledovanie vstupného súboru, do ktorého sa priebežne pripisujú nové riadky.
+
+FileFollower si pamätá, po ktorý bajt už súbor načítal, a kontrolné súčty hlavičky
+a posledných načítaných bajtov. Pri obnovení sa načítajú iba pripísané riadky. Ak sa súbor
+medzitým zmenšil alebo sa zmenila hlavička či už načítaná časť (súbor bol prepísaný),
+načíta sa celý znova.
+
+Neukončený posledný riadok sa načíta iba vtedy, ak má všetky stĺpce a veľkosť súboru sa od
+predchádzajúceho načítania nezmenila (vstupné súbory často nekončia znakom nového riadku,
+no riadok s poslednou hodnotou v zápise má tiež všetky stĺpce). Dovtedy ostáva pozícia na jeho
+začiatku a riadok sa pri ďalšom obnovení prečíta celý. Ak po už načítanom neukončenom riadku
+nové bajty nezačínajú novým riadkom, riadok sa ešte dopisoval a súbor sa načíta celý znova.
+
+Triedy:
+- FileFollower: Postupné načítanie súboru, ktorý iba rastie.
+"""
+
+import hashlib
+import io
+import os
+from data_loader import read_observations
+from processing_inputs import repair_data
+
+# Počet posledných načítaných bajtov, podľa ktorých sa zisťuje prepísanie súboru
+TAIL_BYTES = 4096
+
+
+def _checksum(content):
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _complete_part(content, fields, stable):
+    # Časť bajtov po posledný úplný riadok; neukončený riadok iba vtedy, ak sa súbor nemení
+    end = content.rfind(b"\n") + 1
+    last = content[end:].rstrip(b"\r")
+    if stable and last and last.count(b"\t") == fields - 1:
+        end = len(content)
+    return content[:end]
+
+
+class FileFollower:
+    def __init__(self, file_name, station_id=None):
+        """
+        Args:
+        file_name (str): Cesta k sledovanému súboru.
+        station_id (int | None): Vracajú sa iba riadky tejto stanice (None = všetky stanice).
+        """
+        self.file_name = file_name
+        self.station_id = None if station_id is None else int(station_id)
+        self.header = None
+        self.offset = 0
+        self.open_line = False
+        self.checksums = None
+        # Veľkosť súboru pri predchádzajúcom načítaní (podľa nej sa prijme neukončený riadok)
+        self.size = None
+
+    def _read_checksums(self, file, end):
+        # Kontrolné súčty hlavičky a posledných TAIL_BYTES bajtov načítanej časti
+        file.seek(0)
+        header = file.readline()
+        start = max(end - TAIL_BYTES, 0)
+        file.seek(start)
+        return _checksum(header), _checksum(file.read(end - start))
+
+    def _select(self, rows):
+        rows = repair_data(rows)
+        if self.station_id is not None:
+            rows = rows[rows["IND"] == self.station_id].reset_index(drop=True)
+        return rows
+
+    def _advance(self, file, end, complete):
+        self.offset = end
+        self.open_line = not complete.endswith(b"\n")
+        self.checksums = self._read_checksums(file, end)
+
+    def load(self):
+        """
+        Načíta celý súbor a zapamätá si, kde načítanie skončilo. Neukončený posledný riadok
+        sa pri prvom načítaní vynechá a načíta sa pri obnovení, ak sa súbor medzitým nezmenil.
+
+        Returns:
+        pd.DataFrame: Opravené údaje (repair_data) v tvare z load_data.
+        """
+        with open(self.file_name, "rb") as file:
+            content = file.read()
+            stable = len(content) == self.size
+            self.size = len(content)
+            self.header = content.split(b"\n", 1)[0].decode("utf-8-sig").rstrip("\r").split("\t")
+            complete = _complete_part(content, len(self.header), stable)
+            self._advance(file, len(complete), complete)
+        return self._select(read_observations(io.BytesIO(complete)))
+
+    def refresh(self):
+        """
+        Načíta riadky pripísané od posledného načítania.
+
+        Returns:
+        tuple: (pd.DataFrame nových riadkov, alebo celý súbor pri novom načítaní,
+        bool či sa súbor načítal celý znova).
+        """
+        if self.checksums is None or os.path.getsize(self.file_name) < self.offset:
+            return self.load(), True
+
+        with open(self.file_name, "rb") as file:
+            if self._read_checksums(file, self.offset) != self.checksums:
+                return self.load(), True
+            file.seek(self.offset)
+            appended = file.read()
+            size = self.offset + len(appended)
+            stable = size == self.size
+            self.size = size
+            if self.open_line and appended and not appended.startswith((b"\n", b"\r\n")):
+                # Posledný načítaný riadok sa ešte dopisoval
+                return self.load(), True
+            complete = _complete_part(appended, len(self.header), stable)
+            if complete:
+                self._advance(file, self.offset + len(complete), complete)
+
+        return self._select(read_observations(io.BytesIO(complete), names=self.header)), False
@@ -0,0 +1,150 @@
+"""
+Tento súbor obsahuje priebežnú aktualizáciu výsledkov stanice pri pridaní nových denných pozorovaní.
+
+Pre stanicu sa udržiavajú mesačné agregáty (jeden riadok na Rok a Mesiac), tabuľka
+monthly_stats, ročná sumarizácia teplôt, dni s historickými extrémami a údaje o snehovej
+pokrývke pre použité obdobia a podmienky. Po pridaní nových dní sa prepočítajú iba dotknuté mesiace, roky a zimné
+sezóny; ostatné riadky sa len prevezmú. Dotknuté mesiace sa agregujú znova z ich denných
+údajov (nie sčítaním starého a nového súčtu), takže výsledky sú zhodné s úplným výpočtom
+vrátane zaokrúhlenia priemerov. Historické extrémy sa porovnajú iba s novými dňami.
+
+Metódy append a snow_data sa môžu volať z rôznych vlákien (sledovanie súboru a výpočet karty).
+Kto číta viac výsledkov z iného vlákna, drží zámok lock, aby pochádzali z jednej verzie údajov.
+
+Triedy:
+- IncrementalStation: Výsledky jednej stanice aktualizované po pridaní nových dní.
+
+Použitie:
+    station = IncrementalStation(station_id, data)
+    changes = station.append(new_days)
+"""
+
+import threading
+import numpy as np
+import pandas as pd
+from daily_dataset import DailyDataset, daily_frame, season_labels, MEASURED_COLUMNS
+from monthly_aggregates import monthly_aggregates, finalize_monthly_stats
+from processing_inputs import repair_data, find_extreme_days, calculate_historical_extremes
+from series_index import season_months
+from snow import calculate_snow_data
+from temp import create_yearly_temperature_summary
+from instrumentation import stage
+
+
+def _replace_rows(table, keys, updated, key_columns):
+    # Riadky s kľúčmi z keys sa nahradia riadkami z updated, poradie podľa kľúčov ostane zachované
+    if isinstance(key_columns, list):
+        is_affected = pd.MultiIndex.from_frame(table[key_columns]).isin(keys)
+    else:
+        is_affected = table.index.isin(keys) if key_columns is None else table[key_columns].isin(keys)
+    combined = pd.concat([table[~is_affected], updated])
+    if key_columns is None:
+        return combined.sort_index()
+    return combined.sort_values(key_columns, kind="stable").reset_index(drop=True)
+
+
+class IncrementalStation:
+    def __init__(self, station_id, data):
+        """
+        Vypočíta počiatočné výsledky stanice.
+
+        Args:
+        station_id (int): ID stanice.
+        data (pd.DataFrame | DailyDataset): Denné údaje (opravené cez repair_data).
+        """
+        self.station_id = int(station_id)
+        station_data = daily_frame(data, ["IND", "Datum", *MEASURED_COLUMNS], station_id=self.station_id)
+        self.data = DailyDataset(station_data)
+        self.aggregates = monthly_aggregates(self.data.frame).sort_values(["Rok", "Mesiac"]).reset_index(drop=True)
+        self.monthly_stats = finalize_monthly_stats(self.aggregates)
+        self.yearly_summary = create_yearly_temperature_summary(self.monthly_stats)
+        self.extreme_days = find_extreme_days(self.data)
+        # Údaje o snehu pre (mesiace obdobia, podmienka, atribút) -> (obdobie, tabuľka)
+        self._snow_data = {}
+        # Pod zámkom append mení výsledky a čitatelia z iných vlákien ich čítajú
+        self.lock = threading.RLock()
+
+    @property
+    def last_date(self):
+        return self.data.frame["Datum"].max()
+
+    @property
+    def historical_extremes(self):
+        # Extrémy teplôt a zrážok v tvare z calculate_historical_extremes
+        with self.lock:
+            return calculate_historical_extremes(self.data, self.extreme_days)
+
+    def snow_data(self, season, condition, attribute="CSP"):
+        """
+        Vráti údaje o snehovej pokrývke; pri prvom volaní pre obdobie a podmienku ich vypočíta
+        a odvtedy ich udržiava aktuálne pri každom pridaní dní.
+
+        Args:
+        season (str): "Zimné obdobie" alebo "Zima".
+        condition (int): Prah snehovej pokrývky v cm.
+        attribute (str): Atribút snehovej pokrývky.
+
+        Returns:
+        pd.DataFrame: Tabuľka v rovnakom tvare, ako vracia calculate_snow_data.
+        """
+        # Rôzne názvy toho istého obdobia zdieľajú jednu tabuľku
+        key = (tuple(season_months(season)), condition, attribute)
+        with self.lock:
+            if key not in self._snow_data:
+                self._snow_data[key] = (season, calculate_snow_data(self.data, self.monthly_stats, attribute, condition, season))
+            return self._snow_data[key][1]
+
+    @stage("IncrementalStation.append")
+    def append(self, new_days):
+        """
+        Pridá nové denné pozorovania a prepočíta iba dotknuté mesiace, roky a sezóny.
+
+        Args:
+        new_days (pd.DataFrame): Nové riadky v tvare z load_data (riadky iných staníc sa ignorujú).
+        Dátumy musia nasledovať po poslednom známom dni stanice.
+
+        Returns:
+        dict: Dotknuté kľúče {"months": [(Rok, Mesiac), ...], "years": [...], "seasons": [...]}.
+        Prázdne zoznamy, ak nepribudol žiadny deň.
+
+        Raises:
+        ValueError: Ak nový deň nie je neskôr ako posledný známy deň stanice.
+        """
+        new_days = new_days[new_days["IND"] == self.station_id]
+        if new_days.empty:
+            return {"months": [], "years": [], "seasons": []}
+        # Súbežné snow_data nesmie vidieť rozpracovanú aktualizáciu
+        with self.lock:
+            # Opraví sa kópia, vstupná tabuľka volajúceho sa nemení
+            new_data = DailyDataset(repair_data(new_days[["IND", "Datum", *MEASURED_COLUMNS]].copy()))
+            new_frame = new_data.frame
+            if new_frame["Datum"].isna().any() or new_frame["Datum"].min() <= self.last_date:
+                raise ValueError(f"Nové údaje stanice {self.station_id} musia nasledovať po dni {self.last_date:%d.%m.%Y}.")
+
+            self.data = self.data.append(new_data)
+            frame = self.data.frame
+
+            # Dotknuté mesiace sa agregujú znova zo všetkých svojich dní
+            months = pd.MultiIndex.from_frame(new_frame[["Rok", "Mesiac"]].drop_duplicates())
+            in_months = pd.MultiIndex.from_frame(frame[["Rok", "Mesiac"]]).isin(months)
+            month_aggregates = monthly_aggregates(frame[in_months])
+            self.aggregates = _replace_rows(self.aggregates, months, month_aggregates, ["Rok", "Mesiac"])
+            self.monthly_stats = _replace_rows(self.monthly_stats, months, finalize_monthly_stats(month_aggregates), ["Rok", "Mesiac"])
+
+            # Ročná sumarizácia iba pre roky s novými dňami
+            years = np.unique(new_frame["Rok"])
+            year_stats = self.monthly_stats[self.monthly_stats["Rok"].isin(years)]
+            self.yearly_summary = _replace_rows(self.yearly_summary, years, create_yearly_temperature_summary(year_stats), "Rok")
+
+            # Údaje o snehovej pokrývke iba pre sezóny s novými dňami
+            seasons = np.unique(new_frame["Sezona"])
+            season_data = frame[frame["Sezona"].isin(seasons)]
+            for key, (season, snow_data) in self._snow_data.items():
+                _, condition, attribute = key
+                updated = calculate_snow_data(season_data, self.monthly_stats, attribute, condition, season)
+                self._snow_data[key] = (season, _replace_rows(snow_data, season_labels(seasons), updated, None))
+
+            # Historické extrémy: nové dni sa porovnajú s doterajšími extrémami
+            self.extreme_days = find_extreme_days(new_frame, self.extreme_days)
+
+            return {"months": list(months), "years": years.tolist(), "seasons": seasons.tolist()}
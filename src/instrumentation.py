@@ -0,0 +1,178 @@
+"""
+Tento súbor obsahuje meranie jednotlivých krokov spracovania (čas, CPU, riadky, pamäť).
+
+Meranie je predvolene vypnuté a dekorované funkcie sa vtedy volajú priamo. Zapína sa
+premennou prostredia WDP_TRACE alebo parametrom --trace programov main_window.py
+a batch_report.py:
+
+    WDP_TRACE=stderr   záznamy krokov sa vypisujú ako JSON riadky na štandardný chybový výstup
+    WDP_TRACE=<súbor>  záznamy krokov sa pripisujú ako JSON riadky do súboru
+
+Každý záznam obsahuje názov kroku, čas behu, čas CPU vlákna, počet riadkov na vstupe a výstupe
+a špičku pamäte (tracemalloc, nad stavom pri začiatku kroku). Vnorené kroky majú v zázname
+názov nadradeného kroku. Špička pamäte je spoločná pre všetky vlákna procesu a sledovanie
+pamäte (tracemalloc) beh spomalí, preto je meranie určené na diagnostiku, nie na bežnú prácu.
+
+Funkcie:
+- enable: Zapne meranie a nastaví cieľ záznamov.
+- disable: Vypne meranie.
+- is_enabled: Vráti, či je meranie zapnuté.
+- stage: Dekorátor, ktorý meria volania funkcie ako krok spracovania.
+- events: Vráti záznamy krokov zaznamenané v tomto procese.
+- add_trace_argument: Pridá parameter --trace do argparse parsera.
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+TRACE_ENV = "WDP_TRACE"
+STDERR_TARGET = "stderr"
+
+_enabled = False
+_target = None
+_events = []
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def enable(target=STDERR_TARGET):
+    """
+    Zapne meranie krokov. Cieľ sa uloží aj do premennej prostredia, aby merali aj procesy
+    spustené z tohto procesu (napr. skupina procesov v batch_report.py).
+
+    Args:
+    target (str): "stderr" alebo cesta k súboru so záznamami (JSON riadky).
+    """
+    global _enabled, _target
+    _enabled = True
+    _target = target
+    os.environ[TRACE_ENV] = target
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    global _enabled
+    _enabled = False
+    os.environ.pop(TRACE_ENV, None)
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_enabled():
+    return _enabled
+
+
+def events():
+    with _lock:
+        return list(_events)
+
+
+def _rows(value):
+    # Počet riadkov tabuľky, poľa alebo prvej tabuľky v n-tici; pre iné hodnoty None
+    if isinstance(value, tuple):
+        return _rows(value[0]) if value else None
+    if isinstance(value, dict):
+        counts = [_rows(item) for item in value.values()]
+        return sum(count for count in counts if count is not None) if any(count is not None for count in counts) else None
+    if hasattr(value, "ndim"):
+        # Tabuľka, stĺpec alebo pole (skalár NumPy má ndim 0)
+        return len(value) if value.ndim else None
+    if hasattr(value, "memory_usage") and hasattr(value, "__len__"):
+        # DailyDataset a CompactDailyDataset
+        return len(value)
+    return None
+
+
+def _emit(event):
+    with _lock:
+        _events.append(event)
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        if _target == STDERR_TARGET:
+            print(line, file=sys.stderr)
+        elif _target:
+            with open(_target, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+
+def _run_measured(name, function, args, kwargs):
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # Špička nadradeného kroku do tohto okamihu, potom sa počíta od nuly pre vnorený krok
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    tracemalloc.reset_peak()
+    record = {"name": name, "start": current, "peak": current}
+    stack.append(record)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        record["peak"] = max(record["peak"], tracemalloc.get_traced_memory()[1])
+        stack.pop()
+        if stack:
+            stack[-1]["peak"] = max(stack[-1]["peak"], record["peak"])
+
+    rows_in = next((rows for rows in map(_rows, args) if rows is not None), None)
+    _emit({
+        "stage": name,
+        "parent": stack[-1]["name"] if stack else None,
+        "thread": threading.current_thread().name,
+        "pid": os.getpid(),
+        "wall_s": round(wall, 6),
+        "cpu_s": round(cpu, 6),
+        "rows_in": rows_in,
+        "rows_out": _rows(result),
+        "peak_mib": round((record["peak"] - record["start"]) / 2**20, 3),
+    })
+    return result
+
+
+def stage(name=None):
+    """
+    Dekorátor kroku spracovania. Ak je meranie vypnuté, funkcia sa zavolá priamo.
+
+    Args:
+    name (str | None): Názov kroku v záznamoch (predvolene názov funkcie).
+
+    Returns:
+    callable: Dekorátor funkcie.
+    """
+    def decorator(function):
+        stage_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            return _run_measured(stage_name, function, args, kwargs)
+
+        return wrapper
+    return decorator
+
+
+def add_trace_argument(parser):
+    """
+    Pridá do parsera parameter --trace [CIEĽ] (bez hodnoty znamená stderr).
+
+    Args:
+    parser (argparse.ArgumentParser): Parser programu.
+    """
+    parser.add_argument("--trace", nargs="?", const=STDERR_TARGET, default=None,
+                        help="Meranie krokov spracovania: 'stderr' alebo súbor pre JSON záznamy")
+
+
+if os.environ.get(TRACE_ENV):
+    enable(os.environ[TRACE_ENV])
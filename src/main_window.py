@@ -1,16 +1,151 @@
+import argparse
 import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget, QLabel, QProgressBar, QTableView
 from data_viewer import DataViewer
 from extremes_visualization_window import ExtremesVisualizationWindow
-from processing_inputs import load_data, process_data, calculate_historical_extremes
+from processing_inputs import load_station, process_data, calculate_historical_extremes
+from parse_cache import file_fingerprint
+from station_index import station_index, list_stations
+from daily_dataset import DailyDataset
 from tools import combine_statistics
-from snow import calculate_snow_data, calculate_snow_extremes, create_snow_coverage_frequency_table
+from snow import calculate_snow_data, calculate_snow_extremes, create_snow_coverage_frequency_tables
+from series_index import SeriesIndex, season_months
+from results_cache import ResultsCache
+from results_store import ResultsStore
+from workers import AnalysisRunner
+from instrumentation import add_trace_argument, enable
+from file_follower import FileFollower
+from incremental_stats import IncrementalStation
 from snow_data_viewer import SnowDataViewer
 from temp import create_yearly_temperature_summary
 from snow_data_viewer_copy import SnowDataViewerCopy  # Import the copied SnowDataViewer
 
+TAB_TITLES = ["Snow Data Viewer", "Snow Data Viewer Copy", "Extremes Viewer", "Data Viewer"]
+SNOW_TAB, SNOW_COPY_TAB, EXTREMES_TAB, DATA_TAB = range(len(TAB_TITLES))
+
+
+def load_analysis(file_name, station_id):
+    # Beží na pozadí: iba načítanie stanice, analýzy sa počítajú až pre zobrazenú kartu
+    # Kanonická denná tabuľka zdieľaná všetkými analýzami (dátumy sa parsujú iba raz)
+    # Odtlačok súboru zdieľa cache načítania, index staníc aj úložisko výsledkov, súbor sa hashuje iba raz
+    fingerprint = file_fingerprint(file_name)
+    index = station_index(file_name, fingerprint=fingerprint)
+    return {
+        "data": DailyDataset(load_station(file_name, station_id, fingerprint=fingerprint, index=index)),
+        "stations": list_stations(file_name, index=index),
+        "store": ResultsStore(file_name, fingerprint=fingerprint),
+    }
+
+
+def load_followed_analysis(follower):
+    # Beží na pozadí: prvé načítanie sledovaného súboru, štatistiky stanice sa odvtedy iba dopĺňajú
+    data = follower.load()
+    if data.empty:
+        print(f"Nenašli sa údaje pre stanicu s ID {follower.station_id}.")
+        sys.exit(1)
+    station = IncrementalStation(follower.station_id, data)
+    return {
+        "data": station.data,
+        "stations": list_stations(follower.file_name),
+        "station": station,
+    }
+
+
+def refresh_followed_analysis(follower, station):
+    # Beží na pozadí: načítajú sa iba pripísané riadky a prepočítajú sa iba dotknuté mesiace
+    rows, reloaded = follower.refresh()
+    if not reloaded:
+        try:
+            return station, bool(station.append(rows)["months"])
+        except ValueError:
+            # Nové dni nenasledujú po poslednom známom dni (súbor bol upravený), načíta sa celý
+            rows = follower.load()
+    return IncrementalStation(follower.station_id, rows), True
+
+
+def _stored(store, station_id, name, compute, params=()):
+    # Bez úložiska výsledkov (sledovaný súbor sa mení) sa výsledok vždy vypočíta
+    if store is None:
+        return compute()
+    return store.get_or_compute(station_id, name, compute, params)
+
+
+def compute_monthly_stats(station_id, data, monthly_stats=None, store=None):
+    # Mesačné štatistiky zdieľajú všetky karty, vypočítajú sa iba vtedy, ak ešte nie sú hotové
+    if monthly_stats is None:
+        monthly_stats = _stored(store, station_id, "monthly_stats", lambda: process_data(station_id, data))
+    return monthly_stats
+
+
+def compute_extremes_results(station_id, data, monthly_stats=None, store=None):
+    # Beží na pozadí pri prvom zobrazení karty s extrémami
+    monthly_stats = compute_monthly_stats(station_id, data, monthly_stats, store)
+
+    def compute():
+        temp_extremes, precip_extremes = calculate_historical_extremes(data)
+        return temp_extremes, precip_extremes, create_yearly_temperature_summary(monthly_stats)
+
+    return monthly_stats, _stored(store, station_id, "extremes", compute)
+
+
+def compute_snow_results(station_id, data, monthly_stats, season, condition, series_index=None, snow_results=None, monthly_results=None, store=None):
+    # Beží na pozadí: dopočíta iba tie výsledky, ktoré ešte nie sú v cache ani v úložisku
+    monthly_stats = compute_monthly_stats(station_id, data, monthly_stats, store)
+    params = (season_months(season), "CSP", condition)
+    if snow_results is None and store is not None:
+        snow_results = store.get(station_id, "snow", params)
+    if snow_results is None:
+        # Index sérií sa postaví iba vtedy, keď sa údaje o snehu naozaj počítajú
+        if series_index is None:
+            series_index = SeriesIndex(data, "CSP", season)
+        snow_data = calculate_snow_data(data, monthly_stats, "CSP", condition, season, series_index)
+        snow_results = (snow_data, calculate_snow_extremes(snow_data, data))
+        if store is not None:
+            store.put(station_id, "snow", snow_results, params)
+    if monthly_results is None:
+        monthly_results = _stored(store, station_id, "monthly_snow", lambda: compute_monthly_snow_results(monthly_stats))
+    return monthly_stats, series_index, snow_results, monthly_results
+
+
+def compute_monthly_snow_results(monthly_stats):
+    # Mesačné štatistiky a tabuľky početnosti nezávisia od obdobia ani podmienky
+    csp_statistics = combine_statistics(monthly_stats, "CSP_max")
+    csp_count_statistics = combine_statistics(monthly_stats, "CSP_count")
+    frequency_count_coverage, frequency_max_coverage = create_snow_coverage_frequency_tables(monthly_stats)["Zimné obdobie"]
+    return csp_statistics, csp_count_statistics, frequency_count_coverage, frequency_max_coverage
+
+
+def compute_station_snow_results(station, season, condition, monthly_results=None):
+    # Beží na pozadí: údaje o snehu sledovanej stanice sa vypočítajú iba pre nový výber,
+    # potom ich stanica udržiava pri pridaní dní; najvyššia pokrývka je medzi extrémami stanice.
+    # Výsledky sa čítajú pod zámkom stanice, aby pochádzali z jednej verzie údajov
+    with station.lock:
+        data, monthly_stats = station.data, station.monthly_stats
+        snow_data = station.snow_data(season, condition)
+        max_snow = station.extreme_days["CSP"]
+    snow_results = (snow_data, calculate_snow_extremes(snow_data, data, max_snow))
+    if monthly_results is None:
+        monthly_results = compute_monthly_snow_results(monthly_stats)
+    return monthly_stats, None, snow_results, monthly_results
+
+
+def station_extremes_results(station):
+    # Extrémy a ročnú sumarizáciu sledovanej stanice udržiava IncrementalStation, nič sa neprepočítava;
+    # pod zámkom stanice sa neprečíta rozpracovaná aktualizácia
+    with station.lock:
+        temp_extremes, precip_extremes = station.historical_extremes
+        return station.monthly_stats, (temp_extremes, precip_extremes, station.yearly_summary)
+
+
+def _placeholder(text):
+    label = QLabel(text)
+    label.setAlignment(Qt.AlignCenter)
+    return label
+
+
 class MainWindow(QMainWindow):
-    def __init__(self, file_name, station_id):
+    def __init__(self, file_name, station_id, follow_interval=None):
         super().__init__()
         self.station_id = station_id
         self.setWindowTitle("Weather Data Viewer")
@@ -18,50 +153,247 @@ class MainWindow(QMainWindow):
 
         self.tab_widget = QTabWidget()
         self.setCentralWidget(self.tab_widget)
+        # Karty sú iba zástupné, obsah sa vypočíta a vytvorí až pri prvom zobrazení karty
+        for title in TAB_TITLES:
+            self.tab_widget.addTab(_placeholder("Prebieha výpočet…"), title)
+        self.requested_tabs = set()
+        self.tab_widget.currentChanged.connect(self.show_tab)
 
-        data = load_data(file_name)
-        self.data = data
+        # Neurčitý priebeh v stavovom riadku, kým beží nejaký výpočet na pozadí
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide()
+        self.statusBar().addPermanentWidget(self.progress_bar)
 
-        self.monthly_stats = process_data(station_id, data)
-        self.update_snow_data_viewer("Zimne obdobie", self.data)
+        self.file_name = file_name
+        self.data = None
+        # Mesačné štatistiky zdieľané kartami, vypočítajú sa pre prvú kartu, ktorá ich potrebuje
+        self.monthly_stats = None
+        # Indexy sérií CSP pre každé obdobie, postavené iba raz pre stanicu (nie pri sledovaní súboru)
+        self.series_indexes = {}
+        self.snow_season = "Zimne obdobie"
+        self.snow_condition = 1
+        # Výsledky analýz pre už zobrazené výbery; verzia sa zvýši pri každej zmene self.data
+        self.results_cache = ResultsCache()
+        self.data_version = 0
+        # Výsledky uložené na disku z predchádzajúcich spustení (iba pre nemenný vstupný súbor)
+        self.store = None
 
-        temp_extremes, precip_extremes = calculate_historical_extremes(data)
-        self.yearly_summary = create_yearly_temperature_summary(self.monthly_stats)
-        self.extremes_viewer = ExtremesVisualizationWindow(temp_extremes, precip_extremes, self.yearly_summary)
-        self.tab_widget.addTab(self.extremes_viewer, "Extremes Viewer")
+        # Analýzy bežia na pozadí, okno ostáva počas výpočtu ovládateľné
+        self.runner = AnalysisRunner(self)
+        self.runner.busy_changed.connect(self.show_progress)
+        if follow_interval:
+            # Sledovaný súbor: pri každom obnovení sa načítajú iba pripísané riadky
+            self.follower = FileFollower(file_name, station_id)
+            self.follow_timer = QTimer(self)
+            self.follow_timer.setInterval(int(follow_interval * 1000))
+            self.follow_timer.timeout.connect(self.refresh_data)
+            self.runner.submit("load", load_followed_analysis, self.follower, on_finished=self.on_data_loaded, on_failed=self.on_load_failed)
+        else:
+            self.follower = None
+            self.runner.submit("load", load_analysis, file_name, station_id, on_finished=self.on_data_loaded, on_failed=self.on_load_failed)
+
+    def show_progress(self, busy):
+        self.progress_bar.setVisible(busy)
+        if busy:
+            self.statusBar().showMessage("Prebieha výpočet…")
+        else:
+            self.statusBar().clearMessage()
+
+    def replace_tab(self, index, widget):
+        current = self.tab_widget.currentIndex()
+        # Výmena karty nesmie vyžiadať obsah inej karty
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, TAB_TITLES[index])
+        self.tab_widget.setCurrentIndex(current)
+        self.tab_widget.blockSignals(False)
+
+    def on_load_failed(self, error):
+        # Funkcie načítania chybu už vypísali a ukončili sa cez sys.exit
+        if not isinstance(error, SystemExit):
+            print(f"Chyba pri spracovaní súboru: {error}")
+        QApplication.exit(1)
+
+    def on_data_loaded(self, results):
+        self.data = results["data"]
+        self.stations = results["stations"]
+        self.station = results.get("station")
+        self.store = results.get("store")
+        if self.station is not None:
+            self.monthly_stats = self.station.monthly_stats
+        if self.follower is not None:
+            self.follow_timer.start()
+        self.show_tab(self.tab_widget.currentIndex())
+
+    def refresh_data(self):
+        # Nové obnovenie sa spustí až po dokončení predchádzajúceho
+        if self.runner.is_busy("follow"):
+            return
+        self.runner.submit(
+            "follow", refresh_followed_analysis, self.follower, self.station,
+            on_finished=self.on_data_refreshed, on_failed=lambda error: print(f"Chyba pri obnovení údajov: {error}"),
+        )
+
+    def on_data_refreshed(self, results):
+        station, changed = results
+        if not changed:
+            return
+        self.station = station
+        self.data = station.data
+        self.monthly_stats = station.monthly_stats
+        # Výsledky v cache patria predchádzajúcej verzii údajov
+        self.data_version += 1
+        # Vyžiadané karty sa zobrazia z výsledkov, ktoré stanica aktualizovala pre nové dni,
+        # ostatné až pri prvom zobrazení
+        if SNOW_TAB in self.requested_tabs or SNOW_COPY_TAB in self.requested_tabs:
+            self.update_snow_data_viewer(self.snow_season)
+        if EXTREMES_TAB in self.requested_tabs:
+            self.show_extremes(station_extremes_results(self.station))
+        if hasattr(self, "data_viewer"):
+            self.data_viewer.update_data(self.monthly_stats)
+
+    def show_tab(self, index):
+        # Obsah karty sa vypočíta iba pri jej prvom zobrazení, hotové medzivýsledky sa použijú znova
+        if self.data is None or index < 0 or index in self.requested_tabs:
+            return
+        self.requested_tabs.add(index)
+        if index in (SNOW_TAB, SNOW_COPY_TAB):
+            self.update_snow_data_viewer(self.snow_season, self.data)
+        elif index == EXTREMES_TAB and self.station is not None:
+            self.show_extremes(station_extremes_results(self.station))
+        elif index == EXTREMES_TAB:
+            self.runner.submit(
+                "extremes", compute_extremes_results, self.station_id, self.data, self.monthly_stats, self.store,
+                on_finished=self.show_extremes, on_failed=lambda error: self.on_tab_failed(index, error),
+            )
+        elif index == DATA_TAB:
+            self.runner.submit(
+                "monthly", compute_monthly_stats, self.station_id, self.data, self.monthly_stats, self.store,
+                on_finished=self.show_data_viewer, on_failed=lambda error: self.on_tab_failed(index, error),
+            )
+
+    def on_tab_failed(self, index, error):
+        print(f"Chyba pri výpočte karty {TAB_TITLES[index]}: {error}")
+        # Pri ďalšom zobrazení karty sa výpočet skúsi znova
+        self.requested_tabs.discard(index)
+
+    def store_monthly_stats(self, monthly_stats):
+        if self.monthly_stats is None:
+            self.monthly_stats = monthly_stats
+
+    def show_extremes(self, results):
+        monthly_stats, (temp_extremes, precip_extremes, yearly_summary) = results
+        self.store_monthly_stats(monthly_stats)
+        self.yearly_summary = yearly_summary
+        if hasattr(self, "extremes_viewer"):
+            self.extremes_viewer.update_data(temp_extremes, precip_extremes, yearly_summary)
+            return
+        self.extremes_viewer = ExtremesVisualizationWindow(temp_extremes, precip_extremes, yearly_summary)
+        self.replace_tab(EXTREMES_TAB, self.extremes_viewer)
 
+    def show_data_viewer(self, monthly_stats):
+        self.store_monthly_stats(monthly_stats)
         self.data_viewer = DataViewer(self.monthly_stats)
-        self.tab_widget.addTab(self.data_viewer, "Data Viewer")
+        self.replace_tab(DATA_TAB, self.data_viewer)
 
-    def update_snow_data_viewer(self, season, data=None):
+    def update_snow_data_viewer(self, season, data=None, condition=None):
         if data is None:
             data = self.data
-        snow_data = calculate_snow_data(data, self.monthly_stats, "CSP", 1, season)
-        snow_extremes = calculate_snow_extremes(snow_data, data)
-        csp_statistics = combine_statistics(self.monthly_stats, "CSP_max")
-        csp_count_statistics = combine_statistics(self.monthly_stats, "CSP_count")
-        create_snow_coverage_frequency_table(self.monthly_stats, "Letné obdobie")
-        frequency_count_coverage, frequency_max_coverage = create_snow_coverage_frequency_table(self.monthly_stats, "Zimné obdobie")
+        if condition is not None:
+            self.snow_condition = condition
+        condition = self.snow_condition
+        self.snow_season = season
+
+        months = tuple(season_months(season))
+        is_current = data is self.data
+        snow_key = ("snow", self.station_id, months, "CSP", condition, self.data_version)
+        monthly_key = ("monthly snow", self.station_id, self.data_version)
+        snow_results = self.results_cache.get(snow_key) if is_current else None
+        monthly_results = self.results_cache.get(monthly_key)
+
+        if snow_results is not None and monthly_results is not None:
+            # Už zobrazený výber sa ukáže hneď, staršia požiadavka sa zruší
+            self.runner.cancel("snow")
+            self.show_snow_data(snow_results, monthly_results)
+            return
+
+        def on_finished(results):
+            monthly_stats, series_index, snow_results, monthly_results = results
+            # Výsledky pre údaje nahradené počas výpočtu sa do indexov neuložia
+            if is_current and data is self.data:
+                self.store_monthly_stats(monthly_stats)
+                if series_index is not None:
+                    self.series_indexes[months] = series_index
+                self.results_cache.put(snow_key, snow_results)
+            self.results_cache.put(monthly_key, monthly_results)
+            self.show_snow_data(snow_results, monthly_results)
+
+        def on_failed(error):
+            print(f"Chyba pri výpočte údajov o snehu: {error}")
+            self.set_snow_viewers_enabled(True)
+
+        # Cache aj indexy sa menia iba v hlavnom vlákne, worker dostane hotové časti ako argumenty
+        self.set_snow_viewers_enabled(False)
+        if self.station is not None:
+            # Sledovaný súbor: údaje o snehu udržiava stanica, index sérií sa nestavia
+            self.runner.submit(
+                "snow", compute_station_snow_results, self.station, season, condition, monthly_results,
+                on_finished=on_finished, on_failed=on_failed,
+            )
+            return
+        series_index = self.series_indexes.get(months) if is_current else None
+        self.runner.submit(
+            "snow", compute_snow_results, self.station_id, data, self.monthly_stats, season, condition, series_index, snow_results, monthly_results,
+            self.store if is_current else None,
+            on_finished=on_finished, on_failed=on_failed,
+        )
+
+    def snow_viewers(self):
+        return [getattr(self, name) for name in ("snow_data_viewer", "snow_data_viewer_copy") if hasattr(self, name)]
+
+    def set_snow_viewers_enabled(self, enabled):
+        # Počas výpočtu sú zobrazené (staré) tabuľky zašednuté, výber obdobia a prahu ostáva aktívny
+        for viewer in self.snow_viewers():
+            for table in viewer.findChildren(QTableView):
+                table.setEnabled(enabled)
+
+    def show_snow_data(self, snow_results, monthly_results):
+        snow_data, snow_extremes = snow_results
+        csp_statistics, csp_count_statistics, frequency_count_coverage, frequency_max_coverage = monthly_results
+        # Existujúce snehové karty sa aktualizujú, karty zobrazené po prvýkrát sa vytvoria
         if hasattr(self, 'snow_data_viewer'):
             self.snow_data_viewer.update_data(snow_data, snow_extremes, csp_statistics, csp_count_statistics)
-            self.snow_data_viewer_copy.update_data(snow_data, snow_extremes, csp_statistics, csp_count_statistics, frequency_count_coverage, frequency_max_coverage)
-        else:
+        elif SNOW_TAB in self.requested_tabs:
             self.snow_data_viewer = SnowDataViewer(snow_data, snow_extremes, csp_statistics, csp_count_statistics, self)
+            self.replace_tab(SNOW_TAB, self.snow_data_viewer)
+        if hasattr(self, 'snow_data_viewer_copy'):
+            self.snow_data_viewer_copy.update_data(snow_data, snow_extremes, csp_statistics, csp_count_statistics, frequency_count_coverage, frequency_max_coverage)
+        elif SNOW_COPY_TAB in self.requested_tabs:
             self.snow_data_viewer_copy = SnowDataViewerCopy(snow_data, snow_extremes, csp_statistics, csp_count_statistics, frequency_count_coverage, frequency_max_coverage, self)
-            self.tab_widget.addTab(self.snow_data_viewer, "Snow Data Viewer")
-            self.tab_widget.addTab(self.snow_data_viewer_copy, "Snow Data Viewer Copy")
+            self.replace_tab(SNOW_COPY_TAB, self.snow_data_viewer_copy)
+        # Obe snehové karty ukazujú rovnaké obdobie a prah, aj keď sa zmenili v druhej karte
+        for viewer in self.snow_viewers():
+            viewer.show_season(self.snow_season)
+            viewer.show_condition(self.snow_condition)
+        self.set_snow_viewers_enabled(True)
 
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    if len(sys.argv) != 3:
-        print("Usage: python main_window.py <file_name> <station_id>")
-        sys.exit(1)
-    
-    file_name = sys.argv[1]
-    station_id = sys.argv[2]
+    parser = argparse.ArgumentParser(description="Weather Data Viewer")
+    parser.add_argument("file_name")
+    parser.add_argument("station_id")
+    parser.add_argument("--follow", nargs="?", type=float, const=5.0, default=None, metavar="SEKUNDY",
+                        help="Sledovať pripisovanie do súboru a obnovovať údaje v zadanom intervale (predvolene 5 s)")
+    add_trace_argument(parser)
+    args = parser.parse_args(app.arguments()[1:])
+
+    if args.trace:
+        enable(args.trace)
 
-    main_window = MainWindow(file_name, station_id)
+    main_window = MainWindow(args.file_name, args.station_id, args.follow)
     main_window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,154 @@
+"""
+Tento súbor obsahuje zlúčiteľné (mergeable) mesačné agregáty denných pozorovaní.
+
+Čiastkové agregáty sa počítajú pre každú kombináciu (IND, Rok, Mesiac) a obsahujú iba
+minimá, maximá, súčty a počty. Agregáty z viacerých častí súboru sa preto dajú spojiť
+bez straty presnosti a až na konci sa z nich vytvorí tabuľka monthly_stats v rovnakom
+tvare, ako ju vracia process_data.
+
+Funkcie:
+- monthly_aggregates: Vypočíta čiastkové mesačné agregáty z denných údajov.
+- merge_monthly_aggregates: Spojí viacero čiastkových agregátov do jedného.
+- finalize_monthly_stats: Vytvorí z agregátov jednej stanice tabuľku monthly_stats.
+"""
+
+import operator
+import numpy as np
+import pandas as pd
+
+KEYS = ["IND", "Rok", "Mesiac"]
+ATTRIBUTES = ["Tmax", "Tmin", "Tavg", "R", "CSP"]
+
+# Štatistiky v poradí stĺpcov monthly_stats
+STATISTICS = {
+    "Tmax": ["min", "max", "mean"],
+    "Tmin": ["min", "max", "mean"],
+    "Tavg": ["min", "max", "mean"],
+    "R": ["max", "count", "sum"],
+    "CSP": ["max", "count", "sum"],
+}
+
+# Počty dní, v ktorých atribút spĺňa podmienku
+THRESHOLDS = {
+    "Tmax": {
+        "count35": (operator.ge, 35.0),
+        "count30": (operator.ge, 30.0),
+        "count25": (operator.ge, 25.0),
+        "count0": (operator.le, 0.0),
+        "count_10": (operator.le, -10.0),
+    },
+    "Tmin": {
+        "count25": (operator.ge, 25.0),
+        "count20": (operator.ge, 20.0),
+        "count0": (operator.lt, 0.0),
+        "count_10": (operator.le, -10.0),
+    },
+}
+
+
+def _daily_values(data, attribute):
+    values = data[attribute].to_numpy(dtype="float64")
+    # Rovnaké zaokrúhlenie ako v process_data (CSP je celé číslo centimetrov)
+    return np.trunc(values) if attribute == "CSP" else np.round(values, 1)
+
+
+def monthly_aggregates(data):
+    """
+    Vypočíta čiastkové mesačné agregáty z denných údajov.
+
+    Args:
+    data (pd.DataFrame): Denné údaje so stĺpcami IND, Datum (datetime) a atribútmi
+    (prípadne aj s predpočítanými stĺpcami Rok a Mesiac).
+
+    Returns:
+    pd.DataFrame: Jeden riadok na (IND, Rok, Mesiac) so stĺpcami <atribút>_min, _max,
+    _sum, _count a počtami dní nad/pod prahmi z THRESHOLDS.
+    """
+    valid = data["Datum"].notna().to_numpy()
+    if "Rok" in data.columns and "Mesiac" in data.columns:
+        # Kľúče predpočítané v DailyDataset
+        year, month = data["Rok"].to_numpy(), data["Mesiac"].to_numpy()
+    else:
+        dates = pd.DatetimeIndex(data["Datum"])
+        year, month = dates.year.to_numpy(), dates.month.to_numpy()
+    columns = {
+        "IND": data["IND"].to_numpy()[valid],
+        "Rok": year[valid].astype("int32"),
+        "Mesiac": month[valid].astype("int32"),
+    }
+    aggregations = {}
+    for attribute in ATTRIBUTES:
+        values = _daily_values(data, attribute)[valid]
+        columns[attribute] = values
+        columns[f"{attribute}_count"] = ~np.isnan(values)
+        aggregations[f"{attribute}_min"] = (attribute, "min")
+        aggregations[f"{attribute}_max"] = (attribute, "max")
+        aggregations[f"{attribute}_sum"] = (attribute, "sum")
+        aggregations[f"{attribute}_count"] = (f"{attribute}_count", "sum")
+        for name, (compare, threshold) in THRESHOLDS.get(attribute, {}).items():
+            # Porovnanie s NaN je vždy False, takže chýbajúce hodnoty sa nezapočítajú
+            columns[f"{attribute}_{name}"] = compare(values, threshold)
+            aggregations[f"{attribute}_{name}"] = (f"{attribute}_{name}", "sum")
+
+    return pd.DataFrame(columns).groupby(KEYS, sort=False).agg(**aggregations).reset_index()
+
+
+def merge_monthly_aggregates(partials):
+    """
+    Spojí čiastkové agregáty, napríklad z jednotlivých častí súboru.
+
+    Args:
+    partials (list[pd.DataFrame | None]): Čiastkové agregáty z monthly_aggregates (None sa preskočí).
+
+    Returns:
+    pd.DataFrame: Agregáty v rovnakom tvare, jeden riadok na (IND, Rok, Mesiac).
+    """
+    partials = [partial for partial in partials if partial is not None]
+    if len(partials) == 1:
+        return partials[0]
+
+    combined = pd.concat(partials, ignore_index=True)
+    aggregations = {
+        column: "min" if column.endswith("_min") else "max" if column.endswith("_max") else "sum"
+        for column in combined.columns if column not in KEYS
+    }
+    return combined.groupby(KEYS, sort=False).agg(aggregations).reset_index()
+
+
+def finalize_monthly_stats(aggregates):
+    """
+    Vytvorí z agregátov jednej stanice tabuľku monthly_stats.
+
+    Args:
+    aggregates (pd.DataFrame): Agregáty z monthly_aggregates alebo merge_monthly_aggregates.
+
+    Returns:
+    pd.DataFrame: Tabuľka s rovnakými stĺpcami a typmi, ako vracia process_data.
+    """
+    aggregates = aggregates.sort_values(["Rok", "Mesiac"]).reset_index(drop=True)
+    monthly_stats = pd.DataFrame({"Rok_": aggregates["Rok"], "Mesiac_": aggregates["Mesiac"]})
+
+    for attribute, functions in STATISTICS.items():
+        count = aggregates[f"{attribute}_count"]
+        for function in functions:
+            if function == "mean":
+                monthly_stats[f"{attribute}_mean"] = aggregates[f"{attribute}_sum"].where(count > 0) / count
+            else:
+                monthly_stats[f"{attribute}_{function}"] = aggregates[f"{attribute}_{function}"]
+        for name in THRESHOLDS.get(attribute, {}):
+            monthly_stats[f"{attribute}_{name}"] = aggregates[f"{attribute}_{name}"].astype("int64")
+
+    # Zaokrúhlenie výsledkov na 1 desatinné miesto
+    monthly_stats["Tmax_mean"] = monthly_stats["Tmax_mean"].round(1)
+    monthly_stats["Tmin_mean"] = monthly_stats["Tmin_mean"].round(1)
+    monthly_stats["Tavg_mean"] = monthly_stats["Tavg_mean"].round(1)
+    monthly_stats["R_sum"] = monthly_stats["R_sum"].round(1)
+    monthly_stats["R_count"] = monthly_stats["R_count"].astype("int64")
+    monthly_stats["CSP_max"] = monthly_stats["CSP_max"].fillna(0).astype("int64")
+    monthly_stats["CSP_count"] = monthly_stats["CSP_count"].astype("int64")
+    monthly_stats["CSP_sum"] = monthly_stats["CSP_sum"].astype("int64")
+
+    monthly_stats["Rok"] = monthly_stats["Rok_"]
+    monthly_stats["Mesiac"] = monthly_stats["Mesiac_"]
+
+    return monthly_stats
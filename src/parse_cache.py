@@ -0,0 +1,140 @@
+"""
+Tento súbor obsahuje diskovú cache načítaných a opravených vstupných súborov.
+
+Cache sa ukladá ako binárny stĺpcový súbor (.npz, jedno pole na stĺpec) do adresára
+CACHE_DIR_NAME vedľa zdrojového súboru. Platnosť cache je viazaná na cestu, veľkosť,
+čas poslednej zmeny a hash obsahu zdrojového súboru.
+
+Funkcie:
+- cache_directory: Vráti adresár, do ktorého sa ukladá cache pre daný súbor.
+- file_fingerprint: Vypočíta odtlačok súboru (cesta, veľkosť, mtime, hash obsahu).
+- read_cached: Načíta tabuľku z cache, ak je platná, inak zmaže zastaranú cache.
+- write_cache: Uloží tabuľku do cache.
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+CACHE_DIR_NAME = ".wdp_cache"
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def cache_directory(file_name, cache_dir=None):
+    if cache_dir is not None:
+        return cache_dir
+    return os.path.join(os.path.dirname(os.path.abspath(file_name)), CACHE_DIR_NAME)
+
+
+def _content_hash(file_name):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_name, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(file_name, content_hash=True):
+    """
+    Vypočíta odtlačok súboru, podľa ktorého sa rozhoduje o platnosti cache.
+
+    Args:
+    file_name (str): Cesta k súboru.
+    content_hash (bool): Či sa má počítať aj hash obsahu súboru.
+
+    Returns:
+    dict: Absolútna cesta, veľkosť, čas poslednej zmeny (ns) a hash obsahu.
+    """
+    stat = os.stat(file_name)
+    return {
+        "path": os.path.abspath(file_name),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": _content_hash(file_name) if content_hash else None,
+    }
+
+
+def _cache_path(file_name, cache_dir, suffix="npz"):
+    path = os.path.abspath(file_name)
+    path_key = hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(cache_directory(file_name, cache_dir), f"{os.path.basename(path)}.{path_key}.{suffix}")
+
+
+def read_cached(file_name, cache_dir=None, fingerprint=None, suffix="npz"):
+    """
+    Načíta tabuľku z cache, ak zodpovedá aktuálnemu stavu zdrojového súboru.
+
+    Args:
+    file_name (str): Cesta k zdrojovému súboru.
+    cache_dir (str | None): Adresár cache, predvolene vedľa zdrojového súboru.
+    fingerprint (dict | None): Už vypočítaný odtlačok zdrojového súboru.
+    suffix (str): Prípona súboru cache, rozlišuje viac tabuliek odvodených z jedného súboru.
+
+    Returns:
+    pd.DataFrame | None: Tabuľka z cache alebo None, ak cache chýba alebo je zastaraná.
+    """
+    path = _cache_path(file_name, cache_dir, suffix)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            stored = json.loads(str(archive["__fingerprint__"]))
+            current = fingerprint or file_fingerprint(file_name, content_hash=False)
+            # Rýchla kontrola veľkosti a času zmeny, hash sa počíta až pri zhode
+            if stored["size"] != current["size"] or stored["mtime_ns"] != current["mtime_ns"]:
+                stale = True
+            else:
+                content = current["hash"] or _content_hash(file_name)
+                stale = stored["hash"] != content
+            if not stale:
+                columns = [str(column) for column in archive["__columns__"]]
+                return pd.DataFrame({column: archive[f"c{i}"] for i, column in enumerate(columns)})
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Zastaraná alebo poškodená cache sa odstráni
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    return None
+
+
+def write_cache(file_name, data, cache_dir=None, fingerprint=None, suffix="npz"):
+    """
+    Uloží tabuľku do cache. Ukladajú sa iba číselné a dátumové stĺpce.
+
+    Args:
+    file_name (str): Cesta k zdrojovému súboru.
+    data (pd.DataFrame): Opravená a typovaná tabuľka.
+    cache_dir (str | None): Adresár cache, predvolene vedľa zdrojového súboru.
+    fingerprint (dict | None): Odtlačok zdrojového súboru zo začiatku načítania.
+    suffix (str): Prípona súboru cache, rozlišuje viac tabuliek odvodených z jedného súboru.
+
+    Returns:
+    bool: True, ak sa cache podarilo uložiť.
+    """
+    if not all(pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_dtype(dtype) for dtype in data.dtypes):
+        return False
+
+    fingerprint = fingerprint or file_fingerprint(file_name)
+    if fingerprint["hash"] is None:
+        fingerprint = dict(fingerprint, hash=_content_hash(file_name))
+    path = _cache_path(file_name, cache_dir, suffix)
+    arrays = {f"c{i}": data[column].to_numpy() for i, column in enumerate(data.columns)}
+    arrays["__columns__"] = np.array([str(column) for column in data.columns])
+    arrays["__fingerprint__"] = np.array(json.dumps(fingerprint))
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Zápis cez dočasný súbor, aby iný proces nenačítal rozpísanú cache
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temporary_path, path)
+    except OSError:
+        return False
+    return True
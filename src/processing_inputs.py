@@ -1,5 +1,10 @@
 import sys
-import pandas as pd
+from data_loader import read_observations, read_observation_chunks, CHUNK_SIZE
+from monthly_aggregates import monthly_aggregates, merge_monthly_aggregates, finalize_monthly_stats
+from parse_cache import file_fingerprint, read_cached, write_cache
+from station_index import station_index, read_station
+from daily_dataset import daily_frame
+from instrumentation import stage
 
 def repair_data(data):
     # Nahradenie hodnoty 995, 999 a 0 v stĺpci CSP hodnotou NaN (prázdna hodnota)
@@ -10,16 +15,42 @@ def repair_data(data):
     return data
 
 
-def load_data(file_name):
+@stage()
+def load_data(file_name, use_cache=True):
+    fingerprint = None
     try:
+        if use_cache:
+            # Ak sa súbor od posledného načítania nezmenil, použije sa uložená cache
+            fingerprint = file_fingerprint(file_name)
+            data = read_cached(file_name, fingerprint=fingerprint)
+            if data is not None:
+                return data
+
         # Načítanie súboru
-        data = pd.read_csv(
-            file_name,
-            delimiter="\t",
-            decimal=",",
-            na_values=[""],
-            engine="python"
-        )
+        data = read_observations(file_name)
+    except FileNotFoundError:
+        print(f"Chyba: Súbor {file_name} neexistuje.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Chyba pri spracovaní súboru: {e}")
+        sys.exit(1)
+
+    data = repair_data(data)
+    if use_cache:
+        write_cache(file_name, data, fingerprint=fingerprint)
+
+    return data
+
+
+@stage()
+def load_station(file_name, station_id, use_cache=True, fingerprint=None, index=None):
+    try:
+        # Načítanie iba úsekov súboru, ktoré patria zvolenej stanici; údaje stanice sa do cache
+        # neukladajú (cache by bola druhou kópiou súboru), v cache je iba index staníc
+        # (index môže načítať volajúci raz pre viac staníc, odtlačok súboru slúži pre cache indexu)
+        if index is None:
+            index = station_index(file_name, fingerprint=fingerprint, use_cache=use_cache)
+        data = read_station(file_name, station_id, index)
     except FileNotFoundError:
         print(f"Chyba: Súbor {file_name} neexistuje.")
         sys.exit(1)
@@ -27,80 +58,104 @@ def load_data(file_name):
         print(f"Chyba pri spracovaní súboru: {e}")
         sys.exit(1)
 
+    if data.empty:
+        print(f"Nenašli sa údaje pre stanicu s ID {station_id}.")
+        sys.exit(1)
+
     return repair_data(data)
 
+
+@stage()
+def stream_monthly_stats(file_name, station_id=None, chunksize=CHUNK_SIZE):
+    # Súbor sa číta po častiach a každá časť sa hneď zlúči do mesačných agregátov,
+    # takže v pamäti je naraz iba jedna časť a jeden riadok na mesiac
+    aggregates = None
+    try:
+        for chunk in read_observation_chunks(file_name, chunksize):
+            if station_id is not None:
+                chunk = chunk[chunk["IND"] == int(station_id)]
+            aggregates = merge_monthly_aggregates([aggregates, monthly_aggregates(repair_data(chunk))])
+    except FileNotFoundError:
+        print(f"Chyba: Súbor {file_name} neexistuje.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Chyba pri spracovaní súboru: {e}")
+        sys.exit(1)
+
+    if aggregates is None or aggregates.empty:
+        if station_id is None:
+            print(f"Súbor {file_name} neobsahuje žiadne údaje.")
+        else:
+            print(f"Nenašli sa údaje pre stanicu s ID {station_id}.")
+        sys.exit(1)
+
+    if station_id is not None:
+        return finalize_monthly_stats(aggregates)
+    # Bez zadanej stanice sa vráti monthly_stats pre každú stanicu v súbore
+    return {station: finalize_monthly_stats(group) for station, group in aggregates.groupby("IND")}
+
     
+@stage()
 def process_data(station_id, data):
-    # Filtrovanie podľa zadaného IND
-    station_data = data[data["IND"] == int(station_id)]
+    # Filtrovanie podľa zadaného IND; dátumy a kľúče Rok/Mesiac sú už predpočítané
+    # (kompaktná reprezentácia sa dekóduje iba pre riadky zvolenej stanice)
+    station_data = daily_frame(data, station_id=station_id)
     if station_data.empty:
         print(f"Nenašli sa údaje pre stanicu s ID {station_id}.")
         sys.exit(1)
 
-    # Prevod stĺpca 'Datum' na datetime typ s presným formátom
-    station_data["Datum"] = pd.to_datetime(station_data["Datum"], format='%d.%m.%Y', errors='coerce')
-    
-    # Pridanie stĺpcov pre Rok a Mesiac
-    station_data['Rok'] = station_data['Datum'].dt.year
-    station_data['Mesiac'] = station_data['Datum'].dt.month
-
-    station_data["Tmax"] = station_data["Tmax"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
-    station_data["Tmin"] = station_data["Tmin"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
-    station_data["Tavg"] = station_data["Tavg"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
-    station_data["R"] = station_data["R"].apply(lambda x: round(x, 1) if pd.notnull(x) else x)
-    station_data["CSP"] = station_data["CSP"].apply(lambda x: int(x) if pd.notnull(x) else x)
-
-    # Výpočet štatistík pre každý rok a mesiac
-    monthly_stats = station_data.groupby(['Rok', 'Mesiac']).agg({
-        "Tmax": ["min", "max", "mean", ("count35", lambda x: (x >= 35.0).sum()), ("count30", lambda x: (x >= 30.0).sum()), ("count25", lambda x: (x >= 25.0).sum()), ("count0", lambda x: (x <= 0.0).sum()), ("count_10", lambda x: (x <= -10.0).sum())],
-        "Tmin": ["min", "max", "mean", ("count25", lambda x: (x >= 25.0).sum()), ("count20", lambda x: (x >= 20.0).sum()), ("count0", lambda x: (x < 0.0).sum()), ("count_10", lambda x: (x <= -10.0).sum())],
-        "Tavg": ["min", "max", "mean"],
-        "R": ["max", "count", "sum"],
-        "CSP": ["max", "count", "sum"]
-    }).reset_index()
-
-    # Flatten the MultiIndex columns
-    monthly_stats.columns = ['_'.join(col).strip() if type(col) is tuple else col for col in monthly_stats.columns]
-
-    # Pridanie stĺpca Rok
-    monthly_stats['Rok'] = monthly_stats['Rok_']
-
-    # Zaokrúhlenie výsledkov na 1 desatinné miesto
-    monthly_stats["Tmax_mean"] = monthly_stats["Tmax_mean"].round(1)
-    monthly_stats["Tmin_mean"] = monthly_stats["Tmin_mean"].round(1)
-    monthly_stats["Tavg_mean"] = monthly_stats["Tavg_mean"].round(1)
-    monthly_stats["R_sum"] = monthly_stats["R_sum"].round(1)
-    monthly_stats["R_count"] = monthly_stats["R_count"].apply(lambda x: int(x) if pd.notnull(x) else x)
-    monthly_stats["CSP_max"] = monthly_stats["CSP_max"].apply(lambda x: int(x) if pd.notnull(x) else 0)
-    monthly_stats["CSP_count"] = monthly_stats["CSP_count"].apply(lambda x: int(x) if pd.notnull(x) else x)
-    monthly_stats["CSP_sum"] = monthly_stats["CSP_sum"].apply(lambda x: int(x) if pd.notnull(x) else x)
-
-    # Pridanie stĺpca Mesiac
-    monthly_stats['Mesiac'] = monthly_stats['Mesiac_']
-
-    return monthly_stats
-
-
-def calculate_historical_extremes(data):
-    # Konverzia dátumu na datetime
-    data["Datum"] = pd.to_datetime(data["Datum"], format='%d.%m.%Y', errors="coerce")
+    # Výpočet štatistík pre každý rok a mesiac kompilovanými groupby redukciami
+    # nad predpočítanými indikátormi prahov (bez Python lambda funkcií)
+    return finalize_monthly_stats(monthly_aggregates(station_data))
+
+
+# Atribúty historických extrémov a či sa pre ne hľadá minimum
+EXTREME_ATTRIBUTES = {"Tmax": False, "Tmin": True, "R": False, "CSP": False}
+
+
+def find_extreme_days(data, extreme_days=None):
+    """
+    Nájde dni s historickými extrémami atribútov EXTREME_ATTRIBUTES.
+
+    Args:
+    data (pd.DataFrame | DailyDataset): Denné údaje, pri zadaní extreme_days iba nové dni.
+    extreme_days (dict | None): Predchádzajúce extrémy; nový deň ich nahradí iba vtedy, ak ich
+    prekoná (pri zhode ostáva skorší deň, rovnako ako pri idxmax nad celými údajmi).
+
+    Returns:
+    dict: {atribút: (hodnota, dátum)}
+    """
+    data = daily_frame(data, ["Datum", *EXTREME_ATTRIBUTES])
+    extreme_days = dict(extreme_days or {})
+    for attribute, find_min in EXTREME_ATTRIBUTES.items():
+        values = data[attribute].dropna()
+        if values.empty:
+            continue
+        position = values.idxmin() if find_min else values.idxmax()
+        value = values[position]
+        if attribute in extreme_days:
+            previous = extreme_days[attribute][0]
+            if not (value < previous if find_min else value > previous):
+                continue
+        extreme_days[attribute] = (value, data.at[position, "Datum"])
+    return extreme_days
+
+
+@stage()
+def calculate_historical_extremes(data, extreme_days=None):
+    # 'Datum' je už datetime, zdieľaná tabuľka sa nemení
+    # Už nájdené extrémy (napr. udržiavané pri pridávaní dní) sa iba naformátujú
+    if extreme_days is None:
+        extreme_days = find_extreme_days(data)
+
+    def extreme(attribute):
+        value, date = extreme_days[attribute]
+        return {"Hodnota": value, "Datum": date.strftime("%d.%m.%Y")}
 
     # Historické maximá a minimá teploty
-    max_temp = data.loc[data["Tmax"].idxmax()]
-    min_temp = data.loc[data["Tmin"].idxmin()]
-
-    temp_extremes = {
-        "Tmax": {"Hodnota": max_temp["Tmax"], "Datum": max_temp["Datum"].strftime("%d.%m.%Y")},
-        "Tmin": {"Hodnota": min_temp["Tmin"], "Datum": min_temp["Datum"].strftime("%d.%m.%Y")},
-    }
+    temp_extremes = {"Tmax": extreme("Tmax"), "Tmin": extreme("Tmin")}
 
     # Historické maximá zrážok a snehovej pokrývky
-    max_rain = data.loc[data["R"].idxmax()]
-    max_snow = data.loc[data["CSP"].idxmax()]
-
-    precip_extremes = {
-        "R": {"Hodnota": max_rain["R"], "Datum": max_rain["Datum"].strftime("%d.%m.%Y")},
-        "CSP": {"Hodnota": max_snow["CSP"], "Datum": max_snow["Datum"].strftime("%d.%m.%Y")},
-    }
+    precip_extremes = {"R": extreme("R"), "CSP": extreme("CSP")}
 
-    return temp_extremes, precip_extremes
\ No newline at end of file
+    return temp_extremes, precip_extremes
@@ -0,0 +1,113 @@
+"""
+Tento súbor obsahuje pamäťovú cache výsledkov analýz s obmedzenou veľkosťou.
+
+Výsledky sa ukladajú pod kľúčom, ktorý obsahuje všetko, od čoho výsledok závisí
+(napr. stanica, obdobie, atribút, podmienka a verzia údajov). Pri prekročení limitu
+pamäte sa vyhadzujú najdlhšie nepoužité výsledky (LRU).
+
+Triedy:
+- ResultsCache: LRU cache výsledkov s limitom pamäte a počítadlami zásahov.
+
+Funkcie:
+- estimate_size: Odhadne pamäť, ktorú zaberá výsledok (tabuľky, slovníky, n-tice).
+"""
+
+import sys
+from collections import OrderedDict
+import pandas as pd
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def estimate_size(value):
+    """
+    Odhadne počet bajtov, ktoré zaberá výsledok.
+
+    Args:
+    value: Tabuľka, séria, slovník, zoznam, n-tica alebo iná hodnota.
+
+    Returns:
+    int: Odhad veľkosti v bajtoch.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultsCache:
+    """
+    LRU cache výsledkov. Výsledok väčší ako celý limit sa neukladá.
+    Počítadlá hits, misses a evictions slúžia na sledovanie účinnosti cache.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        size = estimate_size(value)
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+        if size > self.max_bytes:
+            return value
+
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        """
+        Vráti výsledok z cache, alebo ho vypočíta a uloží.
+
+        Args:
+        key (tuple): Kľúč so všetkými parametrami, od ktorých výsledok závisí.
+        compute (callable): Funkcia bez argumentov, ktorá výsledok vypočíta.
+
+        Returns:
+        Výsledok pre daný kľúč.
+        """
+        if key in self._entries:
+            return self.get(key)
+        self.misses += 1
+        return self.put(key, compute())
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.size,
+        }
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
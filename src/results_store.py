@@ -0,0 +1,277 @@
+"""
+Tento súbor obsahuje diskové úložisko výsledkov analýz staníc.
+
+Každý výsledok (napr. monthly_stats, údaje a extrémy snehovej pokrývky pre obdobie
+a podmienku, mesačné štatistiky CSP a tabuľky početnosti, historické extrémy a ročná
+sumarizácia) sa uloží do samostatného súboru v adresári cache vedľa vstupného súboru
+(rovnakom ako parse_cache). Záznam platí iba pre rovnaký odtlačok vstupného súboru,
+stanicu, parametre a verziu kódu analýz. Verzia kódu je hash zdrojových súborov
+modulov analýz a verzie pandas, takže po zmene kódu sa výsledky vypočítajú znova bez
+ručného zvyšovania čísla verzie. Zastaraný alebo poškodený záznam sa odstráni.
+
+Záznam je súbor .npz bez objektov Pythonu (načítava sa s allow_pickle=False, rovnako ako
+parse_cache): číselné a dátumové stĺpce tabuliek sú polia NumPy, ostatné hodnoty (textové
+stĺpce, slovníky extrémov, odtlačok vstupu a verzia kódu) sú v manifeste JSON. Načítanie
+záznamu preto nikdy nespustí kód uložený v adresári cache.
+
+Triedy:
+- ResultsStore: Úložisko výsledkov pre jeden vstupný súbor.
+
+Funkcie:
+- code_version: Vypočíta verziu kódu analýz.
+
+Použitie:
+    store = ResultsStore(file_name)
+    monthly_stats = store.get_or_compute(station_id, "monthly_stats", lambda: process_data(station_id, data))
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+from parse_cache import cache_directory, file_fingerprint
+
+# Moduly, od ktorých závisia uložené výsledky (main_window určuje, čo sa uloží pod ktorým
+# názvom, station_index, ktoré riadky sa načítajú pre stanicu)
+ANALYSIS_MODULES = [
+    "constants", "data_loader", "daily_dataset", "main_window", "monthly_aggregates", "processing_inputs",
+    "series_index", "snow", "station_index", "temp", "tools",
+]
+STORE_SUFFIX = "results"
+MANIFEST_KEY = "__manifest__"
+
+_code_version = None
+
+
+def code_version():
+    """
+    Vypočíta verziu kódu analýz z obsahu zdrojových súborov ANALYSIS_MODULES a verzie pandas.
+
+    Returns:
+    str: Hash verzie kódu (počíta sa raz za beh programu).
+    """
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.blake2b(pd.__version__.encode("utf-8"), digest_size=16)
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for module in ANALYSIS_MODULES:
+            with open(os.path.join(directory, f"{module}.py"), "rb") as file:
+                digest.update(file.read())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def _encode(value, arrays):
+    # Hodnota ako JSON; každý objekt JSON má jeden kľúč s typom, polia tabuliek sa pridajú do arrays
+    # (np.float64 je aj float, preto sa typy NumPy rozlíšia skôr)
+    if isinstance(value, np.generic) and value.dtype.kind in "biuf":
+        return {"numpy": [value.dtype.name, value.item()]}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, pd.DataFrame):
+        return {"table": _encode_table(value, arrays)}
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(item, arrays) for item in value]}
+    if isinstance(value, list):
+        return {"list": [_encode(item, arrays) for item in value]}
+    if isinstance(value, dict):
+        return {"dict": [[_encode(key, arrays), _encode(item, arrays)] for key, item in value.items()]}
+    if value is pd.NaT:
+        return {"nat": None}
+    if value is pd.NA:
+        return {"na": None}
+    if isinstance(value, pd.Timestamp):
+        return {"timestamp": value.isoformat()}
+    raise TypeError(f"Hodnotu typu {type(value).__name__} nie je možné uložiť.")
+
+
+def _decode(value, archive):
+    if not isinstance(value, dict):
+        return value
+    (kind, content), = value.items()
+    if kind == "table":
+        return _decode_table(content, archive)
+    if kind == "tuple":
+        return tuple(_decode(item, archive) for item in content)
+    if kind == "list":
+        return [_decode(item, archive) for item in content]
+    if kind == "dict":
+        return {_decode(key, archive): _decode(item, archive) for key, item in content}
+    if kind == "nat":
+        return pd.NaT
+    if kind == "na":
+        return pd.NA
+    if kind == "timestamp":
+        return pd.Timestamp(content)
+    if kind == "numpy":
+        return np.dtype(content[0]).type(content[1])
+    raise ValueError(f"Neznámy typ hodnoty {kind}.")
+
+
+def _encode_values(values, arrays):
+    # Číselné, logické a dátumové polia sa uložia priamo, ostatné ako zoznam hodnôt
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufmM":
+        name = f"a{len(arrays)}"
+        arrays[name] = values.to_numpy()
+        return {"array": name}
+    return {"values": [_encode(item, arrays) for item in values.tolist()], "dtype": str(values.dtype)}
+
+
+def _decode_values(encoded, archive):
+    if "array" in encoded:
+        return archive[encoded["array"]]
+    return pd.array([_decode(item, archive) for item in encoded["values"]], dtype=encoded["dtype"])
+
+
+def _encode_table(table, arrays):
+    index = table.index
+    if isinstance(index, pd.MultiIndex):
+        raise TypeError("Tabuľku s MultiIndex nie je možné uložiť.")
+    if isinstance(index, pd.RangeIndex):
+        encoded_index = {"range": [index.start, index.stop, index.step]}
+    else:
+        encoded_index = _encode_values(index, arrays)
+    return {
+        "columns": [_encode(column, arrays) for column in table.columns],
+        "columns_dtype": str(table.columns.dtype),
+        "columns_name": _encode(table.columns.name, arrays),
+        "index": encoded_index,
+        "index_name": _encode(index.name, arrays),
+        "data": [_encode_values(table.iloc[:, position], arrays) for position in range(table.shape[1])],
+    }
+
+
+def _decode_table(encoded, archive):
+    index_name = _decode(encoded["index_name"], archive)
+    if "range" in encoded["index"]:
+        index = pd.RangeIndex(*encoded["index"]["range"], name=index_name)
+    else:
+        index = pd.Index(_decode_values(encoded["index"], archive), name=index_name)
+    table = pd.DataFrame({position: _decode_values(values, archive) for position, values in enumerate(encoded["data"])})
+    table.index = index
+    columns = [_decode(column, archive) for column in encoded["columns"]]
+    table.columns = pd.Index(columns, dtype=encoded["columns_dtype"], name=_decode(encoded["columns_name"], archive))
+    return table
+
+
+class ResultsStore:
+    def __init__(self, file_name, cache_dir=None, fingerprint=None):
+        """
+        Args:
+        file_name (str): Cesta k vstupnému súboru, z ktorého sa výsledky počítajú.
+        cache_dir (str | None): Adresár úložiska, predvolene adresár cache vedľa vstupného súboru.
+        fingerprint (dict | None): Už vypočítaný odtlačok vstupného súboru (file_fingerprint).
+        """
+        self.file_name = file_name
+        self.directory = cache_directory(file_name, cache_dir)
+        self.fingerprint = fingerprint or file_fingerprint(file_name, content_hash=False)
+
+    def _path(self, station_id, name, params):
+        # Názov súboru určuje, čo je uložené; či záznam platí, rozhoduje kľúč uložený v súbore
+        path = os.path.abspath(self.file_name)
+        entry = json.dumps([path, int(station_id), name, params], default=str)
+        entry_key = hashlib.blake2b(entry.encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.directory, f"{os.path.basename(path)}.{STORE_SUFFIX}-{int(station_id)}-{name}.{entry_key}.npz")
+
+    def _content_fingerprint(self):
+        # Hash obsahu sa počíta iba raz, až keď je potrebný
+        if self.fingerprint["hash"] is None:
+            self.fingerprint = file_fingerprint(self.file_name)
+        return self.fingerprint
+
+    def get(self, station_id, name, params=()):
+        """
+        Načíta uložený výsledok, ak zodpovedá aktuálnemu vstupu a kódu.
+
+        Args:
+        station_id (int): ID stanice.
+        name (str): Názov výsledku (napr. "monthly_stats").
+        params (tuple): Parametre výsledku (napr. obdobie a podmienka).
+
+        Returns:
+        Uložený výsledok alebo None, ak chýba alebo je zastaraný.
+        """
+        path = self._path(station_id, name, params)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                stored = json.loads(str(archive[MANIFEST_KEY]))
+                # Rýchla kontrola veľkosti, času zmeny a verzie kódu, hash obsahu sa počíta až pri zhode
+                fresh = (
+                    stored["code_version"] == code_version()
+                    and stored["size"] == self.fingerprint["size"]
+                    and stored["mtime_ns"] == self.fingerprint["mtime_ns"]
+                    and stored["hash"] == self._content_fingerprint()["hash"]
+                )
+                if fresh:
+                    return _decode(stored["value"], archive)
+        except (OSError, EOFError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            pass
+
+        # Zastaraný alebo poškodený záznam sa odstráni
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    def put(self, station_id, name, value, params=()):
+        """
+        Uloží výsledok.
+
+        Args:
+        station_id (int): ID stanice.
+        name (str): Názov výsledku.
+        value: Výsledok (tabuľky, slovníky, n-tice, čísla, texty a dátumy).
+        params (tuple): Parametre výsledku.
+
+        Returns:
+        bool: Či sa výsledok podarilo uložiť (nepodporovaná hodnota sa neuloží).
+        """
+        fingerprint = self._content_fingerprint()
+        arrays = {}
+        try:
+            encoded = _encode(value, arrays)
+        except TypeError:
+            return False
+        arrays[MANIFEST_KEY] = np.array(json.dumps({
+            "code_version": code_version(),
+            "size": fingerprint["size"],
+            "mtime_ns": fingerprint["mtime_ns"],
+            "hash": fingerprint["hash"],
+            "value": encoded,
+        }))
+        path = self._path(station_id, name, params)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Zápis cez dočasný súbor, aby iný proces nenačítal rozpísaný záznam
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temporary_path, path)
+        except OSError:
+            return False
+        return True
+
+    def get_or_compute(self, station_id, name, compute, params=()):
+        """
+        Vráti uložený výsledok, prípadne ho vypočíta a uloží.
+
+        Args:
+        station_id (int): ID stanice.
+        name (str): Názov výsledku.
+        compute (callable): Funkcia bez argumentov, ktorá výsledok vypočíta.
+        params (tuple): Parametre výsledku.
+
+        Returns:
+        Uložený alebo vypočítaný výsledok.
+        """
+        value = self.get(station_id, name, params)
+        if value is None:
+            value = compute()
+            self.put(station_id, name, value, params)
+        return value
@@ -0,0 +1,135 @@
+"""
+Tento súbor obsahuje index sérií atribútu, ktorý nezávisí od zvolenej podmienky.
+
+Index sa pre stanicu a obdobie postaví iba raz: pre každú rozlíšiteľnú hodnotu atribútu
+(napr. každú výšku snehovej pokrývky) sa vopred vypočítajú počty dní, najdlhšie série
+a prvý a posledný deň, v ktorých je atribút aspoň taký. Dotaz "atribút >= k" pre ľubovoľné
+k je potom iba vyhľadanie riadku v predpočítaných poliach.
+
+Triedy:
+- SeriesIndex: Predpočítaný index sérií pre všetky zimné obdobia stanice.
+
+Funkcie:
+- season_months: Vráti mesiace, ktoré sa pre dané obdobie započítavajú do zimy.
+"""
+
+import numpy as np
+import pandas as pd
+from constants import WINTER, WINTER_SEASON
+from daily_dataset import daily_frame
+from tools import run_lengths
+from instrumentation import stage
+
+QUERY_COLUMNS = [
+    "Pocet dni s podmienkou",
+    "Najdlhsia seria (dni)",
+    "Zaciatok serie",
+    "Koniec serie",
+    "Prvy den s podmienkou",
+    "Posledny den s podmienkou",
+]
+
+
+def season_months(season):
+    """
+    Vráti mesiace obdobia, ktoré sa zoskupujú do zimných období.
+
+    Args:
+    season (str): "Zima" (december až február), inak zimné obdobie (október až máj).
+
+    Returns:
+    list[int]: Čísla mesiacov.
+    """
+    return WINTER if season == "Zima" else WINTER_SEASON
+
+
+class SeriesIndex:
+    """
+    Pre každú hodnotu prahu (rozlíšiteľné hodnoty atribútu vzostupne) a každé zimné obdobie
+    uchováva počet dní s podmienkou, dĺžku a hranice najdlhšej série a prvý a posledný deň.
+    Prah k, ktorý nie je hodnotou atribútu, dáva rovnakú odpoveď ako najbližšia vyššia hodnota.
+    """
+
+    @stage("SeriesIndex")
+    def __init__(self, data, attribute="CSP", season="Zimné obdobie"):
+        data = daily_frame(data, ["Datum", "Mesiac", "Sezona", attribute])
+        data = data[data["Mesiac"].isin(season_months(season)) & data["Datum"].notna()]
+        ordered = data.sort_values(["Sezona", "Datum"], kind="stable")
+
+        groups = ordered.groupby("Sezona", sort=True)
+        self.attribute = attribute
+        self.season = season
+        self.seasons = groups.size().index
+        self._dates = ordered["Datum"].to_numpy()
+        codes = groups.ngroup().to_numpy()
+        values = ordered[attribute].to_numpy(dtype="float64")
+        self.thresholds = np.unique(values[~np.isnan(values)])
+
+        # Posledný riadok patrí prahu nad najväčšou hodnotou (podmienka nie je nikdy splnená)
+        shape = (len(self.thresholds) + 1, len(self.seasons))
+        self._count = np.zeros(shape, dtype=np.int64)
+        self._longest = np.zeros(shape, dtype=np.int64)
+        self._start = np.full(shape, -1, dtype=np.int64)
+        self._end = np.full(shape, -1, dtype=np.int64)
+        self._first = np.full(shape, -1, dtype=np.int64)
+        self._last = np.full(shape, -1, dtype=np.int64)
+
+        for row, threshold in enumerate(self.thresholds):
+            # Porovnanie s NaN je vždy False, chýbajúce dni sériu prerušia
+            has_condition = values >= threshold
+            self._longest[row], self._start[row], self._end[row] = run_lengths(codes, has_condition, len(self.seasons))
+
+            # Kódy sú neklesajúce, takže prvý a posledný výskyt kódu je prvý a posledný deň obdobia
+            positions = np.flatnonzero(has_condition)
+            matched_codes = codes[positions]
+            present = np.unique(matched_codes)
+            self._count[row] = np.bincount(matched_codes, minlength=len(self.seasons))
+            self._first[row, present] = positions[np.searchsorted(matched_codes, present, side="left")]
+            self._last[row, present] = positions[np.searchsorted(matched_codes, present, side="right") - 1]
+
+    def _row(self, condition):
+        # Najmenšia hodnota atribútu, ktorá spĺňa podmienku >= condition
+        return int(np.searchsorted(self.thresholds, condition, side="left"))
+
+    def _dates_at(self, positions):
+        return np.where(positions >= 0, self._dates[positions], np.datetime64("NaT"))
+
+    def query(self, condition):
+        """
+        Vráti počet dní, najdlhšiu sériu a prvý a posledný deň s atribútom >= condition.
+
+        Args:
+        condition (float): Najmenšia hodnota atribútu, ktorá podmienku spĺňa.
+
+        Returns:
+        pd.DataFrame: Jeden riadok na zimné obdobie (index Sezona) so stĺpcami QUERY_COLUMNS,
+        dátumy sú NaT, ak podmienka v období nie je splnená.
+        """
+        row = self._row(condition)
+        return pd.DataFrame(
+            dict(zip(QUERY_COLUMNS, [
+                self._count[row],
+                self._longest[row],
+                self._dates_at(self._start[row]),
+                self._dates_at(self._end[row]),
+                self._dates_at(self._first[row]),
+                self._dates_at(self._last[row]),
+            ])),
+            index=self.seasons,
+        )
+
+    def sweep(self, thresholds=None):
+        """
+        Vráti tabuľku výsledkov query pre viacero prahov naraz.
+
+        Args:
+        thresholds (array-like | None): Prahy (predvolene všetky rozlíšiteľné hodnoty atribútu).
+
+        Returns:
+        pd.DataFrame: Výsledky query pod sebou s ďalším stĺpcom Prah.
+        """
+        thresholds = self.thresholds if thresholds is None else thresholds
+        return pd.concat([self.query(threshold).assign(Prah=threshold) for threshold in thresholds])
+
+    def __len__(self):
+        return len(self.thresholds)
@@ -4,15 +4,30 @@ Tento súbor obsahuje funkcie na výpočet a analýzu údajov o snehu.
 Funkcie:
 - calculate_snow_data: Vypočíta základné štatistiky o snehu pre dané obdobie a atribút.
 - calculate_snow_extremes: Nájde extrémne hodnoty snehu pre dané obdobie a atribút.
+- create_snow_coverage_frequency_tables: Vytvorí tabuľky početnosti snehovej pokrývky pre viacero období naraz.
+- create_snow_coverage_frequency_table: Vytvorí tabuľky početnosti snehovej pokrývky pre jedno obdobie.
 """
 
 import pandas as pd
-from tools import convert_from_unix_timestamp, convert_to_unix_timestamp, find_longest_series, find_first_and_last_condition
+import numpy as np
+from tools import find_longest_runs, histogram_by_month
 from constants import SEASONS, WHOLE_YEAR
+from instrumentation import stage
+from daily_dataset import daily_frame, season_labels, season_day, season_day_label
 
-def calculate_snow_data(data, monthly_stats, attribute, condition, season):
-    # Zabezpečenie, že 'Datum' je datetime
-    data["Datum"] = pd.to_datetime(data["Datum"], format='%d.%m.%Y', errors="coerce")
+# Stĺpce calculate_snow_data s dňom sezóny (Int64, dni od 1. októbra)
+SEASON_DAY_COLUMNS = ["Zaciatok serie", "Koniec serie", "Prvy den s podmienkou", "Posledny den s podmienkou"]
+
+# Dolné hranice intervalov tabuliek početnosti (posledný interval je zhora otvorený)
+COUNT_EDGES = [0, 1, 6, 14, 22, 28]
+COUNT_LABELS = ["0 dní", "1-5 dní", "6-13 dní", "14-21 dní", "22-27 dní", "28+ dní"]
+DEPTH_EDGES = [0, 1, 11, 21, 41, 61, 81]
+DEPTH_LABELS = ["0 cm", "1-10 cm", "11-20 cm", "21-40 cm", "41-60 cm", "61-80 cm", "80+ cm"]
+
+@stage()
+def calculate_snow_data(data, monthly_stats, attribute, condition, season, series_index=None):
+    # 'Datum' je už datetime a Mesiac je predpočítaný, zdieľaná tabuľka sa nemení
+    data = daily_frame(data, ["Datum", "Mesiac", "Sezona", attribute])
 
     # Skontrolovať, či nedošlo k chybám pri konverzii
     if data["Datum"].isnull().any():
@@ -20,75 +35,71 @@ def calculate_snow_data(data, monthly_stats, attribute, condition, season):
 
     if season == "Zima":
         # Filtrovanie dát na zimné mesiace (december, január, február)
-        filtered_data = data[(data["Datum"].dt.month >= 12) | (data["Datum"].dt.month <= 2)].copy()
-        filtered_data["Zimne obdobie"] = filtered_data.apply(
-            lambda row: f"{row['Datum'].year}/{row['Datum'].year + 1}"
-            if row["Datum"].month >= 12
-            else f"{row['Datum'].year - 1}/{row['Datum'].year}",
-            axis=1
-        )
+        filtered_data = data[(data["Mesiac"] >= 12) | (data["Mesiac"] <= 2)]
     else:
         # Filtrovanie dát na zimné obdobia (október - máj)
-        filtered_data = data[(data["Datum"].dt.month >= 10) | (data["Datum"].dt.month <= 5)].copy()
-        filtered_data["Zimne obdobie"] = filtered_data.apply(
-            lambda row: f"{row['Datum'].year}/{row['Datum'].year + 1}"
-            if row["Datum"].month >= 10
-            else f"{row['Datum'].year - 1}/{row['Datum'].year}",
-            axis=1
-        )
+        filtered_data = data[(data["Mesiac"] >= 10) | (data["Mesiac"] <= 5)]
+
+    # Zimné obdobie sa zoskupuje podľa celočíselného roku začiatku (stĺpec Sezona),
+    # popis "1951/1952" sa vytvorí až pre výsledné riadky
+    seasons = filtered_data.groupby("Sezona")
 
     # Výpočet základných štatistík o snehu
     snow_data = (
-        filtered_data.groupby("Zimne obdobie")[attribute]
+        seasons[attribute]
         .agg(["count", "max"])
         .rename(columns={"count": "Pocet dni so snehom", "max": "Max snehova pokryvka"})
     )
     # Odstránenie prvého zimného obdobia 1950/1951
-    snow_data = snow_data[snow_data.index != "1950/1951"]
-    snow_data["Max snehova pokryvka"] = snow_data["Max snehova pokryvka"].round().astype(int)
-
-    series_data = (
-        filtered_data.groupby("Zimne obdobie")
-        .apply(lambda g: find_longest_series(g, attribute, condition))
-        .apply(pd.Series)
-        .rename(columns={0: "Najdlhsia seria (dni)", 1: "Zaciatok serie", 2: "Koniec serie"})
-    )
-
-    first_last_condition_data = (
-        filtered_data.groupby("Zimne obdobie")
-        .apply(lambda g: find_first_and_last_condition(g, attribute, condition))
-        .apply(pd.Series)
-        .rename(columns={0: "Prvy den s podmienkou", 1: "Posledny den s podmienkou"})
-    )
-
-    # Výpočet celkového počtu dní, a pomerov
-    def calculate_ratios(row):
-        if pd.isnull(row["Prvy den s podmienkou"]) or pd.isnull(row["Posledny den s podmienkou"]):
-            return pd.Series([None, None, None], index=["Celkovy pocet dni", "Ratio dni s podmienkou", "Ratio najdlhsej serie"])
-        total_days = (row["Posledny den s podmienkou"] - row["Prvy den s podmienkou"]).days + 1
-        ratio_condition_days = (row["Pocet dni so snehom"] / total_days) * 100
-        ratio_longest_series = (row["Najdlhsia seria (dni)"] / total_days) * 100
-        return pd.Series([total_days, ratio_condition_days, ratio_longest_series], index=["Celkovy pocet dni", "Ratio dni s podmienkou", "Ratio najdlhsej serie"])
+    snow_data = snow_data[snow_data.index != 1950]
+    # Sezóna bez snehovej pokrývky (napr. práve začatá sezóna) má maximum 0 cm, ako CSP_max v monthly_stats
+    snow_data["Max snehova pokryvka"] = snow_data["Max snehova pokryvka"].fillna(0).round().astype(int)
+
+    if series_index is not None:
+        # Predpočítaný index odpovie pre ľubovoľnú podmienku bez nového prechodu údajmi
+        condition_data = series_index.query(condition)
+        condition_days = condition_data["Pocet dni s podmienkou"]
+        series_data = condition_data[["Najdlhsia seria (dni)", "Zaciatok serie", "Koniec serie"]]
+        first_last_condition_data = condition_data[["Prvy den s podmienkou", "Posledny den s podmienkou"]]
+    else:
+        # Počet dní, v ktorých je atribút aspoň condition (NaN podmienku nespĺňa)
+        condition_days = (filtered_data[attribute] >= condition).groupby(filtered_data["Sezona"]).sum()
+
+        # Najdlhšie série pre všetky zimné obdobia naraz
+        series_data = find_longest_runs(filtered_data, attribute, condition, "Sezona")
+
+        # Prvý a posledný deň s podmienkou ako minimum a maximum dátumov, kde je podmienka splnená
+        first_last_condition_data = (
+            filtered_data["Datum"]
+            .where(filtered_data[attribute] >= condition)
+            .groupby(filtered_data["Sezona"])
+            .agg(["min", "max"])
+            .rename(columns={"min": "Prvy den s podmienkou", "max": "Posledny den s podmienkou"})
+        )
 
+    # Počet dní so snehom sa počíta pre zvolený prah, aby pomer dní s podmienkou nepresiahol 100 %
+    snow_data["Pocet dni so snehom"] = condition_days.reindex(snow_data.index).fillna(0).astype("int64")
     snow_data_with_dates = snow_data.join(series_data).join(first_last_condition_data)
-    ratio_data = snow_data_with_dates.apply(calculate_ratios, axis=1)
 
-    ratio_data["Celkovy pocet dni"] = ratio_data["Celkovy pocet dni"].round().astype(int)
-    ratio_data["Ratio dni s podmienkou"] = ratio_data["Ratio dni s podmienkou"].round(2)
-    ratio_data["Ratio najdlhsej serie"] = ratio_data["Ratio najdlhsej serie"].round(2)
+    # Výpočet celkového počtu dní a pomerov (obdobie bez splnenej podmienky má prázdne hodnoty)
+    total_days = (snow_data_with_dates["Posledny den s podmienkou"] - snow_data_with_dates["Prvy den s podmienkou"]).dt.days + 1
+    snow_data_with_ratios = snow_data_with_dates.assign(**{
+        "Celkovy pocet dni": total_days.round().astype("Int64"),
+        "Ratio dni s podmienkou": (snow_data_with_dates["Pocet dni so snehom"] / total_days * 100).round(2),
+        "Ratio najdlhsej serie": (snow_data_with_dates["Najdlhsia seria (dni)"] / total_days * 100).round(2),
+    })
 
-    snow_data_with_ratios = snow_data_with_dates.join(ratio_data)
+    # Dátumy ako celé čísla dní sezóny (dni od 1. októbra), formátujú sa až pri zobrazení
+    for column in SEASON_DAY_COLUMNS:
+        snow_data_with_ratios[column] = season_day(snow_data_with_ratios[column])
 
-    # Formátovanie dátumov
-    snow_data_with_ratios["Prvy den s podmienkou"] = snow_data_with_ratios["Prvy den s podmienkou"].dt.strftime("%d.%m.%Y")
-    snow_data_with_ratios["Posledny den s podmienkou"] = snow_data_with_ratios["Posledny den s podmienkou"].dt.strftime("%d.%m.%Y")
-
-    print(snow_data_with_ratios)
+    snow_data_with_ratios.index = pd.Index(season_labels(snow_data_with_ratios.index), name="Zimne obdobie")
 
     return snow_data_with_ratios
 
 
-def calculate_snow_extremes(snow_data, data):
+@stage()
+def calculate_snow_extremes(snow_data, data, max_snow=None):
 
     snow_extremes = {
         "Najneskorší výskyt prvej SSP": {"Hodnota": None, "Obdobie": None},
@@ -108,18 +119,17 @@ def calculate_snow_extremes(snow_data, data):
         "Najnižšia maximálna snehová pokrývka": {"Hodnota": None, "Obdobie": None}
     }
 
-    def find_extreme_date(date_series, find_min=True):
-        timestamps = date_series.apply(convert_to_unix_timestamp)
-        extreme_timestamp = timestamps.min() if find_min else timestamps.max()
-        extreme_date = convert_from_unix_timestamp(extreme_timestamp)
-        extreme_index = timestamps.idxmin() if find_min else timestamps.idxmax()
-        return extreme_date, extreme_index
+    # Dni sezóny sú celé čísla, extrémy a priemer sú priame min/max/mean bez prevodu na reťazce
+    def find_extreme_date(season_days, find_min=True):
+        season_days = season_days.dropna()
+        if season_days.empty:
+            return None, None
+        extreme_index = season_days.idxmin() if find_min else season_days.idxmax()
+        return season_day_label(season_days[extreme_index]), extreme_index
 
-    def calculate_average_date(date_series):
-        timestamps = date_series.apply(convert_to_unix_timestamp)
-        average_timestamp = timestamps.mean()
-        average_date = convert_from_unix_timestamp(average_timestamp)
-        return average_date
+    def calculate_average_date(season_days):
+        average_day = season_days.mean()
+        return None if pd.isna(average_day) else season_day_label(np.floor(average_day))
 
     # Najskorší a najneskorší výskyt prvej SSP
     snow_extremes["Najskorší výskyt prvej SSP"]["Hodnota"], snow_extremes["Najskorší výskyt prvej SSP"]["Obdobie"] = find_extreme_date(snow_data["Prvy den s podmienkou"], find_min=True)
@@ -155,11 +165,14 @@ def calculate_snow_extremes(snow_data, data):
     snow_extremes["Najmenší počet dní so SSP"]["Hodnota"] = snow_data["Pocet dni so snehom"].min()
     snow_extremes["Najmenší počet dní so SSP"]["Obdobie"] = snow_data["Pocet dni so snehom"].idxmin()
 
-    # Najvyššia snehová pokrývka from input data
-    max_snow = data.loc[data["CSP"].idxmax()]
+    # Najvyššia snehová pokrývka from input data (ak ju volajúci už pozná ako (hodnota, dátum), údaje sa neprechádzajú)
+    if max_snow is None:
+        data = daily_frame(data, ["Datum", "CSP"])
+        max_snow_day = data.loc[data["CSP"].idxmax()]
+        max_snow = (max_snow_day["CSP"], max_snow_day["Datum"])
     
-    snow_extremes["Absolútne najvyššia snehová pokrývka"]["Hodnota"] = int(max_snow["CSP"])
-    snow_extremes["Absolútne najvyššia snehová pokrývka"]["Obdobie"] = max_snow["Datum"]
+    snow_extremes["Absolútne najvyššia snehová pokrývka"]["Hodnota"] = int(max_snow[0])
+    snow_extremes["Absolútne najvyššia snehová pokrývka"]["Obdobie"] = max_snow[1]
     snow_extremes["Najnižšia maximálna snehová pokrývka"]["Hodnota"] = snow_data["Max snehova pokryvka"].min()
     snow_extremes["Najnižšia maximálna snehová pokrývka"]["Obdobie"] = snow_data["Max snehova pokryvka"].idxmin()
 
@@ -169,64 +182,62 @@ def calculate_snow_extremes(snow_data, data):
     return snow_extremes
 
 
-def create_snow_coverage_frequency_table(monthly_stats, season):
-    intervals_depth = ["0 cm", "1-10 cm", "11-20 cm", "21-40 cm", "41-60 cm", "61-80 cm", "80+ cm"]
-    intervals_count = ["0 dní", "1-5 dní", "6-13 dní", "14-21 dní", "22-27 dní", "28+ dní"]
-
-    months = SEASONS[season]
-    max_value = monthly_stats["CSP_max"].max()
-
-    frequency_count_table = pd.DataFrame(0, index=intervals_count, columns=months)
-
-    for month in months:
-        month_data = monthly_stats[monthly_stats["Mesiac"] == month]
-        for value in month_data["CSP_count"]:
-            if value == 0:
-                frequency_count_table.at["0 dní", month] += 1
-            elif 1 <= value <= 5:
-                frequency_count_table.at["1-5 dní", month] += 1
-            elif 6 <= value <= 13:
-                frequency_count_table.at["6-13 dní", month] += 1
-            elif 14 <= value <= 21:
-                frequency_count_table.at["14-21 dní", month] += 1
-            elif 22 <= value <= 27:
-                frequency_count_table.at["22-27 dní", month] += 1
-            else:
-                frequency_count_table.at["28+ dní", month] += 1
-
-    month_names = {month: WHOLE_YEAR[month] for month in months}
-
-    frequency_count_table.rename(columns=month_names, inplace=True)
-    frequency_count_table.insert(0, "Interval", intervals_count)
-
-    frequency_max_table = pd.DataFrame(0, index=intervals_depth, columns=months)
-
-    for month in months:
-        month_data = monthly_stats[monthly_stats["Mesiac"] == month]
-        for value in month_data["CSP_max"]:
-            if value == 0:
-                frequency_max_table.at["0 cm", month] += 1
-            elif 1 <= value <= 10:
-                frequency_max_table.at["1-10 cm", month] += 1
-            elif 11 <= value <= 20:
-                frequency_max_table.at["11-20 cm", month] += 1
-            elif 21 <= value <= 40:
-                frequency_max_table.at["21-40 cm", month] += 1
-            elif 41 <= value <= 60:
-                frequency_max_table.at["41-60 cm", month] += 1
-            elif 61 <= value <= 80:
-                frequency_max_table.at["61-80 cm", month] += 1
-            else:
-                frequency_max_table.at["80+ cm", month] += 1
-
-    frequency_max_table.rename(columns=month_names, inplace=True)
-    frequency_max_table.insert(0, "Interval", intervals_depth)
-
-    print("Absolútna častosť maximálnych výšok snehovej pokrývky:")
-    print(frequency_max_table)
-
-    print("Absolútna častosť počtu dní so snehovou pokrývkou:")
-    print(frequency_count_table)
-
-    return frequency_count_table, frequency_max_table
+def _interval_labels(edges, unit):
+    labels = []
+    for lower, upper in zip(edges, [*edges[1:], None]):
+        if upper is None:
+            labels.append(f"{lower}+ {unit}")
+        elif upper - lower == 1:
+            labels.append(f"{lower} {unit}")
+        else:
+            labels.append(f"{lower}-{upper - 1} {unit}")
+    return labels
+
+
+def _frequency_table(counts, months, labels):
+    # Stĺpce matice početností patria mesiacom 1 až 12
+    table = pd.DataFrame(counts[:, [month - 1 for month in months]], index=labels, columns=[WHOLE_YEAR[month] for month in months])
+    table.insert(0, "Interval", labels)
+    return table
+
+
+@stage()
+def create_snow_coverage_frequency_tables(monthly_stats, seasons=("Zimné obdobie",), count_edges=COUNT_EDGES, depth_edges=DEPTH_EDGES, count_labels=None, depth_labels=None):
+    """
+    Vytvorí tabuľky absolútnej početnosti počtu dní so snehovou pokrývkou a maximálnej výšky
+    snehovej pokrývky pre viacero období naraz.
+
+    Početnosti sa pre všetky mesiace spočítajú jedným vektorovým prechodom, tabuľky
+    jednotlivých období sú iba výbery ich mesiacov.
+
+    Args:
+    monthly_stats (pd.DataFrame): Mesačné štatistiky so stĺpcami Mesiac, CSP_count a CSP_max.
+    seasons (list[str]): Názvy období z constants.SEASONS.
+    count_edges (list[int] | np.ndarray): Dolné hranice intervalov počtu dní.
+    depth_edges (list[int] | np.ndarray): Dolné hranice intervalov výšky snehovej pokrývky [cm].
+    count_labels (list[str] | None): Popisy intervalov počtu dní (predvolene podľa hraníc).
+    depth_labels (list[str] | None): Popisy intervalov výšky (predvolene podľa hraníc).
+
+    Returns:
+    dict: Pre každé obdobie dvojica (frequency_count_table, frequency_max_table).
+    """
+    if count_labels is None:
+        count_labels = COUNT_LABELS if list(count_edges) == COUNT_EDGES else _interval_labels(count_edges, "dní")
+    if depth_labels is None:
+        depth_labels = DEPTH_LABELS if list(depth_edges) == DEPTH_EDGES else _interval_labels(depth_edges, "cm")
+
+    months = monthly_stats["Mesiac"].to_numpy()
+    count_counts = histogram_by_month(monthly_stats["CSP_count"].to_numpy(), months, count_edges)
+    depth_counts = histogram_by_month(monthly_stats["CSP_max"].to_numpy(), months, depth_edges)
+
+    return {
+        season: (
+            _frequency_table(count_counts, SEASONS[season], count_labels),
+            _frequency_table(depth_counts, SEASONS[season], depth_labels),
+        )
+        for season in seasons
+    }
 
+
+def create_snow_coverage_frequency_table(monthly_stats, season):
+    return create_snow_coverage_frequency_tables(monthly_stats, [season])[season]
@@ -1,66 +1,24 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QHBoxLayout, QLabel, QComboBox, QSizePolicy
-from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QSizePolicy, QSpinBox
+from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
-from datetime import datetime
 import pandas as pd
-from constants import EVEN_ROW_COLOR, BLUE_COLOR, GREEN_COLOR, RED_COLOR  # Use absolute import
 from table_formatter import TableFormatter  # Import TableFormatter
+from dataframe_model import DataFrameTable, MISSING_TEXT
+from daily_dataset import season_day_label
+
+
+def snow_data_formatters():
+    # Stĺpce 4 až 7 (s indexom ako stĺpcom 0) sú dni sezóny, zobrazia sa ako dd.mm.
+    return {column: lambda day: season_day_label(day) or MISSING_TEXT for column in [4, 5, 6, 7]}
+
+
+def extremes_frame(snow_extremes):
+    return pd.DataFrame({
+        "Názov extrému": list(snow_extremes),
+        "Hodnota": [value["Hodnota"] for value in snow_extremes.values()],
+        "Obdobie": [value["Obdobie"] for value in snow_extremes.values()],
+    })
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    def __lt__(self, other):
-        if isinstance(other, QTableWidgetItem):
-            try:
-                return float(self.text()) < float(other.text())
-            except ValueError:
-                return self.text() < other.text()
-        return super().__lt__(other)
-
-class DateTableWidgetItem(QTableWidgetItem):
-    def __init__(self, text):
-        super().__init__(text)
-        self.original_text = text
-        self.unix_timestamp = self.to_unix_timestamp(text)
-        self.display_date = self.to_display_date(text)
-
-    def to_unix_timestamp(self, text):
-        try:
-            date_format = "%d.%m.%Y"
-            if len(text.split('.')) == 2:  # If the date string is missing the year
-                text += '.1900'  # Add a default year to the date string
-            date = datetime.strptime(text, date_format)
-            if date.month >= 10:
-                date = date.replace(year=1975)
-            elif date.month <= 5:
-                date = date.replace(year=1976)
-            if date.year < 1970:
-                return 0
-            return int(date.timestamp())
-        except ValueError as e:
-            print(f"Error parsing date '{text}': {e}")
-            return 0
-
-    def to_display_date(self, text):
-        try:
-            date_format = "%d.%m.%Y"
-            if len(text.split('.')) == 2:  # If the date string is missing the year
-                text += '.1900'  # Add a default year to the date string
-            date = datetime.strptime(text, date_format)
-            return date.strftime("%d.%m.")
-        except ValueError as e:
-            print(f"Error parsing date '{text}': {e}")
-            return text
-
-    def __lt__(self, other):
-        if isinstance(other, QTableWidgetItem):
-            return self.unix_timestamp < other.unix_timestamp
-        return super().__lt__(other)
-
-    def data(self, role):
-        if role == Qt.DisplayRole:
-            return self.display_date  # Display date in DD.MM. format
-        if role == Qt.UserRole:
-            return self.unix_timestamp
-        return super().data(role)
 
 class SnowDataViewer(QWidget):
     def __init__(self, snow_data, snow_extremes, csp_statistics, csp_count_statistics, parent):
@@ -76,20 +34,34 @@ class SnowDataViewer(QWidget):
         self.extremesComboBox.addItems(["Zimné obdobie", "Zima"])
         self.extremesComboBox.currentIndexChanged.connect(self.update_season)
 
-        # Vytvorenie tabuľky pre snow_data
-        self.tableWidget = QTableWidget()
-        self.tableWidget.setRowCount(len(snow_data))  # Počet riadkov = počet záznamov
-        self.tableWidget.setColumnCount(len(snow_data.columns) + 1)  # +1 pre "Zimne obdobie"
-        self.tableWidget.setHorizontalHeaderLabels([
+        # Prah snehovej pokrývky pre série a prvý/posledný deň (odpovedá predpočítaný index)
+        self.conditionSpinBox = QSpinBox()
+        self.conditionSpinBox.setRange(1, 999)
+        self.conditionSpinBox.setValue(parent.snow_condition)
+        self.conditionSpinBox.setPrefix("SSP ≥ ")
+        self.conditionSpinBox.setSuffix(" cm")
+        self.conditionSpinBox.valueChanged.connect(self.update_condition)
+
+        # Vytvorenie tabuľky pre snow_data (index tabuľky je prvý stĺpec "Zimné obdobie")
+        self.snow_data_headers = [
             "Zimné\nobdobie","Počet dní\nso SSP", "Max. snehová\npokrývka [cm]",
             "Najdlhšia séria\nso SSP", "Začiatok\nsérie", "Koniec\nsérie",
             "Prvý deň\nso SSP", "Posledný deň\nso SSP",
             "Počet dní\nvybraného obdobia", "Pomer dní\nso SSP [%]", "Pomer najdlhšej\nsérie [%]"
-        ])
+        ]
+        self.tableWidget = DataFrameTable(formatters=snow_data_formatters())
+        TableFormatter(self.tableWidget).format_items()
+
+        self.extremesTableWidget = DataFrameTable()
+        table_formatter = TableFormatter(self.extremesTableWidget)
+        table_formatter.format_items()
+        table_formatter.format_extreme_column(1)
+        table_formatter.format_column(2, font=table_formatter.extreme_font, alignment=Qt.AlignCenter | Qt.AlignVCenter)
 
-        self.extremesTableWidget = QTableWidget()
-        self.cspStatisticsTableWidget = QTableWidget()
-        self.cspCountStatisticsTableWidget = QTableWidget()
+        self.cspStatisticsTableWidget = DataFrameTable()
+        TableFormatter(self.cspStatisticsTableWidget).format_items(is_striped=True)
+        self.cspCountStatisticsTableWidget = DataFrameTable()
+        TableFormatter(self.cspCountStatisticsTableWidget).format_items(is_striped=True)
 
         self.update_data(snow_data, snow_extremes, csp_statistics, csp_count_statistics)
 
@@ -140,8 +112,11 @@ class SnowDataViewer(QWidget):
         self.rightLayout = QVBoxLayout()
         self.rightWidget.setLayout(self.rightLayout)
 
-        # Pridanie rozklikávacieho zoznamu nad tabuľku snow_extremes
-        self.rightLayout.addWidget(self.extremesComboBox)
+        # Pridanie rozklikávacieho zoznamu a prahu nad tabuľku snow_extremes
+        self.selectionLayout = QHBoxLayout()
+        self.selectionLayout.addWidget(self.extremesComboBox)
+        self.selectionLayout.addWidget(self.conditionSpinBox)
+        self.rightLayout.addLayout(self.selectionLayout)
 
         self.rightLayout.addWidget(self.extremesTableWidget)
 
@@ -182,70 +157,32 @@ class SnowDataViewer(QWidget):
         self.rightWidget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
     def update_data(self, snow_data, snow_extremes, csp_statistics, csp_count_statistics):
-        self.tableWidget.setRowCount(len(snow_data) + 1)
-        table_formatter = TableFormatter(self.tableWidget)
-
-        for i, (index, row) in enumerate(snow_data.iterrows(), start=1):
-            item = QTableWidgetItem(str(index))
-            table_formatter.format_item(item, is_first_column=True)
-            self.tableWidget.setItem(i, 0, item)
-
-            for j, value in enumerate(row, start=1):
-                if j in [4, 5, 6, 7]:
-                    item = DateTableWidgetItem(str(value))
-                else:
-                    item = NumericTableWidgetItem(str(value))
-                table_formatter.format_item(item)
-                self.tableWidget.setItem(i, j, item)
-
-        self.extremesTableWidget.setRowCount(len(snow_extremes))
-        self.extremesTableWidget.setColumnCount(3)
-        self.extremesTableWidget.setHorizontalHeaderLabels(["Názov extrému", "Hodnota", "Obdobie"])
-        table_formatter = TableFormatter(self.extremesTableWidget)
+        # Tabuľky iba vymenia údaje modelu, štýly buniek sa nastavili v konštruktore
+        self.tableWidget.set_frame(snow_data, self.snow_data_headers, index_column=self.snow_data_headers[0])
+        self.tableWidget.fit_columns()
 
-        for i, (key, value) in enumerate(snow_extremes.items()):
-            item = QTableWidgetItem(key)
-            table_formatter.format_item(item, is_first_column=True)
-            self.extremesTableWidget.setItem(i, 0, item)
-
-            extremValue = QTableWidgetItem(str(value["Hodnota"]))
-            table_formatter.format_extreme_item(extremValue, i)
-            self.extremesTableWidget.setItem(i, 1, extremValue)
-
-            if value["Obdobie"] is not None:
-                extremSession = QTableWidgetItem(value["Obdobie"].strftime("%d.%m.%Y") if isinstance(value["Obdobie"], pd.Timestamp) else str(value["Obdobie"]))
-            else:
-                extremSession = QTableWidgetItem("-")
-            # table_formatter.format_extreme_item(extremSession, i)
-            extremSession.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            extremSession.setFont(QFont("Arial", 8, QFont.Bold))
-            self.extremesTableWidget.setItem(i, 2, extremSession)
-
-        self.extremesTableWidget.resizeColumnsToContents()
-        self.extremesTableWidget.setWordWrap(True)
+        self.extremesTableWidget.set_frame(extremes_frame(snow_extremes))
+        self.extremesTableWidget.fit_columns()
         self.extremesTableWidget.resizeRowsToContents()
 
-        self.cspStatisticsTableWidget.setRowCount(len(csp_statistics))
-        self.cspStatisticsTableWidget.setColumnCount(len(csp_statistics.columns))
-        self.cspStatisticsTableWidget.setHorizontalHeaderLabels(csp_statistics.columns)
-        table_formatter = TableFormatter(self.cspStatisticsTableWidget)
-
-        for i, (index, row) in enumerate(csp_statistics.iterrows()):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                table_formatter.format_item(item, is_first_column=(j == 0), is_even_row=(i % 2 == 0))
-                self.cspStatisticsTableWidget.setItem(i, j, item)
-
-        self.cspCountStatisticsTableWidget.setRowCount(len(csp_count_statistics))
-        self.cspCountStatisticsTableWidget.setColumnCount(len(csp_count_statistics.columns))
-        self.cspCountStatisticsTableWidget.setHorizontalHeaderLabels(csp_count_statistics.columns)
-        table_formatter = TableFormatter(self.cspCountStatisticsTableWidget)
-
-        for i, (index, row) in enumerate(csp_count_statistics.iterrows()):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                table_formatter.format_item(item, is_first_column=(j == 0), is_even_row=(i % 2 == 0))
-                self.cspCountStatisticsTableWidget.setItem(i, j, item)
+        self.cspStatisticsTableWidget.set_frame(csp_statistics)
+        self.cspStatisticsTableWidget.fit_columns()
+        self.cspCountStatisticsTableWidget.set_frame(csp_count_statistics)
+        self.cspCountStatisticsTableWidget.fit_columns()
+
+    def show_season(self, season):
+        # Nastaví zobrazené obdobie bez nového výpočtu (karta vytvorená až po zmene obdobia v inej karte)
+        self.extremesComboBox.blockSignals(True)
+        self.extremesComboBox.setCurrentIndex(1 if season == "Zima" else 0)
+        self.extremesComboBox.blockSignals(False)
+        self.snow_data_headers[0] = "Zima" if season == "Zima" else "Zimné\nobdobie"
+        self.tableWidget.source_model.set_header(0, self.snow_data_headers[0])
+
+    def show_condition(self, condition):
+        # Nastaví zobrazený prah bez nového výpočtu (prah sa zmenil v inej karte)
+        self.conditionSpinBox.blockSignals(True)
+        self.conditionSpinBox.setValue(condition)
+        self.conditionSpinBox.blockSignals(False)
 
     def update_season(self, index):
         # Update the data based on the selection in the extremesComboBox
@@ -257,4 +194,9 @@ class SnowDataViewer(QWidget):
             season_extremes = "Zimné\nobdobie"
         else:
             season_extremes = "Zimné\nobdobie"
-        self.tableWidget.horizontalHeaderItem(0).setText(season_extremes)
\ No newline at end of file
+        self.snow_data_headers[0] = season_extremes
+        self.tableWidget.source_model.set_header(0, season_extremes)
+
+    def update_condition(self, value):
+        # Zmena prahu iba prečíta iný riadok indexu sérií, údaje sa znova neprechádzajú
+        self.parent.update_snow_data_viewer(self.extremesComboBox.currentText(), self.parent.data, value)
\ No newline at end of file
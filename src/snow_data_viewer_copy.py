@@ -1,67 +1,10 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QHBoxLayout, QLabel, QComboBox, QSizePolicy, QGridLayout
-from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QSizePolicy, QGridLayout, QSpinBox
+from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
-from datetime import datetime
-import pandas as pd
-from constants import EVEN_ROW_COLOR, BLUE_COLOR, GREEN_COLOR, RED_COLOR  # Use absolute import
 from table_formatter import TableFormatter  # Import TableFormatter
+from dataframe_model import DataFrameTable
+from snow_data_viewer import snow_data_formatters, extremes_frame
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    def __lt__(self, other):
-        if isinstance(other, QTableWidgetItem):
-            try:
-                return float(self.text()) < float(other.text())
-            except ValueError:
-                return self.text() < other.text()
-        return super().__lt__(other)
-
-class DateTableWidgetItem(QTableWidgetItem):
-    def __init__(self, text):
-        super().__init__(text)
-        self.original_text = text
-        self.unix_timestamp = self.to_unix_timestamp(text)
-        self.display_date = self.to_display_date(text)
-
-    def to_unix_timestamp(self, text):
-        try:
-            date_format = "%d.%m.%Y"
-            if len(text.split('.')) == 2:  # If the date string is missing the year
-                text += '.1900'  # Add a default year to the date string
-            date = datetime.strptime(text, date_format)
-            if date.month >= 10:
-                date = date.replace(year=1975)
-            elif date.month <= 5:
-                date = date.replace(year=1976)
-            if date.year < 1970:
-                return 0
-            return int(date.timestamp())
-        except ValueError as e:
-            print(f"Error parsing date '{text}': {e}")
-            return 0
-
-    def to_display_date(self, text):
-        try:
-            date_format = "%d.%m.%Y"
-            if len(text.split('.')) == 2:  # If the date string is missing the year
-                text += '.1900'  # Add a default year to the date string
-            date = datetime.strptime(text, date_format)
-            return date.strftime("%d.%m.")
-        except ValueError as e:
-            print(f"Error parsing date '{text}': {e}")
-            return text
-
-    def __lt__(self, other):
-        if isinstance(other, QTableWidgetItem):
-            return self.unix_timestamp < other.unix_timestamp
-        return super().__lt__(other)
-
-    def data(self, role):
-        if role == Qt.DisplayRole:
-            return self.display_date  # Display date in DD.MM. format
-        if role == Qt.UserRole:
-            return self.unix_timestamp
-        return super().data(role)
-    
 
 class SnowDataViewerCopy(QWidget):
     def __init__(self, snow_data, snow_extremes, csp_statistics, csp_count_statistics, frequency_count_coverage, frequency_max_coverage, parent):
@@ -76,33 +19,53 @@ class SnowDataViewerCopy(QWidget):
         self.seasonComboBox.addItems(["Zimné obdobie", "Zima"])
         self.seasonComboBox.currentIndexChanged.connect(self.update_season)
 
+        # Prah snehovej pokrývky je spoločný s prvou kartou
+        self.conditionSpinBox = QSpinBox()
+        self.conditionSpinBox.setRange(1, 999)
+        self.conditionSpinBox.setValue(parent.snow_condition)
+        self.conditionSpinBox.setPrefix("SSP ≥ ")
+        self.conditionSpinBox.setSuffix(" cm")
+        self.conditionSpinBox.valueChanged.connect(self.update_condition)
+
         self.stationComboBox = QComboBox()
+        self.stationComboBox.addItems([str(station) for station in parent.stations["IND"]])
+        self.stationComboBox.setCurrentText(str(parent.station_id))
         self.atributeComboBox = QComboBox()
 
         # Vytvorenie vertikálneho layoutu
         menu_layout = QVBoxLayout()
         menu_layout.addWidget(self.seasonComboBox)
+        menu_layout.addWidget(self.conditionSpinBox)
         menu_layout.addWidget(self.stationComboBox)
         menu_layout.addWidget(self.atributeComboBox)
 
         menu_widget = QWidget()
         menu_widget.setLayout(menu_layout)
 
-        self.tableWidget = QTableWidget()
-        self.tableWidget.setRowCount(len(snow_data))
-        self.tableWidget.setColumnCount(len(snow_data.columns) + 1)
-        self.tableWidget.setHorizontalHeaderLabels([
+        # Index tabuľky snow_data sa zobrazí ako prvý stĺpec "Zimné obdobie"
+        self.snow_data_headers = [
             "Zimné\nobdobie","Počet dní\nso SSP", "Max. snehová\npokrývka [cm]",
             "Najdlhšia séria\nso SSP", "Začiatok\nsérie", "Koniec\nsérie",
             "Prvý deň\nso SSP", "Posledný deň\nso SSP",
             "Počet dní\nvybraného obdobia", "Pomer dní\nso SSP [%]", "Pomer najdlhšej\nsérie [%]"
-        ])
+        ]
+        self.tableWidget = DataFrameTable(formatters=snow_data_formatters())
+        TableFormatter(self.tableWidget).format_items()
 
-        self.extremesTableWidget = QTableWidget()
-        self.cspStatisticsTableWidget = QTableWidget()
-        self.cspCountStatisticsTableWidget = QTableWidget()
-        self.frequencyCountTableWidget = QTableWidget()
-        self.frequencyMaxTableWidget = QTableWidget()
+        self.extremesTableWidget = DataFrameTable()
+        table_formatter = TableFormatter(self.extremesTableWidget)
+        table_formatter.format_items()
+        table_formatter.format_extreme_column(1)
+        table_formatter.format_column(2, font=table_formatter.extreme_font, alignment=Qt.AlignCenter | Qt.AlignVCenter)
+
+        self.cspStatisticsTableWidget = DataFrameTable()
+        TableFormatter(self.cspStatisticsTableWidget).format_items(is_striped=True)
+        self.cspCountStatisticsTableWidget = DataFrameTable()
+        TableFormatter(self.cspCountStatisticsTableWidget).format_items(is_striped=True)
+        self.frequencyCountTableWidget = DataFrameTable()
+        TableFormatter(self.frequencyCountTableWidget).format_items()
+        self.frequencyMaxTableWidget = DataFrameTable()
+        TableFormatter(self.frequencyMaxTableWidget).format_items()
 
         table_layout = QVBoxLayout()
         table_layout.addWidget(self.frequencyCountTableWidget)
@@ -167,93 +130,37 @@ class SnowDataViewerCopy(QWidget):
         self.frequencyCountTableWidget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
     def update_data(self, snow_data, snow_extremes, csp_statistics, csp_count_statistics, frequency_count_coverage, frequency_max_coverage):
+        self.frequencyCountTableWidget.set_frame(frequency_count_coverage)
+        self.frequencyCountTableWidget.fit_columns()
+        self.frequencyMaxTableWidget.set_frame(frequency_max_coverage)
+        self.frequencyMaxTableWidget.fit_columns()
 
-        self.frequencyCountTableWidget.setRowCount(len(frequency_count_coverage))
-        self.frequencyCountTableWidget.setColumnCount(len(frequency_count_coverage.columns))
-        self.frequencyCountTableWidget.setHorizontalHeaderLabels(frequency_count_coverage.columns)
-        table_formatter = TableFormatter(self.frequencyCountTableWidget)
-
-        for i, (index, row) in enumerate(frequency_count_coverage.iterrows()):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                table_formatter.format_item(item, is_first_column=(j == 0))
-                self.frequencyCountTableWidget.setItem(i, j, item)
-
-        self.frequencyMaxTableWidget.setRowCount(len(frequency_max_coverage))
-        self.frequencyMaxTableWidget.setColumnCount(len(frequency_max_coverage.columns))
-        self.frequencyMaxTableWidget.setHorizontalHeaderLabels(frequency_max_coverage.columns)
-        table_formatter = TableFormatter(self.frequencyMaxTableWidget)
-
-        for i, (index, row) in enumerate(frequency_max_coverage.iterrows()):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                table_formatter.format_item(item, is_first_column=(j == 0))
-                self.frequencyMaxTableWidget.setItem(i, j, item)
-
-        self.tableWidget.setRowCount(len(snow_data) + 1)
-        table_formatter = TableFormatter(self.tableWidget)
-
-        for i, (index, row) in enumerate(snow_data.iterrows(), start=1):
-            item = QTableWidgetItem(str(index))
-            table_formatter.format_item(item, is_first_column=True)
-            self.tableWidget.setItem(i, 0, item)
-
-            for j, value in enumerate(row, start=1):
-                if j in [4, 5, 6, 7]:
-                    item = DateTableWidgetItem(str(value))
-                else:
-                    item = NumericTableWidgetItem(str(value))
-                table_formatter.format_item(item)
-                self.tableWidget.setItem(i, j, item)
-
-        self.extremesTableWidget.setRowCount(len(snow_extremes))
-        self.extremesTableWidget.setColumnCount(3)
-        self.extremesTableWidget.setHorizontalHeaderLabels(["Názov extrému", "Hodnota", "Obdobie"])
-        table_formatter = TableFormatter(self.extremesTableWidget)
+        # Tabuľky iba vymenia údaje modelu, štýly buniek sa nastavili v konštruktore
+        self.tableWidget.set_frame(snow_data, self.snow_data_headers, index_column=self.snow_data_headers[0])
+        self.tableWidget.fit_columns()
 
-        for i, (key, value) in enumerate(snow_extremes.items()):
-            item = QTableWidgetItem(key)
-            table_formatter.format_item(item, is_first_column=True)
-            self.extremesTableWidget.setItem(i, 0, item)
-
-            extremValue = QTableWidgetItem(str(value["Hodnota"]))
-            table_formatter.format_extreme_item(extremValue, i)
-            self.extremesTableWidget.setItem(i, 1, extremValue)
-
-            if value["Obdobie"] is not None:
-                extremSession = QTableWidgetItem(value["Obdobie"].strftime("%d.%m.%Y") if isinstance(value["Obdobie"], pd.Timestamp) else str(value["Obdobie"]))
-            else:
-                extremSession = QTableWidgetItem("-")
-            # table_formatter.format_extreme_item(extremSession, i)
-            extremSession.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            extremSession.setFont(QFont("Arial", 8, QFont.Bold))
-            self.extremesTableWidget.setItem(i, 2, extremSession)
-
-        self.extremesTableWidget.resizeColumnsToContents()
-        self.extremesTableWidget.setWordWrap(True)
+        self.extremesTableWidget.set_frame(extremes_frame(snow_extremes))
+        self.extremesTableWidget.fit_columns()
         self.extremesTableWidget.resizeRowsToContents()
 
-        self.cspStatisticsTableWidget.setRowCount(len(csp_statistics))
-        self.cspStatisticsTableWidget.setColumnCount(len(csp_statistics.columns))
-        self.cspStatisticsTableWidget.setHorizontalHeaderLabels(csp_statistics.columns)
-        table_formatter = TableFormatter(self.cspStatisticsTableWidget)
-
-        for i, (index, row) in enumerate(csp_statistics.iterrows()):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                table_formatter.format_item(item, is_first_column=(j == 0), is_even_row=(i % 2 == 0))
-                self.cspStatisticsTableWidget.setItem(i, j, item)
-
-        self.cspCountStatisticsTableWidget.setRowCount(len(csp_count_statistics))
-        self.cspCountStatisticsTableWidget.setColumnCount(len(csp_count_statistics.columns))
-        self.cspCountStatisticsTableWidget.setHorizontalHeaderLabels(csp_count_statistics.columns)
-        table_formatter = TableFormatter(self.cspCountStatisticsTableWidget)
-
-        for i, (index, row) in enumerate(csp_count_statistics.iterrows()):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                table_formatter.format_item(item, is_first_column=(j == 0), is_even_row=(i % 2 == 0))
-                self.cspCountStatisticsTableWidget.setItem(i, j, item)
+        self.cspStatisticsTableWidget.set_frame(csp_statistics)
+        self.cspStatisticsTableWidget.fit_columns()
+        self.cspCountStatisticsTableWidget.set_frame(csp_count_statistics)
+        self.cspCountStatisticsTableWidget.fit_columns()
+
+    def show_season(self, season):
+        # Nastaví zobrazené obdobie bez nového výpočtu (karta vytvorená až po zmene obdobia v inej karte)
+        self.seasonComboBox.blockSignals(True)
+        self.seasonComboBox.setCurrentIndex(1 if season == "Zima" else 0)
+        self.seasonComboBox.blockSignals(False)
+        self.snow_data_headers[0] = "Zima" if season == "Zima" else "Zimné\nobdobie"
+        self.tableWidget.source_model.set_header(0, self.snow_data_headers[0])
+
+    def show_condition(self, condition):
+        # Nastaví zobrazený prah bez nového výpočtu (prah sa zmenil v inej karte)
+        self.conditionSpinBox.blockSignals(True)
+        self.conditionSpinBox.setValue(condition)
+        self.conditionSpinBox.blockSignals(False)
 
     def update_season(self, index):
         # Update the data based on the selection in the seasonComboBox
@@ -265,4 +172,8 @@ class SnowDataViewerCopy(QWidget):
             season_extremes = "Zimné\nobdobie"
         else:
             season_extremes = "Zimné\nobdobie"
-        self.tableWidget.horizontalHeaderItem(0).setText(season_extremes)
+        self.snow_data_headers[0] = season_extremes
+        self.tableWidget.source_model.set_header(0, season_extremes)
+
+    def update_condition(self, value):
+        self.parent.update_snow_data_viewer(self.seasonComboBox.currentText(), self.parent.data, value)
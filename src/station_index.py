@@ -0,0 +1,168 @@
+"""
+Tento súbor obsahuje index staníc pre vstupné súbory s viacerými stanicami.
+
+Index sa vytvorí raz pre každý súbor (a uloží sa do cache vedľa súboru). Pre každý
+súvislý úsek riadkov jednej stanice obsahuje rozsah bajtov, rozsah riadkov a prvý
+a posledný dátum, takže údaje jednej stanice je možné načítať bez čítania ostatných.
+
+Funkcie:
+- build_station_index: Prejde súbor a vytvorí tabuľku úsekov jednotlivých staníc.
+- station_index: Vráti index súboru z cache, prípadne ho vytvorí.
+- list_stations: Vráti zoznam staníc s počtom riadkov a rozsahom dátumov.
+- read_station: Načíta iba riadky zvolenej stanice.
+"""
+
+import io
+import numpy as np
+import pandas as pd
+from data_loader import read_observations, DATE_FORMAT
+from parse_cache import file_fingerprint, read_cached, write_cache
+
+BLOCK_SIZE = 1 << 24
+INDEX_SUFFIX = "stations.npz"
+
+
+def _line_offsets(file_name):
+    # Začiatky a konce (vrátane znaku nového riadku) všetkých riadkov súboru
+    starts = [np.zeros(1, dtype=np.int64)]
+    position = 0
+    with open(file_name, "rb") as file:
+        while True:
+            block = file.read(BLOCK_SIZE)
+            if not block:
+                break
+            newlines = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord("\n"))
+            starts.append(newlines.astype(np.int64) + position + 1)
+            position += len(block)
+    starts = np.concatenate(starts)
+    ends = np.append(starts[1:], position)
+    # Prázdne riadky (aj "\r\n") parser preskakuje, preto sa vynechajú aj tu
+    nonblank = (ends - starts) > 2
+    return starts[nonblank], ends[nonblank]
+
+
+def _read_header(file_name):
+    with open(file_name, "rb") as file:
+        return file.readline().decode("utf-8-sig").rstrip("\r\n").split("\t")
+
+
+def _read_dates(file_name, offsets):
+    dates = []
+    with open(file_name, "rb") as file:
+        for offset in offsets:
+            file.seek(offset)
+            dates.append(file.readline().decode("utf-8").split("\t")[1])
+    return pd.to_datetime(pd.Series(dates, dtype="str"), format=DATE_FORMAT, errors="coerce").to_numpy()
+
+
+def build_station_index(file_name):
+    """
+    Prejde súbor a vytvorí tabuľku súvislých úsekov riadkov jednotlivých staníc.
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+
+    Returns:
+    pd.DataFrame: Jeden riadok na úsek so stĺpcami IND, Zaciatok a Koniec (bajty),
+    Prvy riadok, Pocet riadkov, Prvy datum a Posledny datum.
+    """
+    starts, ends = _line_offsets(file_name)
+    # Prvý neprázdny riadok je hlavička
+    starts, ends = starts[1:], ends[1:]
+
+    stations = pd.read_csv(file_name, sep="\t", usecols=["IND"], dtype={"IND": "int32"}, engine="c")["IND"].to_numpy()
+    if len(stations) != len(starts):
+        raise ValueError(f"Počet riadkov súboru {file_name} nezodpovedá počtu záznamov ({len(starts)} != {len(stations)}).")
+
+    changes = np.flatnonzero(stations[1:] != stations[:-1]) + 1
+    first_rows = np.concatenate(([0], changes)).astype(np.int64)
+    last_rows = np.append(changes, len(stations)).astype(np.int64) - 1
+    if not len(stations):
+        first_rows = last_rows = np.zeros(0, dtype=np.int64)
+
+    return pd.DataFrame({
+        "IND": stations[first_rows],
+        "Zaciatok": starts[first_rows],
+        "Koniec": ends[last_rows],
+        "Prvy riadok": first_rows,
+        "Pocet riadkov": last_rows - first_rows + 1,
+        "Prvy datum": _read_dates(file_name, starts[first_rows]),
+        "Posledny datum": _read_dates(file_name, starts[last_rows]),
+    })
+
+
+def station_index(file_name, fingerprint=None, use_cache=True):
+    """
+    Vráti index staníc súboru. Ak je k dispozícii platná cache, súbor sa neprechádza.
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+    fingerprint (dict | None): Už vypočítaný odtlačok súboru.
+    use_cache (bool): Či sa má index čítať z cache a ukladať do nej.
+
+    Returns:
+    pd.DataFrame: Tabuľka úsekov v tvare z build_station_index.
+    """
+    if use_cache:
+        fingerprint = fingerprint or file_fingerprint(file_name)
+        index = read_cached(file_name, fingerprint=fingerprint, suffix=INDEX_SUFFIX)
+        if index is not None:
+            return index
+
+    index = build_station_index(file_name)
+    if use_cache:
+        write_cache(file_name, index, fingerprint=fingerprint, suffix=INDEX_SUFFIX)
+    return index
+
+
+def list_stations(file_name, index=None):
+    """
+    Vráti zoznam staníc v súbore.
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+    index (pd.DataFrame | None): Už načítaný index staníc.
+
+    Returns:
+    pd.DataFrame: IND, Pocet riadkov, Prvy datum a Posledny datum pre každú stanicu.
+    """
+    if index is None:
+        index = station_index(file_name)
+    return (
+        index.groupby("IND", sort=True)
+        .agg(**{
+            "Pocet riadkov": ("Pocet riadkov", "sum"),
+            "Prvy datum": ("Prvy datum", "min"),
+            "Posledny datum": ("Posledny datum", "max"),
+        })
+        .reset_index()
+    )
+
+
+def read_station(file_name, station_id, index=None):
+    """
+    Načíta iba riadky zvolenej stanice podľa indexu.
+
+    Args:
+    file_name (str): Cesta k vstupnému súboru.
+    station_id (str | int): ID stanice (IND).
+    index (pd.DataFrame | None): Už načítaný index staníc.
+
+    Returns:
+    pd.DataFrame: Typované údaje stanice v rovnakom tvare ako z read_observations
+    (prázdna tabuľka, ak stanica v súbore nie je).
+    """
+    if index is None:
+        index = station_index(file_name)
+    segments = index[index["IND"] == int(station_id)]
+    header = _read_header(file_name)
+
+    # Samotná hlavička dá prázdnu tabuľku so správnymi typmi stĺpcov
+    chunks = [("\t".join(header) + "\n").encode("utf-8")]
+    with open(file_name, "rb") as file:
+        for start, end in zip(segments["Zaciatok"], segments["Koniec"]):
+            file.seek(start)
+            chunk = file.read(end - start)
+            chunks.append(chunk if chunk.endswith(b"\n") else chunk + b"\n")
+
+    return read_observations(io.BytesIO(b"".join(chunks)))
@@ -0,0 +1,117 @@
+"""
+Tento súbor obsahuje generátor syntetických denných pozorovaní pre merania výkonu.
+
+Pozorovania obsahujú aj nedostatky skutočných súborov: kódy 995 a 999 v stĺpci CSP,
+chýbajúce hodnoty meraní a celé chýbajúce úseky dní.
+
+Funkcie:
+- generate_observations: Vygeneruje denné pozorovania pre zadaný počet staníc a rokov.
+- write_observations: Zapíše pozorovania vo formáte vstupného súboru (tabulátor, desatinná čiarka).
+
+Použitie:
+    python synthetic_data.py <file_name> [--stations N] [--years M] [--seed S]
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+
+FIRST_STATION_ID = 11000
+# Kódy v stĺpci CSP, ktoré repair_data nahradí prázdnou hodnotou
+CSP_SENTINELS = [995, 999]
+
+
+def generate_observations(stations=100, years=70, start_year=1951, seed=0, sentinel_rate=0.002, missing_rate=0.001, gap_rate=0.0005):
+    """
+    Vygeneruje denné pozorovania so sezónnym chodom teploty, zrážkami a snehovou pokrývkou.
+
+    Args:
+    stations (int): Počet staníc.
+    years (int): Počet rokov.
+    start_year (int): Prvý rok pozorovaní.
+    seed (int): Semienko generátora náhodných čísel.
+    sentinel_rate (float): Podiel dní, keď je v CSP kód 995 alebo 999 namiesto výšky pokrývky.
+    missing_rate (float): Podiel chýbajúcich hodnôt v každom stĺpci meraní.
+    gap_rate (float): Pravdepodobnosť, že v daný deň začne výpadok stanice (1 až 30 dní bez riadkov).
+
+    Returns:
+    pd.DataFrame: Tabuľka v tvare z load_data (riadky staníc idú za sebou).
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(f"{start_year}-01-01", f"{start_year + years - 1}-12-31", freq="D")
+    days = len(dates)
+    shape = (days, stations)
+
+    # Sezónny chod (-1 v polovici januára, +1 v polovici júla) a posun podľa nadmorskej výšky stanice
+    season = -np.cos(2 * np.pi * (dates.dayofyear.to_numpy() - 15) / 365.25)[:, None]
+    altitude_offset = rng.normal(0, 3, stations)[None, :]
+
+    tavg = 8 + altitude_offset + 10 * season + rng.normal(0, 3, shape)
+    tmax = tavg + 2 + rng.gamma(2, 1.2, shape)
+    tmin = tavg - 2 - rng.gamma(2, 1.2, shape)
+    rain = np.where(rng.random(shape) < 0.35, rng.gamma(0.8, 6, shape), 0.0)
+
+    # Snehová pokrývka narastá pri zrážkach v mraze, sadá si a topí sa pri kladných teplotách
+    snowfall = np.where(tavg < 1, rain * 1.2, 0.0)
+    melt = np.clip(tavg, 0, None) * 3 + 0.5
+    snow = np.zeros(shape)
+    depth = np.zeros(stations)
+    for day in range(days):
+        depth = np.clip(depth * 0.97 + snowfall[day] - melt[day], 0, None)
+        snow[day] = depth
+
+    snow = np.floor(snow)
+    sentinels = rng.random(shape) < sentinel_rate
+    snow[sentinels] = rng.choice(CSP_SENTINELS, size=int(sentinels.sum()))
+
+    station_ids = FIRST_STATION_ID + np.arange(stations, dtype="int32") * 10
+    data = pd.DataFrame({
+        "IND": np.repeat(station_ids, days),
+        "Datum": np.tile(dates.to_numpy(), stations),
+        "Tmax": np.round(tmax.T.ravel(), 1),
+        "Tmin": np.round(tmin.T.ravel(), 1),
+        "Tavg": np.round(tavg.T.ravel(), 1),
+        "R": np.round(rain.T.ravel(), 1),
+        "CSP": snow.T.ravel(),
+    })
+
+    # Chýbajúce hodnoty jednotlivých meraní
+    for column in ["Tmax", "Tmin", "Tavg", "R", "CSP"]:
+        data.loc[rng.random(len(data)) < missing_rate, column] = np.nan
+
+    # Výpadky staníc: úseky dní, pre ktoré v súbore nie sú riadky
+    starts = np.flatnonzero(rng.random(len(data)) < gap_rate)
+    lengths = rng.integers(1, 31, len(starts))
+    gap = np.zeros(len(data) + 31, dtype=np.int64)
+    np.add.at(gap, starts, 1)
+    np.add.at(gap, starts + lengths, -1)
+    return data[np.cumsum(gap[:len(data)]) == 0].reset_index(drop=True)
+
+
+def write_observations(data, file_name):
+    """
+    Zapíše pozorovania vo formáte vstupného súboru (d.m.rrrr, tabulátor, desatinná čiarka).
+
+    Args:
+    data (pd.DataFrame): Pozorovania v tvare z generate_observations.
+    file_name (str): Cesta k výstupnému súboru.
+    """
+    dates = pd.DatetimeIndex(data["Datum"])
+    output = data.assign(
+        Datum=pd.Series(dates.day.astype(str), index=data.index) + "." + dates.month.astype(str) + "." + dates.year.astype(str),
+        CSP=data["CSP"].astype("Int64"),
+    )
+    output.to_csv(file_name, sep="\t", decimal=",", index=False, na_rep="", float_format="%.1f")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Syntetický vstupný súbor s viacerými stanicami.")
+    parser.add_argument("file_name")
+    parser.add_argument("--stations", type=int, default=100)
+    parser.add_argument("--years", type=int, default=70)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = generate_observations(args.stations, args.years, seed=args.seed)
+    write_observations(data, args.file_name)
+    print(f"Zapísaných {len(data)} riadkov ({args.stations} staníc x {args.years} rokov) do {args.file_name}")
@@ -1,52 +1,98 @@
-from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtWidgets import QTableView, QHeaderView, QStyledItemDelegate
+from PyQt5.QtGui import QFont, QBrush, QColor, QPalette
 from PyQt5.QtCore import Qt
 from constants import EVEN_ROW_COLOR, BLUE_COLOR, GREEN_COLOR, RED_COLOR
 
-class TableFormatter:
-    def __init__(self, table_widget):
-        self.table_widget = table_widget
-        self.header_font = QFont("Arial", 10, QFont.Bold)
+class TableStyleDelegate(QStyledItemDelegate):
+    """
+    Vykreslí bunky tabuľky DataFrameTable s pruhovaním, zvýrazneným prvým stĺpcom a farbami
+    extrémov. Písma a štetce sa vytvoria raz pre celú tabuľku, bunky ich iba zdieľajú.
+    Pruhy a farby extrémov sa určujú podľa riadku údajov, takže sa pri triedení presúvajú s ním.
+    """
+
+    def __init__(self, table_view):
+        super().__init__(table_view)
+        self.table_view = table_view
         self.data_font = QFont("Arial", 8)
         self.first_column_font = QFont("Arial", 10, QFont.Bold)
+        self.extreme_font = QFont("Arial", 8, QFont.Bold)
+        self.stripe_brush = QBrush(QColor(*EVEN_ROW_COLOR))
+        self.extreme_brushes = tuple(QBrush(QColor(*color)) for color in (RED_COLOR, GREEN_COLOR, BLUE_COLOR))
+        self.white_brush = QBrush(Qt.white)
+        self.is_first_column_bold = True
+        self.is_striped = False
+        # Štýly jednotlivých stĺpcov: stĺpec -> {"font", "alignment", "background", "foreground"}
+        self.column_styles = {}
+
+    def column_font(self, column):
+        if column in self.column_styles and "font" in self.column_styles[column]:
+            return self.column_styles[column]["font"]
+        return self.first_column_font if self.is_first_column_bold and column == 0 else self.data_font
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        column = index.column()
+        source_index = self.table_view.proxy_model.mapToSource(index)
+        row = self.table_view.source_model.data_row(source_index.row())
+        style = self.column_styles.get(column, {})
+
+        option.font = self.column_font(column)
+        if "alignment" in style:
+            option.displayAlignment = style["alignment"]
+        elif self.is_first_column_bold and column == 0:
+            option.displayAlignment = Qt.AlignLeft | Qt.AlignVCenter
+        else:
+            option.displayAlignment = Qt.AlignCenter | Qt.AlignVCenter
+
+        background = style.get("background")
+        if callable(background):
+            background = background(row)
+        if background is None and self.is_striped and row % 2 == 0:
+            background = self.stripe_brush
+        if background is not None:
+            option.backgroundBrush = background
+        if "foreground" in style:
+            option.palette.setBrush(QPalette.Text, style["foreground"])
+
+    def extreme_brush(self, row):
+        # Červená, zelená a modrá sa striedajú po riadkoch
+        return self.extreme_brushes[row % 3]
+
+
+class TableFormatter:
+    def __init__(self, table_view):
+        self.table_view = table_view
+        self.header_font = QFont("Arial", 10, QFont.Bold)
+        self.delegate = TableStyleDelegate(table_view)
+        self.extreme_font = self.delegate.extreme_font
+        table_view.setItemDelegate(self.delegate)
         self.setup_table()
 
     def setup_table(self):
-        header = self.table_widget.horizontalHeader()
+        header = self.table_view.horizontalHeader()
         header.setDefaultAlignment(Qt.AlignCenter | Qt.AlignVCenter)
         header.setFont(self.header_font)
         header.setFixedHeight(50)
-        for col in range(self.table_widget.columnCount()):
-            item = self.table_widget.horizontalHeaderItem(col)
-            item.setFont(self.header_font)
-            item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            item.setToolTip(item.text())
-            header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
-        self.table_widget.setWordWrap(True)
-        self.table_widget.resizeRowsToContents()
-        self.table_widget.setHorizontalScrollMode(QTableWidget.ScrollPerPixel)
-        self.table_widget.setVerticalScrollMode(QTableWidget.ScrollPerPixel)
-        self.table_widget.setSortingEnabled(True)
-
-    def format_item(self, item, is_first_column=False, is_even_row=False):
-        if is_first_column:
-            item.setFont(self.first_column_font)
-            item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        else:
-            item.setFont(self.data_font)
-            item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        if is_even_row:
-            item.setBackground(EVEN_ROW_COLOR)
-        return item
-
-    def format_extreme_item(self, item, row_index):
-        if row_index % 3 == 0:
-            item.setBackground(RED_COLOR)
-        elif row_index % 3 == 1:
-            item.setBackground(GREEN_COLOR)
-        else:
-            item.setBackground(BLUE_COLOR)
-        item.setForeground(QColor(Qt.white))
-        item.setFont(QFont("Arial", 8, QFont.Bold))
-        item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        return item
+        # Šírky stĺpcov odhaduje DataFrameTable.fit_columns zo vzorky riadkov, nemeria sa každá bunka
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        self.table_view.setWordWrap(True)
+        self.table_view.resizeRowsToContents()
+        self.table_view.setHorizontalScrollMode(QTableView.ScrollPerPixel)
+        self.table_view.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        self.table_view.setSortingEnabled(True)
+
+    def format_items(self, is_first_column_bold=True, is_striped=False):
+        self.delegate.is_first_column_bold = is_first_column_bold
+        self.delegate.is_striped = is_striped
+        self.table_view.viewport().update()
+
+    def format_column(self, column, font=None, alignment=None, background=None, foreground=None):
+        # Štýl jedného stĺpca prekryje štýl z format_items, background môže byť aj funkcia riadku
+        style = self.delegate.column_styles.setdefault(column, {})
+        for key, value in (("font", font), ("alignment", alignment), ("background", background), ("foreground", foreground)):
+            if value is not None:
+                style[key] = value
+        self.table_view.viewport().update()
+
+    def format_extreme_column(self, column):
+        self.format_column(column, self.delegate.extreme_font, Qt.AlignCenter | Qt.AlignVCenter, self.delegate.extreme_brush, self.delegate.white_brush)
@@ -1,6 +1,6 @@
-import pandas as pd
-from tools import convert_from_unix_timestamp, convert_to_unix_timestamp, find_longest_series, find_first_and_last_condition
+from instrumentation import stage
 
+@stage()
 def create_yearly_temperature_summary(monthly_stats):
     # Vytvorenie sumarizácie pre každý rok
     yearly_summary = (
@@ -39,6 +39,4 @@ def create_yearly_temperature_summary(monthly_stats):
     yearly_summary["Tmax_count0"] = yearly_summary["Tmax_count0"].astype(int)
     yearly_summary["Tmax_count_10"] = yearly_summary["Tmax_count_10"].astype(int)
 
-    print(yearly_summary)
-
     return yearly_summary
\ No newline at end of file
@@ -2,54 +2,108 @@
 Tento súbor obsahuje pomocné funkcie, ktoré sú písané štýlom, že je ich možné použiť na akýkoľvek atribút a podmienku.
 
 Funkcie:
-- find_longest_series: Nájde najdlhšiu sériu atribútu, ktorý spĺňa podmienku.
-- find_first_and_last_condition: Nájde prvý a posledný deň zo série atribútu s podmienkou.
+- run_lengths: Nájde najdlhšiu sériu splnenej podmienky v každej skupine zoradeného poľa (jadro find_longest_runs).
+- find_longest_runs: Nájde najdlhšiu sériu atribútu, ktorý spĺňa podmienku, pre všetky skupiny naraz.
+- histogram_by_month: Spočíta, koľko hodnôt padne do každého intervalu v každom mesiaci.
 - find_min_years: Nájde rok, v ktorom bol zaznamenaný najnižší maximálny atribút pre každý mesiac.
 - find_max_years: Nájde rok, v ktorom bol zaznamenaný najvyšší maximálny atribút pre každý mesiac.
 - find_avg_years: Nájde priemer maximálnych hodnôt atribútu a roky výskytov pre jednotlivé mesiace.
 - combine_statistics: Spojí výsledky funkcií find_min_years, find_max_years a find_avg_years do jednej tabuľky.
 """
 
-from datetime import datetime
-
-def convert_to_unix_timestamp(date_str):
-    try:
-        date_format = "%d.%m.%Y"
-        date = datetime.strptime(date_str, date_format)
-        if date.month >= 10:
-            date = date.replace(year=1975)
-        elif date.month <= 5:
-            date = date.replace(year=1976)
-        return int(date.timestamp())
-    except ValueError as e:
-        print(f"Error parsing date '{date_str}': {e}")
-        return 0
-
-def convert_from_unix_timestamp(timestamp):
-    date = datetime.fromtimestamp(timestamp)
-    return date.strftime("%d.%m.")
-
-# Výpočet najdlhšej série atributu, ktorý spĺňa podmienku
-def find_longest_series(group, attribute, condition):
-    group = group.sort_values("Datum")
-    group["HasCondition"] = group[attribute] >= condition
-    group["ConditionGroup"] = (group["HasCondition"] != group["HasCondition"].shift()).cumsum()
-    condition_series = group[group["HasCondition"]].groupby("ConditionGroup")["Datum"]
-    if not condition_series.size:  # Ak nie je séria, vrátime None hodnoty
-        return 0, None, None
-    longest_series = condition_series.apply(len).idxmax()  # Index najdlhšej série
-    start_date = condition_series.get_group(longest_series).min().strftime("%d.%m.%Y")
-    end_date = condition_series.get_group(longest_series).max().strftime("%d.%m.%Y")
-    return len(condition_series.get_group(longest_series)), start_date, end_date
-
- # Výpočet prvého a posledného dňa zo ser atributu s podmienkou
-def find_first_and_last_condition(group, attribute, condition):
-    group_with_condition = group[group[attribute] >= condition]
-    if group_with_condition.empty:  # Ak nie je podmienka splnená, vrátime None hodnoty
-        return None, None
-    first_date = group_with_condition["Datum"].min()
-    last_date = group_with_condition["Datum"].max()
-    return first_date, last_date
+import numpy as np
+import pandas as pd
+from instrumentation import stage
+
+def run_lengths(codes, has_condition, group_count):
+    """
+    Nájde najdlhšiu sériu po sebe idúcich prvkov so splnenou podmienkou v každej skupine.
+
+    Args:
+    codes (np.ndarray): Neklesajúce kódy skupín 0..group_count-1 (údaje zoradené podľa skupiny a dátumu).
+    has_condition (np.ndarray): Či prvok spĺňa podmienku.
+    group_count (int): Počet skupín.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray, np.ndarray]: Dĺžka najdlhšej série, index jej prvého
+    a posledného prvku pre každú skupinu (dĺžka 0 a index -1, ak séria nie je).
+    """
+    # Začiatky a konce sérií: zmena podmienky alebo hranica skupiny
+    same_group_as_previous = np.r_[False, codes[1:] == codes[:-1]]
+    same_group_as_next = np.r_[codes[1:] == codes[:-1], False]
+    previous = np.r_[False, has_condition[:-1]] & same_group_as_previous
+    following = np.r_[has_condition[1:], False] & same_group_as_next
+    starts = np.flatnonzero(has_condition & ~previous)
+    ends = np.flatnonzero(has_condition & ~following)
+    lengths = ends - starts + 1
+    run_codes = codes[starts]
+
+    # Najdlhšia séria v skupine, pri rovnakej dĺžke tá skoršia
+    order = np.lexsort((starts, -lengths, run_codes))
+    best = order[np.r_[True, run_codes[order][1:] != run_codes[order][:-1]]] if len(order) else order
+
+    longest = np.zeros(group_count, dtype=np.int64)
+    first = np.full(group_count, -1, dtype=np.int64)
+    last = np.full(group_count, -1, dtype=np.int64)
+    longest[run_codes[best]] = lengths[best]
+    first[run_codes[best]] = starts[best]
+    last[run_codes[best]] = ends[best]
+    return longest, first, last
+
+
+def find_longest_runs(data, attribute, condition, by):
+    """
+    Nájde najdlhšiu sériu po sebe idúcich dní, v ktorých atribút spĺňa podmienku, pre všetky skupiny naraz.
+
+    Údaje sa zoradia iba raz a všetky série sa nájdu jedným prechodom v NumPy
+    (run-length encoding), bez volania funkcie pre každú skupinu.
+
+    Args:
+    data (pd.DataFrame): Denné údaje so stĺpcom Datum, atribútom a kľúčmi skupín.
+    attribute (str): Názov atribútu.
+    condition (float): Najmenšia hodnota atribútu, ktorá podmienku spĺňa.
+    by (str | list[str]): Stĺpec alebo stĺpce, podľa ktorých sa tvoria skupiny (napr. Sezona, IND).
+
+    Returns:
+    pd.DataFrame: Pre každú skupinu dĺžka najdlhšej série (0, ak séria nie je), jej prvý a posledný deň.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    ordered = data.sort_values([*by, "Datum"], kind="stable")
+    groups = ordered.groupby(by, sort=True)
+    keys = groups.size().index
+    longest, first, last = run_lengths(groups.ngroup().to_numpy(), (ordered[attribute] >= condition).to_numpy(), len(keys))
+
+    dates = ordered["Datum"].to_numpy()
+    missing = np.datetime64("NaT")
+    return pd.DataFrame(
+        {
+            "Najdlhsia seria (dni)": longest,
+            "Zaciatok serie": np.where(first >= 0, dates[first], missing),
+            "Koniec serie": np.where(last >= 0, dates[last], missing),
+        },
+        index=keys,
+    )
+
+
+def histogram_by_month(values, months, edges):
+    """
+    Spočíta početnosti hodnôt v intervaloch pre všetky mesiace naraz.
+
+    Args:
+    values (array-like): Hodnoty (napr. CSP_count pre každý mesiac každého roka).
+    months (array-like): Mesiac (1 až 12) ku každej hodnote.
+    edges (list[float]): Vzostupné dolné hranice intervalov, posledný interval je zhora otvorený.
+    Hodnoty menšie ako prvá hranica sa nezapočítajú.
+
+    Returns:
+    np.ndarray: Matica početností s rozmermi (počet intervalov, 12), stĺpec i patrí mesiacu i + 1.
+    """
+    values = np.asarray(values, dtype="float64")
+    months = np.asarray(months, dtype="int64")
+    bins = np.searchsorted(np.asarray(edges, dtype="float64"), values, side="right") - 1
+    counted = (bins >= 0) & ~np.isnan(values)
+    cells = bins[counted] * 12 + months[counted] - 1
+    return np.bincount(cells, minlength=len(edges) * 12).reshape(len(edges), 12)
 
 
 def find_min_years(monthly_stats, attribute):
@@ -66,7 +120,6 @@ def find_min_years(monthly_stats, attribute):
     min_per_month = monthly_stats.loc[monthly_stats.groupby("Mesiac")[attribute].idxmin()].reset_index(drop=True)
     min_per_month = min_per_month.rename(columns={attribute: f"Najnižší {attribute}", "Rok": "Rok minima"})
 
-    print(min_per_month)
     return min_per_month
 
 
@@ -84,7 +137,6 @@ def find_max_years(monthly_stats, attribute):
     max_per_month = monthly_stats.loc[monthly_stats.groupby("Mesiac")[attribute].idxmax()].reset_index(drop=True)
     max_per_month = max_per_month.rename(columns={attribute: f"Najvyšší {attribute}", "Rok": "Rok maxima"})
 
-    print(max_per_month)
     return max_per_month
 
 
@@ -102,10 +154,10 @@ def find_avg_years(monthly_stats, attribute):
     avg_per_month = monthly_stats.groupby("Mesiac")[attribute].mean().reset_index()
     avg_per_month = avg_per_month.rename(columns={attribute: f"Priemerný {attribute}"})
 
-    print(avg_per_month)
     return avg_per_month
 
 
+@stage()
 def combine_statistics(monthly_stats, attribute):
     """
     Spojí výsledky funkcií find_min_years, find_max_years a find_avg_years do jednej tabuľky.
@@ -147,5 +199,4 @@ def combine_statistics(monthly_stats, attribute):
     }
     combined["Mesiac"] = combined["Mesiac"].map(month_names)
 
-    print(combined)
     return combined
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Tento súbor obsahuje spúšťanie analýz na pozadí, aby výpočty neblokovali okno aplikácie.
+
+Výpočty bežia v QThreadPool a výsledky sa do hlavného vlákna vracajú signálmi. Požiadavky
+sú rozdelené do kanálov (napr. "load", "snow"): nová požiadavka v kanáli zruší predchádzajúcu,
+ktorá ešte čaká vo fronte, a výsledok staršej, už bežiacej požiadavky sa zahodí.
+
+Triedy:
+- WorkerSignals: Signály, ktorými worker oznamuje výsledok alebo chybu.
+- Worker: QRunnable, ktorý vo vlákne zavolá zadanú funkciu.
+- AnalysisRunner: Spravuje kanály požiadaviek, rušenie zastaraných požiadaviek a stav výpočtu.
+"""
+
+import itertools
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class Worker(QRunnable):
+    def __init__(self, request_id, function, *args, **kwargs):
+        super().__init__()
+        self.request_id = request_id
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.signals = WorkerSignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except BaseException as error:
+            # Aj sys.exit z funkcií spracovania vstupov sa oznámi ako chyba, vlákno neukončí aplikáciu
+            if not self.cancelled:
+                self.signals.failed.emit(self.request_id, error)
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(self.request_id, result)
+
+
+class AnalysisRunner(QObject):
+    """
+    Spúšťa funkcie na pozadí. V každom kanáli platí iba posledná požiadavka: predchádzajúca
+    sa zruší (ak ešte nezačala, odstráni sa z fronty) a jej výsledok sa nedoručí.
+    Signál busy_changed oznamuje, či práve beží nejaký výpočet.
+    """
+
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None, max_threads=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        if max_threads is not None:
+            self.pool.setMaxThreadCount(max_threads)
+        self._request_ids = itertools.count(1)
+        self._workers = {}
+
+    def submit(self, channel, function, *args, on_finished=None, on_failed=None, **kwargs):
+        """
+        Spustí funkciu na pozadí a zruší predchádzajúcu požiadavku v rovnakom kanáli.
+
+        Args:
+        channel (str): Názov kanála požiadaviek.
+        function (callable): Funkcia, ktorá sa zavolá vo vlákne s args a kwargs.
+        on_finished (callable | None): Zavolá sa v hlavnom vlákne s výsledkom funkcie.
+        on_failed (callable | None): Zavolá sa v hlavnom vlákne s výnimkou z funkcie.
+
+        Returns:
+        int: Číslo požiadavky.
+        """
+        was_busy = self.is_busy()
+        self.cancel(channel, notify=False)
+
+        worker = Worker(next(self._request_ids), function, *args, **kwargs)
+        worker.signals.finished.connect(lambda request_id, result: self._deliver(channel, request_id, on_finished, result))
+        worker.signals.failed.connect(lambda request_id, error: self._deliver(channel, request_id, on_failed, error))
+        self._workers[channel] = worker
+        self.pool.start(worker)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return worker.request_id
+
+    def cancel(self, channel, notify=True):
+        worker = self._workers.pop(channel, None)
+        if worker is None:
+            return
+        worker.cancelled = True
+        # Požiadavka, ktorá ešte čaká vo fronte, sa vôbec nespustí (dobehnutý worker už pool zmazal)
+        if not sip.isdeleted(worker):
+            self.pool.tryTake(worker)
+        if notify and not self.is_busy():
+            self.busy_changed.emit(False)
+
+    def _deliver(self, channel, request_id, callback, value):
+        worker = self._workers.get(channel)
+        if worker is None or worker.request_id != request_id:
+            # Výsledok zastaranej požiadavky sa zahodí
+            return
+        del self._workers[channel]
+        if not self.is_busy():
+            self.busy_changed.emit(False)
+        if callback is not None:
+            callback(value)
+
+    def is_busy(self, channel=None):
+        return bool(self._workers) if channel is None else channel in self._workers
+
+    def wait(self, msecs=-1):
+        return self.pool.waitForDone(msecs)
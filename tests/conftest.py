@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Moduly v src sa importujú priamo podľa názvu, rovnako ako pri spustení programov zo src
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
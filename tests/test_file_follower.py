@@ -0,0 +1,89 @@
+import pytest
+from file_follower import FileFollower
+
+HEADER = "IND\tDatum\tTmax\tTmin\tTavg\tR\tCSP"
+
+
+def row(day, csp, station=11000):
+    return f"{station}\t{day}.1.1990\t1,5\t-3,2\t-0,8\t0\t{csp}"
+
+
+def write(path, text, newline="\n"):
+    with open(path, "ab") as file:
+        file.write(text.replace("\n", newline).encode("utf-8"))
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def newline(request):
+    return request.param
+
+
+@pytest.fixture
+def follower(tmp_path, newline):
+    path = tmp_path / "observations.txt"
+    write(path, f"{HEADER}\n{row(1, 10)}\n{row(2, 11)}\n", newline)
+    follower = FileFollower(str(path), 11000)
+    assert follower.load()["CSP"].tolist() == [10, 11]
+    return follower
+
+
+def test_refresh_reads_only_appended_rows(follower, newline):
+    write(follower.file_name, f"{row(3, 12)}\n{row(4, 13, station=11010)}\n{row(5, 14)}\n", newline)
+    rows, reloaded = follower.refresh()
+    assert not reloaded
+    assert rows["CSP"].tolist() == [12, 14]
+    rows, reloaded = follower.refresh()
+    assert not reloaded and rows.empty
+
+
+def test_partial_last_value_is_read_after_completion(follower, newline):
+    # Riadok má už všetky stĺpce, ale posledná hodnota sa ešte zapisuje
+    write(follower.file_name, row(3, 1), newline)
+    rows, reloaded = follower.refresh()
+    assert not reloaded and rows.empty
+    write(follower.file_name, "5\n", newline)
+    rows, reloaded = follower.refresh()
+    assert not reloaded
+    assert rows["CSP"].tolist() == [15]
+
+
+def test_partial_line_with_missing_columns_is_not_read(follower, newline):
+    write(follower.file_name, "11000\t3.1.1990\t1,5", newline)
+    rows, reloaded = follower.refresh()
+    assert not reloaded and rows.empty
+    rows, reloaded = follower.refresh()
+    assert not reloaded and rows.empty
+    write(follower.file_name, "\t-3,2\t-0,8\t0\t12\n", newline)
+    rows, reloaded = follower.refresh()
+    assert not reloaded
+    assert rows["CSP"].tolist() == [12]
+
+
+def test_unterminated_line_is_read_once_file_stops_growing(follower, newline):
+    write(follower.file_name, row(3, 12), newline)
+    assert follower.refresh()[0].empty
+    rows, reloaded = follower.refresh()
+    assert not reloaded
+    assert rows["CSP"].tolist() == [12]
+    # Ďalšie riadky po načítanom neukončenom riadku začínajú novým riadkom
+    write(follower.file_name, f"\n{row(4, 13)}\n", newline)
+    rows, reloaded = follower.refresh()
+    assert not reloaded
+    assert rows["CSP"].tolist() == [13]
+
+
+def test_shrunk_file_is_reloaded(follower, newline):
+    with open(follower.file_name, "wb") as file:
+        file.write(f"{HEADER}\n{row(1, 20)}\n".replace("\n", newline).encode("utf-8"))
+    rows, reloaded = follower.refresh()
+    assert reloaded
+    assert rows["CSP"].tolist() == [20]
+
+
+def test_rewritten_file_is_reloaded(follower, newline):
+    # Súbor sa zväčšil, ale už načítaná časť sa prepísala
+    with open(follower.file_name, "wb") as file:
+        file.write(f"{HEADER}\n{row(1, 20)}\n{row(2, 21)}\n{row(3, 22)}\n".replace("\n", newline).encode("utf-8"))
+    rows, reloaded = follower.refresh()
+    assert reloaded
+    assert rows["CSP"].tolist() == [20, 21, 22]
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+from daily_dataset import DailyDataset
+from incremental_stats import IncrementalStation
+from processing_inputs import process_data, repair_data, calculate_historical_extremes
+from snow import calculate_snow_data
+from synthetic_data import generate_observations
+from temp import create_yearly_temperature_summary
+
+STATION_ID = 11000
+SELECTIONS = [("Zimné obdobie", 1), ("Zima", 1), ("Zimné obdobie", 10), ("Zima", 10)]
+
+
+@pytest.fixture(scope="module")
+def observations():
+    return generate_observations(stations=1, years=12, seed=7, gap_rate=0)
+
+
+def full_results(observations):
+    data = DailyDataset(repair_data(observations.copy()))
+    monthly_stats = process_data(STATION_ID, data)
+    snow_data = {
+        (season, condition): calculate_snow_data(data, monthly_stats, "CSP", condition, season)
+        for season, condition in SELECTIONS
+    }
+    return monthly_stats, create_yearly_temperature_summary(monthly_stats), snow_data
+
+
+@pytest.mark.parametrize("cut, end, chunk", [
+    # Posledných 400 dní: rez uprostred mesiaca, prírastky cez hranicu sezóny (1. júl) aj roka
+    (-400, None, 30),
+    (-400, None, 45),
+    # Po jednom dni cez hranicu sezóny
+    ("1962-06-20", "1962-07-11", 1),
+    # Rez uprostred zimy (15. 1.), zvyšok zimy sa pridá po týždňoch
+    ("1962-01-15", "1962-07-01", 7),
+])
+def test_append_matches_full_recompute(observations, cut, end, chunk):
+    if end is not None:
+        observations = observations[observations["Datum"] < end]
+    if isinstance(cut, str):
+        cut = int((observations["Datum"] < cut).sum())
+    assert observations["Datum"].iloc[cut].day not in (1, observations["Datum"].iloc[cut].days_in_month)
+
+    station = IncrementalStation(STATION_ID, repair_data(observations.iloc[:cut].copy()))
+    for season, condition in SELECTIONS:
+        station.snow_data(season, condition)
+    appended = observations.iloc[cut:]
+    for start in range(0, len(appended), chunk):
+        station.append(appended.iloc[start:start + chunk])
+
+    monthly_stats, yearly_summary, snow_data = full_results(observations)
+    pd.testing.assert_frame_equal(station.monthly_stats, monthly_stats)
+    pd.testing.assert_frame_equal(station.yearly_summary, yearly_summary)
+    for season, condition in SELECTIONS:
+        pd.testing.assert_frame_equal(station.snow_data(season, condition), snow_data[(season, condition)])
+
+
+def test_append_updates_historical_extremes(observations):
+    observations = observations.copy()
+    cut = len(observations) - 100
+    # V pridaných dňoch sa vyrovná maximum Tmax (ostáva skorší deň) a prekoná maximum CSP
+    observations.loc[cut + 10, "Tmax"] = observations["Tmax"].iloc[:cut].max()
+    observations.loc[cut + 20, "CSP"] = observations["CSP"].max() + 1
+    observations.loc[cut + 30:, "R"] = float("nan")
+
+    station = IncrementalStation(STATION_ID, repair_data(observations.iloc[:cut].copy()))
+    for start in range(cut, len(observations), 25):
+        station.append(observations.iloc[start:start + 25])
+
+    expected = calculate_historical_extremes(DailyDataset(repair_data(observations.copy())))
+    assert station.historical_extremes == expected
+
+
+def test_append_rejects_days_before_last_known_day(observations):
+    station = IncrementalStation(STATION_ID, repair_data(observations.copy()))
+    with pytest.raises(ValueError):
+        station.append(observations.iloc[-1:])
+    assert station.append(observations.iloc[:0]) == {"months": [], "years": [], "seasons": []}
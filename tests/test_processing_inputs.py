@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+from processing_inputs import load_data, process_data, stream_monthly_stats
+from synthetic_data import generate_observations, write_observations
+
+STATION_IDS = [11000, 11010]
+
+
+@pytest.fixture(scope="module")
+def observation_file(tmp_path_factory):
+    file_name = tmp_path_factory.mktemp("data") / "observations.txt"
+    write_observations(generate_observations(stations=2, years=3, seed=5), file_name)
+    return str(file_name)
+
+
+# Časti so 100 a 1000 riadkami delia mesiace aj stanice na hraniciach častí
+@pytest.mark.parametrize("chunksize", [100, 1000])
+def test_streaming_matches_in_memory_path(observation_file, chunksize):
+    data = load_data(observation_file, use_cache=False)
+    streamed = stream_monthly_stats(observation_file, chunksize=chunksize)
+    assert sorted(streamed) == STATION_IDS
+    for station_id in STATION_IDS:
+        expected = process_data(station_id, data)
+        pd.testing.assert_frame_equal(stream_monthly_stats(observation_file, station_id, chunksize), expected)
+        pd.testing.assert_frame_equal(streamed[station_id], expected)
+
+
+def test_streaming_empty_file_reports_missing_data(tmp_path, capsys):
+    file_name = tmp_path / "empty.txt"
+    write_observations(generate_observations(stations=1, years=1).iloc[:0], file_name)
+    with pytest.raises(SystemExit):
+        stream_monthly_stats(str(file_name))
+    assert "neobsahuje žiadne údaje" in capsys.readouterr().out
@@ -0,0 +1,98 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import results_store
+from results_store import ResultsStore
+
+STATION_ID = 11000
+PARAMS = ((10, 11, 12), "CSP", 1)
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "observations.txt"
+    path.write_bytes(b"IND\tDatum\tCSP\n11000\t1.1.1990\t5\n")
+    return str(path)
+
+
+def stored_value():
+    # Tvar výsledkov z okna aplikácie: tabuľky, slovníky extrémov a n-tice
+    table = pd.DataFrame(
+        {
+            "Pocet dni": [3, 0, 7],
+            "Max": pd.array([12, pd.NA, 30], dtype="Int64"),
+            "Priemer": [1.5, np.nan, 2.25],
+            "Zaciatok serie": pd.to_datetime(["1990-01-02", None, "1992-02-03"]),
+            "Mesiac": pd.array(["Január", None, "Marec"], dtype="str"),
+        },
+        index=pd.Index(["1989/90", "1990/91", "1991/92"], dtype="str", name="Zimne obdobie"),
+    )
+    extremes = {
+        "Tmax": {"Hodnota": np.float64(34.8), "Datum": "20.07.2007"},
+        "CSP": {"Hodnota": np.int64(89), "Obdobie": pd.Timestamp("1963-02-06")},
+        "Priemer": {"Hodnota": 18, "Obdobie": None},
+    }
+    return table, extremes, (table.reset_index(), 1.5)
+
+
+def assert_same(value, expected):
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(value, expected)
+    elif isinstance(expected, (tuple, dict)):
+        assert type(value) is type(expected) and len(value) == len(expected)
+        pairs = zip(value.values(), expected.values()) if isinstance(expected, dict) else zip(value, expected)
+        for item, expected_item in pairs:
+            assert_same(item, expected_item)
+    else:
+        assert type(value) is type(expected) and value == expected
+
+
+def test_stored_value_is_restored(input_file):
+    ResultsStore(input_file).put(STATION_ID, "snow", stored_value(), PARAMS)
+    assert_same(ResultsStore(input_file).get(STATION_ID, "snow", PARAMS), stored_value())
+    assert ResultsStore(input_file).get(STATION_ID, "snow", ((1, 2, 3), "CSP", 1)) is None
+
+
+def test_changed_input_file_invalidates_entry(input_file):
+    ResultsStore(input_file).put(STATION_ID, "snow", stored_value(), PARAMS)
+    with open(input_file, "ab") as file:
+        file.write(b"11000\t2.1.1990\t6\n")
+    assert ResultsStore(input_file).get(STATION_ID, "snow", PARAMS) is None
+    assert not os.listdir(ResultsStore(input_file).directory)
+
+
+def test_same_size_and_time_with_other_content_invalidates_entry(input_file):
+    ResultsStore(input_file).put(STATION_ID, "snow", stored_value(), PARAMS)
+    stat = os.stat(input_file)
+    with open(input_file, "r+b") as file:
+        file.seek(-2, os.SEEK_END)
+        file.write(b"9\n")
+    os.utime(input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert ResultsStore(input_file).get(STATION_ID, "snow", PARAMS) is None
+
+
+def test_changed_code_version_invalidates_entry(input_file, monkeypatch):
+    ResultsStore(input_file).put(STATION_ID, "snow", stored_value(), PARAMS)
+    monkeypatch.setattr(results_store, "_code_version", "iná verzia")
+    assert ResultsStore(input_file).get(STATION_ID, "snow", PARAMS) is None
+
+
+def test_entry_with_python_objects_is_not_loaded(input_file):
+    store = ResultsStore(input_file)
+    store.put(STATION_ID, "snow", stored_value(), PARAMS)
+    path = store._path(STATION_ID, "snow", PARAMS)
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = dict(archive)
+    # Pole objektov by sa dalo načítať iba cez pickle
+    arrays["a0"] = np.array([object()], dtype=object)
+    with open(path, "wb") as file:
+        np.savez(file, **arrays)
+    assert ResultsStore(input_file).get(STATION_ID, "snow", PARAMS) is None
+    assert not os.path.exists(path)
+
+
+def test_unsupported_value_is_not_stored(input_file):
+    store = ResultsStore(input_file)
+    assert not store.put(STATION_ID, "snow", {"Hodnota": object()}, PARAMS)
+    assert store.get(STATION_ID, "snow", PARAMS) is None
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from daily_dataset import DailyDataset
+from processing_inputs import process_data, repair_data
+from series_index import SeriesIndex
+from snow import COUNT_EDGES, DEPTH_EDGES, calculate_snow_data, create_snow_coverage_frequency_tables
+from synthetic_data import generate_observations
+
+CONDITIONS = [1, 5, 10, 30, 60]
+
+
+@pytest.fixture(scope="module")
+def station():
+    data = DailyDataset(repair_data(generate_observations(stations=1, years=20, seed=4)))
+    return data, process_data(11000, data)
+
+
+@pytest.mark.parametrize("season", ["Zimné obdobie", "Zima"])
+@pytest.mark.parametrize("condition", CONDITIONS)
+def test_ratios_do_not_exceed_100_percent(station, season, condition):
+    data, monthly_stats = station
+    for series_index in (None, SeriesIndex(data, "CSP", season)):
+        snow_data = calculate_snow_data(data, monthly_stats, "CSP", condition, season, series_index)
+        assert (snow_data["Ratio dni s podmienkou"].dropna() <= 100).all()
+        assert (snow_data["Ratio najdlhsej serie"].dropna() <= 100).all()
+        # Počet dní so snehom sa počíta pre zvolený prah
+        assert (snow_data["Pocet dni so snehom"] <= snow_data["Celkovy pocet dni"].fillna(0)).all()
+
+
+@pytest.mark.parametrize("season", ["Zimné obdobie", "Zima"])
+def test_series_index_matches_direct_computation(station, season):
+    data, monthly_stats = station
+    series_index = SeriesIndex(data, "CSP", season)
+    for condition in CONDITIONS:
+        direct = calculate_snow_data(data, monthly_stats, "CSP", condition, season)
+        indexed = calculate_snow_data(data, monthly_stats, "CSP", condition, season, series_index)
+        assert direct.equals(indexed)
+
+
+@pytest.mark.parametrize("count_edges, depth_edges", [
+    (COUNT_EDGES, DEPTH_EDGES),
+    ([0, 1, 10, 20], [0, 5, 50]),
+    ([0, 1, 6, 14, 22, 29], [0, 1, 11, 21, 41, 61, 91]),
+])
+def test_frequency_tables_accept_numpy_edges(station, count_edges, depth_edges):
+    _, monthly_stats = station
+    expected = create_snow_coverage_frequency_tables(monthly_stats, count_edges=count_edges, depth_edges=depth_edges)
+    result = create_snow_coverage_frequency_tables(monthly_stats, count_edges=np.array(count_edges), depth_edges=np.array(depth_edges))
+    for expected_table, table in zip(expected["Zimné obdobie"], result["Zimné obdobie"]):
+        pd.testing.assert_frame_equal(table, expected_table)